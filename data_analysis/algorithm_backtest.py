@@ -8,9 +8,19 @@ import pandas as pd
 import numpy as np
 from database_connection import get_db
 from prediction_algorithm import RicksPicksPredictionEngine
+from feature_store import AsOfFeatureStore
+from schedule_features import attach_rest_features
+from feature_matrix import load_feature_matrix, feature_data_fingerprint
+from totals_model import load_totals_model
 import warnings
 warnings.filterwarnings('ignore')
 
+# Point-in-time columns the backtest needs beyond the raw game row
+BACKTEST_FEATURES = [
+    'home_elo', 'away_elo', 'home_rank', 'away_rank', 'home_conf', 'away_conf',
+    'home_days_rest', 'away_days_rest'
+]
+
 class AlgorithmBacktester:
     """
     Validate our prediction algorithm against historical game outcomes
@@ -19,11 +29,15 @@ class AlgorithmBacktester:
     def __init__(self):
         self.db = get_db()
         self.prediction_engine = RicksPicksPredictionEngine()
+        self.feature_store = None
+        self.feature_matrix = load_feature_matrix(fingerprint=feature_data_fingerprint(self.db.conn))
         
     def load_historical_games_for_testing(self, seasons=['2022', '2023'], sample_size=500):
         """
         Load historical games with complete data for backtesting
         Use recent seasons to avoid overfitting to older data patterns
+        Team ELO, rank and conference come from the as-of feature store so each
+        game only sees what was known before kickoff
         """
         print(f"📊 Loading historical games for backtesting...")
         
@@ -34,10 +48,9 @@ class AlgorithmBacktester:
             g.spread, g.over_under,
             g.temperature, g.wind_speed, g.humidity, g.precipitation,
             g.weather_condition, g.is_dome,
+            g.home_team_id, g.away_team_id,
             ht.name as home_team, ht.conference as home_conf,
-            ht.rank as home_rank, ht.elo_rating as home_elo,
-            at.name as away_team, at.conference as away_conf,
-            at.rank as away_rank, at.elo_rating as away_elo
+            at.name as away_team, at.conference as away_conf
         FROM games g
         JOIN teams ht ON g.home_team_id = ht.id
         JOIN teams at ON g.away_team_id = at.id
@@ -51,62 +64,54 @@ class AlgorithmBacktester:
         """
         
         df = self.db.execute_query(query, [seasons, sample_size])
+        
+        # Prefer the exported feature matrix; rebuild from SQL when it is
+        # missing or predates some of these games
+        exported = None
+        if self.feature_matrix is not None:
+            exported = self.feature_matrix.attach(df, BACKTEST_FEATURES)
+        if exported is not None:
+            df = exported
+        else:
+            if self.feature_store is None:
+                self.feature_store = AsOfFeatureStore.from_connection(self.db.conn)
+            df = self.feature_store.attach(df)
+            df = attach_rest_features(df, self.db.conn)
         print(f"✅ Loaded {len(df)} completed games from {seasons}")
         return df
         
-    def run_algorithm_on_historical_game(self, game_row):
+    def run_algorithm_on_historical_games(self, df):
         """
-        Run our prediction algorithm on a historical game
-        Returns our predicted spread and confidence
+        Run our prediction algorithm on a frame of historical games in one
+        vectorized pass. Returns one row per game with our predicted spread,
+        confidence and the factor scores behind it.
         """
-        # Extract game data
-        home_team = game_row['home_team']
-        away_team = game_row['away_team']
-        home_conf = game_row['home_conf']
-        away_conf = game_row['away_conf']
-        vegas_spread = game_row['spread']
-        
-        # Weather data
-        temperature = game_row['temperature'] if pd.notna(game_row['temperature']) else None
-        wind_speed = game_row['wind_speed'] if pd.notna(game_row['wind_speed']) else None
-        is_dome = game_row['is_dome'] or False
-        precipitation = game_row['precipitation'] if pd.notna(game_row['precipitation']) else None
-        
-        # Calculate individual factors using our algorithm
-        weather_factor = self.prediction_engine.calculate_weather_factor(
-            temperature, wind_speed, is_dome, precipitation
+        engine = self.prediction_engine
+        weather_score = engine.weather_scores(
+            df['temperature'], df['wind_speed'], df['is_dome'].eq(True), df['precipitation']
         )
-        
-        conference_factor = self.prediction_engine.calculate_conference_factor(
-            home_conf, away_conf
+        conference_score = engine.conference_scores(df['home_conf'], df['away_conf'])
+        rest_score = engine.rest_scores(
+            df['home_days_rest'] if 'home_days_rest' in df else np.full(len(df), np.nan),
+            df['away_days_rest'] if 'away_days_rest' in df else np.full(len(df), np.nan)
         )
         
         # Home field advantage (our analysis shows declining, ~3 points)
         home_field_score = 3.0
+        our_spread = home_field_score + conference_score + weather_score + rest_score
         
-        # Calculate our predicted spread (home team perspective)
-        our_spread = (
-            home_field_score + 
-            conference_factor['score'] + 
-            weather_factor['score']
-        )
+        total_factor_strength = np.abs(conference_score) + np.abs(weather_score)
+        confidence = np.where(total_factor_strength > 4, 'High',
+                              np.where(total_factor_strength > 2, 'Medium', 'Low'))
         
-        # Determine confidence based on factor strength
-        total_factor_strength = abs(conference_factor['score']) + abs(weather_factor['score'])
-        if total_factor_strength > 4:
-            confidence = "High"
-        elif total_factor_strength > 2:
-            confidence = "Medium"  
-        else:
-            confidence = "Low"
-            
-        return {
+        return pd.DataFrame({
             'our_spread': our_spread,
             'confidence': confidence,
-            'weather_score': weather_factor['score'],
-            'conference_score': conference_factor['score'],
+            'weather_score': weather_score,
+            'conference_score': conference_score,
+            'rest_score': rest_score,
             'home_field_score': home_field_score
-        }
+        })
         
     def evaluate_predictions(self, df_with_predictions):
         """
@@ -207,6 +212,41 @@ class AlgorithmBacktester:
             'vs_vegas': ((vegas_avg_error - our_avg_error) / vegas_avg_error * 100)
         }
         
+    def evaluate_totals(self, df_with_predictions, min_edge=3.0):
+        """
+        Totals model accuracy against the actual combined score and the posted
+        total, plus its over/under record on games where it differs from the
+        line by at least min_edge points. The model's per-season fit only
+        uses earlier seasons; games it has no total for are left out.
+        """
+        print("\n📐 Totals Model Analysis:")
+        print("-" * 30)
+        
+        actual_total = df_with_predictions['home_team_score'] + df_with_predictions['away_team_score']
+        model_total = df_with_predictions['model_total']
+        over_under = df_with_predictions['over_under']
+        has_total = over_under.notna() & model_total.notna()
+        
+        model_error = (model_total - actual_total).abs()[has_total].mean()
+        vegas_error = (over_under - actual_total).abs()[has_total].mean()
+        print(f"Model Average Error: {model_error:.2f} points")
+        print(f"Vegas Average Error: {vegas_error:.2f} points")
+        
+        edge = model_total - over_under
+        plays = has_total & (edge.abs() >= min_edge) & (actual_total != over_under)
+        correct = (np.sign(edge[plays]) == np.sign((actual_total - over_under)[plays])).sum()
+        play_count = int(plays.sum())
+        pct = correct / play_count * 100 if play_count else 0.0
+        print(f"O/U Plays (edge >= {min_edge:.0f}): {correct}-{play_count - correct} ({pct:.1f}%)")
+        
+        return {
+            'games': int(has_total.sum()),
+            'model_error': model_error,
+            'vegas_error': vegas_error,
+            'ou_record': f"{correct}-{play_count - correct}",
+            'ou_percentage': pct
+        }
+        
     def run_full_backtest(self):
         """
         Run complete backtesting analysis
@@ -224,22 +264,19 @@ class AlgorithmBacktester:
         
         print(f"\n🔄 Running predictions on {len(df)} historical games...")
         
-        # Run our algorithm on each game
-        predictions = []
-        for idx, game in df.iterrows():
-            pred = self.run_algorithm_on_historical_game(game)
-            predictions.append(pred)
-            
-            if (idx + 1) % 50 == 0:
-                print(f"   Processed {idx + 1}/{len(df)} games...")
-        
-        # Combine results
-        pred_df = pd.DataFrame(predictions)
+        # Score every game in one vectorized pass
+        pred_df = self.run_algorithm_on_historical_games(df)
         df_with_predictions = pd.concat([df.reset_index(drop=True), pred_df], axis=1)
         
         # Evaluate performance
         results = self.evaluate_predictions(df_with_predictions)
         
+        # Totals for the whole history in one batch call
+        totals_model = load_totals_model(self.db.conn)
+        if totals_model is not None:
+            df_with_predictions['model_total'] = totals_model.predict(df_with_predictions)['model_total']
+            results['totals'] = self.evaluate_totals(df_with_predictions)
+        
         print(f"\n📈 SUMMARY RESULTS:")
         print("-" * 25)
         print(f"Games Tested: {results['total_games']}")
@@ -0,0 +1,116 @@
+"""
+Analyzer Pool
+Runs the weather, conference, betting and ELO analyzers concurrently in a
+process pool. The completed games are read once into a snapshot that every
+worker receives at startup; each analyzer takes its own rows and columns from
+it instead of querying the database. Each analyzer's output is captured and
+printed in the usual order, with its run time, and a failing analyzer yields
+None without stopping the others.
+"""
+
+import io
+import time
+import pandas as pd
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+from weather_hypotheses import WeatherHypothesesAnalyzer
+from conference_hypotheses import ConferenceHypothesesAnalyzer
+from betting_hypothesis_testing import BettingHypothesesAnalyzer
+from elo_team_performance_analysis import ELOTeamPerformanceAnalyzer
+
+# Union of the analyzers' queries: each filters its own rows and GAME_COLUMNS.
+# ELO and rank are the per-game pregame values, not today's team row, so
+# historical games are analyzed with what was known at kickoff
+SNAPSHOT_QUERY = """
+SELECT
+    g.id, g.season, g.week,
+    g.home_team_score, g.away_team_score,
+    g.spread, g.over_under, g.start_date,
+    g.temperature, g.wind_speed, g.wind_direction,
+    g.humidity, g.precipitation, g.weather_condition,
+    g.is_dome, g.stadium, g.location, g.venue, g.is_neutral_site,
+    g.home_pregame_elo as home_elo, g.home_team_rank as home_rank,
+    g.away_pregame_elo as away_elo, g.away_team_rank as away_rank,
+    ht.name as home_team, ht.conference as home_conf,
+    at.name as away_team, at.conference as away_conf
+FROM games g
+JOIN teams ht ON g.home_team_id = ht.id
+JOIN teams at ON g.away_team_id = at.id
+WHERE g.completed = true
+AND g.season >= 2015
+AND g.home_team_score IS NOT NULL
+AND g.away_team_score IS NOT NULL
+ORDER BY g.start_date
+"""
+
+# insights key, run_all_analysis heading, error label, analyzer, run method
+ANALYZERS = [
+    ('weather', "1️⃣ WEATHER HYPOTHESES ANALYSIS", 'Weather',
+     WeatherHypothesesAnalyzer, 'run_comprehensive_weather_analysis'),
+    ('conferences', "2️⃣ CONFERENCE PERFORMANCE ANALYSIS", 'Conference',
+     ConferenceHypothesesAnalyzer, 'run_comprehensive_conference_analysis'),
+    ('betting', "3️⃣ BETTING MARKET EFFICIENCY ANALYSIS", 'Betting',
+     BettingHypothesesAnalyzer, 'run_comprehensive_betting_analysis'),
+    ('elo', "4️⃣ ELO & TEAM PERFORMANCE ANALYSIS", 'ELO',
+     ELOTeamPerformanceAnalyzer, 'run_comprehensive_analysis'),
+]
+
+# Set once per worker process by the pool initializer
+_snapshot = None
+
+
+def load_games_snapshot(conn) -> pd.DataFrame:
+    """Completed games since 2015 with every column the four analyzers use"""
+    return pd.read_sql(SNAPSHOT_QUERY, conn)
+
+
+def _share_snapshot(snapshot: pd.DataFrame):
+    global _snapshot
+    _snapshot = snapshot
+
+
+def _run_analyzer(index: int):
+    """Worker: (result, error, seconds, printed output) for ANALYZERS[index]"""
+    _, _, _, analyzer_class, method = ANALYZERS[index]
+    output = io.StringIO()
+    started = time.perf_counter()
+    try:
+        with redirect_stdout(output):
+            result = getattr(analyzer_class(games=_snapshot), method)()
+        error = None
+    except Exception as e:
+        result, error = None, str(e)
+    return result, error, time.perf_counter() - started, output.getvalue()
+
+
+def run_analyzers(snapshot: pd.DataFrame, headings: bool = False, max_workers: int = None) -> Dict:
+    """
+    Run all four analyzers on the snapshot concurrently. Returns
+    {'weather', 'conferences', 'betting', 'elo'} with None for any that failed.
+    """
+    results = {}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers or len(ANALYZERS),
+                             initializer=_share_snapshot, initargs=(snapshot,)) as pool:
+        futures = [pool.submit(_run_analyzer, index) for index in range(len(ANALYZERS))]
+
+        # Report in the usual order so each analyzer's output stays together
+        for future, (key, heading, label, _, _) in zip(futures, ANALYZERS):
+            if headings:
+                print(f"\n{heading}")
+                print("-" * 40)
+            try:
+                result, error, seconds, output = future.result()
+            except Exception as e:
+                # The worker itself died or its result could not be sent back
+                result, error, seconds, output = None, str(e), None, ''
+            print(output, end='')
+            if error is not None:
+                print(f"{label} analysis error: {error}")
+            if seconds is not None:
+                print(f"⏱️ {label} analysis: {seconds:.1f}s")
+            results[key] = result
+
+    print(f"⚡ {len(ANALYZERS)} analyzers finished in {time.perf_counter() - started:.1f}s")
+    return results
@@ -6,6 +6,7 @@ Basic Weather Impact Analysis - Simplified version for initial testing
 import pandas as pd
 import numpy as np
 from database_connection import get_db
+from weather_kernel import bucketize, ANALYSIS_WIND_EDGES
 
 def run_basic_weather_analysis():
     """Run basic weather analysis with our dataset"""
@@ -57,8 +58,9 @@ def run_basic_weather_analysis():
     print(f"   Outdoor games: {len(df[df['is_dome'] == False])}")
     
     # Temperature categories
-    cold_games = df[df['temperature'] < 32]
-    warm_games = df[df['temperature'] >= 70]
+    temperature_codes = bucketize(df['temperature'], [32, 70])  # 0: <32, 2: >=70
+    cold_games = df[temperature_codes == 0]
+    warm_games = df[temperature_codes == 2]
     
     if len(cold_games) > 0 and len(warm_games) > 0:
         cold_avg = cold_games['total_points'].mean()
@@ -72,8 +74,9 @@ def run_basic_weather_analysis():
     # Wind impact
     outdoor_df = df[df['is_dome'] == False]
     if len(outdoor_df) > 0:
-        high_wind = outdoor_df[outdoor_df['wind_speed'] > 15]
-        low_wind = outdoor_df[outdoor_df['wind_speed'] <= 5]
+        wind_codes = bucketize(outdoor_df['wind_speed'], ANALYSIS_WIND_EDGES, right=True)
+        high_wind = outdoor_df[(wind_codes == 2) | (wind_codes == 3)]
+        low_wind = outdoor_df[wind_codes == 0]
         
         if len(high_wind) > 0 and len(low_wind) > 0:
             high_wind_avg = high_wind['total_points'].mean()
@@ -0,0 +1,366 @@
+"""
+Calibrated Win, Cover and Over Probabilities
+Empirical residual distributions fitted on completed games, stored as CDF
+lookup tables on a fine grid (one row per spread or total bucket). Turning a
+predicted margin and line into probabilities is then a vectorized
+interpolation over the whole slate:
+
+    P(home wins)   = 1 - F_margin(0 - predicted_margin)
+    P(home covers) = 1 - F_margin(-spread - predicted_margin)
+    P(over)        = 1 - F_total(over_under - predicted_total)
+
+Margins are home minus away points; spreads follow games.spread (negative
+when the home team is favored). By default the residuals are measured
+against the market (predicted margin = -spread, predicted total =
+over_under), so a model's prediction is read as a shift of the market's
+error distribution.
+
+The same tables drive the uncertainty intervals: simulate_outcomes draws
+thousands of residuals per game by inverse-CDF sampling, games x samples in
+one array operation. Every game shares one stratified set of uniforms
+(common random numbers), so a game's interval does not depend on which other
+games it was scored with.
+
+Usage:
+    python calibration.py [--output PATH]
+"""
+
+import os
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence
+from cfbd_cache import CACHE_DIR
+
+CALIBRATION_PATH = os.path.join(CACHE_DIR, 'calibration_tables.npz')
+TABLES_VERSION = 1
+
+# Buckets on |spread| and on the posted total; the last table row pools every game
+SPREAD_BUCKET_EDGES = [3.0, 7.0, 10.0, 14.0, 21.0]
+TOTAL_BUCKET_EDGES = [45.0, 52.0, 58.0, 65.0]
+
+RESIDUAL_GRID = np.arange(-80.0, 80.0 + 0.25, 0.25)
+MIN_BUCKET_GAMES = 200
+
+DEFAULT_SAMPLES = 10000
+SIMULATION_SEED = 2024
+INTERVAL_LEVELS = (80, 95)
+
+
+class ResidualCDF:
+    """
+    Bucket x grid table of P(residual <= x). Buckets with fewer than
+    min_games residuals use the pooled distribution.
+    """
+
+    def __init__(self, edges: Sequence[float], grid: np.ndarray, cdf: np.ndarray, counts: np.ndarray):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.grid = np.asarray(grid, dtype=np.float64)
+        self.cdf = np.asarray(cdf, dtype=np.float64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.step = float(self.grid[1] - self.grid[0])
+        self._simulated = {}
+
+    def __getstate__(self):
+        # Draws are rebuilt on first use rather than shipped to worker processes
+        return {**self.__dict__, '_simulated': {}}
+
+    @classmethod
+    def fit(cls, residuals, bucket_values, edges: Sequence[float], grid: np.ndarray = RESIDUAL_GRID,
+            min_games: int = MIN_BUCKET_GAMES) -> 'ResidualCDF':
+        residuals = np.asarray(residuals, dtype=np.float64)
+        bucket_values = np.asarray(bucket_values, dtype=np.float64)
+        keep = ~np.isnan(residuals)
+        residuals, bucket_values = residuals[keep], bucket_values[keep]
+
+        pooled = np.sort(residuals)
+        if len(pooled) == 0:
+            raise ValueError("no residuals to fit")
+        buckets = np.digitize(bucket_values, edges)
+        n_buckets = len(edges) + 1
+
+        cdf = np.empty((n_buckets + 1, len(grid)))
+        counts = np.zeros(n_buckets + 1, dtype=np.int64)
+        pooled_cdf = np.searchsorted(pooled, grid, side='right') / len(pooled)
+        for bucket in range(n_buckets):
+            members = np.sort(residuals[(buckets == bucket) & ~np.isnan(bucket_values)])
+            counts[bucket] = len(members)
+            cdf[bucket] = (np.searchsorted(members, grid, side='right') / len(members)
+                           if len(members) >= min_games else pooled_cdf)
+        cdf[n_buckets] = pooled_cdf
+        counts[n_buckets] = len(pooled)
+        return cls(edges, grid, cdf, counts)
+
+    def bucket_codes(self, bucket_values) -> np.ndarray:
+        """Table row per value; missing values use the pooled row"""
+        bucket_values = np.asarray(bucket_values, dtype=np.float64)
+        codes = np.digitize(bucket_values, self.edges)
+        return np.where(np.isnan(bucket_values), len(self.edges) + 1, codes)
+
+    def probability_at_most(self, x, bucket_values) -> np.ndarray:
+        """F(x) per game, linearly interpolated on the grid (NaN where x is missing)"""
+        x = np.asarray(x, dtype=np.float64)
+        rows = self.bucket_codes(bucket_values)
+        position = np.clip((np.nan_to_num(x) - self.grid[0]) / self.step, 0, len(self.grid) - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, len(self.grid) - 1)
+        weight = position - lower
+        values = self.cdf[rows, lower] * (1 - weight) + self.cdf[rows, upper] * weight
+        return np.where(np.isnan(x), np.nan, values)
+
+    def probability_above(self, x, bucket_values) -> np.ndarray:
+        return 1.0 - self.probability_at_most(x, bucket_values)
+
+    def quantiles(self, probabilities) -> np.ndarray:
+        """Inverse CDF, bucket x probability, linear between grid points"""
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        result = np.empty((len(self.cdf), len(probabilities)))
+        for row, cdf in enumerate(self.cdf):
+            upper = np.clip(np.searchsorted(cdf, probabilities, side='left'), 1, len(self.grid) - 1)
+            lower_cdf, upper_cdf = cdf[upper - 1], cdf[upper]
+            width = np.where(upper_cdf > lower_cdf, upper_cdf - lower_cdf, 1.0)
+            fraction = np.clip((probabilities - lower_cdf) / width, 0, 1)
+            result[row] = self.grid[upper - 1] + fraction * self.step
+        return result
+
+    def draws(self, samples: int = DEFAULT_SAMPLES, seed: int = SIMULATION_SEED) -> np.ndarray:
+        """Bucket x samples residual draws from stratified uniforms, computed once per (samples, seed)"""
+        key = ('draws', samples, seed)
+        if key not in self._simulated:
+            uniforms = (np.arange(samples) + np.random.default_rng(seed).random(samples)) / samples
+            self._simulated[key] = self.quantiles(uniforms)
+        return self._simulated[key]
+
+    def draw_summary(self, samples: int = DEFAULT_SAMPLES, seed: int = SIMULATION_SEED) -> Dict[str, np.ndarray]:
+        """Per-bucket interval bounds and standard deviation of the simulated residuals"""
+        key = ('summary', samples, seed)
+        if key not in self._simulated:
+            draws = self.draws(samples, seed)
+            summary = {}
+            for level in INTERVAL_LEVELS:
+                tail = (100 - level) / 2
+                summary[f'low_{level}'], summary[f'high_{level}'] = np.percentile(draws, [tail, 100 - tail], axis=1)
+            summary['std'] = draws.std(axis=1)
+            self._simulated[key] = summary
+        return self._simulated[key]
+
+
+class CalibrationTables:
+    """Margin and total residual CDFs plus the probability functions built on them"""
+
+    def __init__(self, margin: ResidualCDF, total: ResidualCDF, created: float = None):
+        self.margin = margin
+        self.total = total
+        self.created = created or time.time()
+
+    @classmethod
+    def fit(cls, games: pd.DataFrame, predicted_margin=None, predicted_total=None) -> 'CalibrationTables':
+        """
+        Fit on completed games (home_team_score, away_team_score, spread,
+        over_under). Without predictions the market line is the predictor.
+        """
+        spread = pd.to_numeric(games['spread'], errors='coerce').to_numpy(np.float64)
+        over_under = pd.to_numeric(games['over_under'], errors='coerce').to_numpy(np.float64)
+        home = pd.to_numeric(games['home_team_score'], errors='coerce').to_numpy(np.float64)
+        away = pd.to_numeric(games['away_team_score'], errors='coerce').to_numpy(np.float64)
+
+        predicted_margin = -spread if predicted_margin is None else np.asarray(predicted_margin, dtype=np.float64)
+        predicted_total = over_under if predicted_total is None else np.asarray(predicted_total, dtype=np.float64)
+        margin = ResidualCDF.fit((home - away) - predicted_margin, np.abs(spread), SPREAD_BUCKET_EDGES)
+        total = ResidualCDF.fit((home + away) - predicted_total, over_under, TOTAL_BUCKET_EDGES)
+        return cls(margin, total)
+
+    def win_probability(self, predicted_margin, spread) -> np.ndarray:
+        """P(home team wins) per game"""
+        predicted_margin = np.asarray(predicted_margin, dtype=np.float64)
+        return self.margin.probability_above(-predicted_margin, np.abs(np.asarray(spread, dtype=np.float64)))
+
+    def cover_probability(self, predicted_margin, spread) -> np.ndarray:
+        """P(home team covers the spread) per game; NaN without a line"""
+        spread = np.asarray(spread, dtype=np.float64)
+        return self.margin.probability_above(-spread - np.asarray(predicted_margin, dtype=np.float64),
+                                             np.abs(spread))
+
+    def over_probability(self, predicted_total, over_under) -> np.ndarray:
+        """P(combined score goes over the posted total) per game; NaN without a total"""
+        over_under = np.asarray(over_under, dtype=np.float64)
+        return self.total.probability_above(over_under - np.asarray(predicted_total, dtype=np.float64),
+                                            over_under)
+
+    def probabilities(self, predicted_margin, spread, predicted_total=None, over_under=None) -> Dict[str, np.ndarray]:
+        """All three probabilities for a slate in one pass"""
+        result = {
+            'home_win_probability': self.win_probability(predicted_margin, spread),
+            'home_cover_probability': self.cover_probability(predicted_margin, spread),
+        }
+        if over_under is not None:
+            over_under = np.asarray(over_under, dtype=np.float64)
+            result['over_probability'] = self.over_probability(
+                over_under if predicted_total is None else predicted_total, over_under)
+        return result
+
+    def simulate_outcomes(self, predicted_margin, spread, predicted_total=None, over_under=None,
+                          samples: int = DEFAULT_SAMPLES, seed: int = SIMULATION_SEED) -> Dict[str, np.ndarray]:
+        """Games x samples arrays of simulated home margins (and totals, given a predicted total)"""
+        spread = np.asarray(spread, dtype=np.float64)
+        rows = self.margin.bucket_codes(np.abs(spread))
+        outcomes = {'margin': np.asarray(predicted_margin, dtype=np.float64)[:, None] +
+                              self.margin.draws(samples, seed)[rows]}
+        if predicted_total is not None:
+            over_under = np.full(len(spread), np.nan) if over_under is None else np.asarray(over_under, np.float64)
+            outcomes['total'] = (np.asarray(predicted_total, dtype=np.float64)[:, None] +
+                                 self.total.draws(samples, seed)[self.total.bucket_codes(over_under)])
+        return outcomes
+
+    def prediction_intervals(self, predicted_margin, spread, predicted_total=None, over_under=None,
+                             samples: int = DEFAULT_SAMPLES, seed: int = SIMULATION_SEED) -> Dict[str, np.ndarray]:
+        """
+        80% and 95% interval bounds and standard deviation per game, e.g.
+        margin_low_80, margin_high_80, margin_std (and total_* given a predicted
+        total). With shared draws each game's simulated quantiles are its
+        bucket's shifted by the prediction, so these equal the percentiles of
+        simulate_outcomes without materializing games x samples.
+        """
+        spread = np.asarray(spread, dtype=np.float64)
+        sides = [('margin', self.margin, predicted_margin, np.abs(spread))]
+        if predicted_total is not None:
+            over_under = np.full(len(spread), np.nan) if over_under is None else np.asarray(over_under, np.float64)
+            sides.append(('total', self.total, predicted_total, over_under))
+
+        intervals = {}
+        for name, table, predicted, bucket_values in sides:
+            predicted = np.asarray(predicted, dtype=np.float64)
+            rows = table.bucket_codes(bucket_values)
+            for statistic, values in table.draw_summary(samples, seed).items():
+                offset = values[rows]
+                intervals[f'{name}_{statistic}'] = np.where(np.isnan(predicted), np.nan, offset) \
+                    if statistic == 'std' else predicted + offset
+        return intervals
+
+    def annotate(self, predictions: List[Dict]) -> List[Dict]:
+        """
+        Add home_win_probability, home_cover_probability, over_probability and
+        intervals to comprehensive prediction dicts in place, in one vectorized
+        pass. Rick's spread and total are the predictions; missing ones give None.
+        """
+        if not predictions:
+            return predictions
+
+        def field(name):
+            return pd.to_numeric(pd.Series([p.get(name) for p in predictions], dtype=object),
+                                 errors='coerce').to_numpy(np.float64)
+
+        predicted_margin, spread = -field('rick_spread'), field('vegas_spread')
+        predicted_total, over_under = field('rick_total'), field('vegas_total')
+        probabilities = self.probabilities(predicted_margin, spread, predicted_total, over_under)
+        for name, values in probabilities.items():
+            for prediction, value in zip(predictions, values.tolist()):
+                prediction[name] = None if np.isnan(value) else value
+
+        intervals = interval_dicts(self.prediction_intervals(predicted_margin, spread, predicted_total, over_under))
+        for prediction, interval in zip(predictions, intervals):
+            prediction['intervals'] = interval
+        return predictions
+
+    def save(self, path: str = CALIBRATION_PATH) -> str:
+        """Write the tables atomically"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            version=np.array(TABLES_VERSION),
+            created=np.array(self.created),
+            grid=self.margin.grid,
+            margin_edges=self.margin.edges, margin_cdf=self.margin.cdf, margin_counts=self.margin.counts,
+            total_edges=self.total.edges, total_cdf=self.total.cdf, total_counts=self.total.counts,
+        )
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str = CALIBRATION_PATH) -> 'CalibrationTables':
+        with np.load(path) as tables:
+            if int(tables['version']) != TABLES_VERSION:
+                raise ValueError(f"calibration tables version {int(tables['version'])} != {TABLES_VERSION}")
+            grid = tables['grid']
+            return cls(
+                ResidualCDF(tables['margin_edges'], grid, tables['margin_cdf'], tables['margin_counts']),
+                ResidualCDF(tables['total_edges'], grid, tables['total_cdf'], tables['total_counts']),
+                float(tables['created'])
+            )
+
+
+def interval_dicts(intervals: Dict[str, np.ndarray]) -> List[Dict]:
+    """
+    Per-game {'margin_80': [low, high], 'margin_95': [...], 'margin_std': ...}
+    (and total_*) from prediction_intervals columns; missing values as None
+    """
+    sides = [side for side in ('margin', 'total') if f'{side}_std' in intervals]
+    columns = {column: [None if np.isnan(value) else value for value in values.tolist()]
+               for column, values in intervals.items()}
+    result = []
+    for i in range(len(columns['margin_std'])):
+        interval = {}
+        for side in sides:
+            for level in INTERVAL_LEVELS:
+                low, high = columns[f'{side}_low_{level}'][i], columns[f'{side}_high_{level}'][i]
+                interval[f'{side}_{level}'] = None if low is None else [low, high]
+            interval[f'{side}_std'] = columns[f'{side}_std'][i]
+        result.append(interval)
+    return result
+
+
+def load_calibration_games(conn) -> pd.DataFrame:
+    """Completed games with a posted line or total and a final score"""
+    query = """
+    SELECT g.id, g.season, g.spread, g.over_under, g.home_team_score, g.away_team_score
+    FROM games g
+    WHERE g.completed = true
+      AND g.home_team_score IS NOT NULL AND g.away_team_score IS NOT NULL
+      AND (g.spread IS NOT NULL OR g.over_under IS NOT NULL)
+    """
+    return pd.read_sql(query, conn)
+
+
+def load_calibration_tables(path: str = CALIBRATION_PATH) -> Optional[CalibrationTables]:
+    """Open the fitted tables, returning None when they have not been built"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return CalibrationTables.load(path)
+    except Exception as e:
+        print(f"⚠️ Calibration tables unreadable, probabilities disabled: {e}")
+        return None
+
+
+def bucket_labels(edges: Sequence[float]) -> List[str]:
+    bounds = [0.0] + list(edges)
+    return [f"{lo:g}-{hi:g}" for lo, hi in zip(bounds, bounds[1:])] + [f"{edges[-1]:g}+", 'all']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit calibrated probability tables from completed games")
+    parser.add_argument('--output', default=CALIBRATION_PATH)
+    args = parser.parse_args()
+
+    from database_connection import get_database_connection
+
+    print("📐 FITTING CALIBRATION TABLES")
+    print("=" * 50)
+    conn = get_database_connection()
+    try:
+        games = load_calibration_games(conn)
+    finally:
+        conn.close()
+
+    tables = CalibrationTables.fit(games)
+    path = tables.save(args.output)
+    for name, table in (('spread', tables.margin), ('total', tables.total)):
+        labels = ', '.join(f"{label}: {count}" for label, count in zip(bucket_labels(table.edges), table.counts))
+        print(f"   {name} buckets ({labels})")
+    print(f"✅ Fitted on {len(games)} games, written to {path}")
+
+
+if __name__ == "__main__":
+    main()
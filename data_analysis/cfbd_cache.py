@@ -0,0 +1,71 @@
+"""
+College Football Data API access with a local JSON cache
+Reference data (venues, team history) changes rarely, so it is fetched once
+and reused from data_analysis/.cache on later runs
+"""
+
+import os
+import json
+import tempfile
+import requests
+from typing import Dict, List, Optional
+
+CFBD_BASE_URL = 'https://api.collegefootballdata.com'
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+
+def cache_path(name: str) -> str:
+    """Absolute path for a cache artifact, creating the cache directory if needed"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, name)
+
+
+def load_cached_json(name: str) -> Optional[object]:
+    """Return a cached JSON payload, or None when it has not been fetched yet"""
+    path = cache_path(name)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_cached_json(name: str, payload) -> str:
+    """Write a JSON payload to the cache atomically and return its path"""
+    path = cache_path(name)
+    # Per-process temp file: analyzer pool workers may store the same payload at once
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix='.tmp', dir=CACHE_DIR)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def fetch_cfbd(endpoint: str, params: Dict = None) -> Optional[List]:
+    """GET a CFBD endpoint, returning the decoded JSON or None on failure"""
+    api_key = os.getenv('CFBD_API_KEY')
+    headers = {'Authorization': f'Bearer {api_key}'} if api_key else {}
+    try:
+        response = requests.get(f"{CFBD_BASE_URL}{endpoint}", params=params, headers=headers, timeout=30)
+        if response.status_code == 200:
+            return response.json()
+        print(f"❌ CFBD {endpoint} error {response.status_code}: {response.text[:200]}")
+    except Exception as e:
+        print(f"❌ CFBD {endpoint} request failed: {e}")
+    return None
+
+
+def cached_cfbd(name: str, endpoint: str, params: Dict = None, refresh: bool = False) -> Optional[List]:
+    """Serve a CFBD payload from the cache, fetching and storing it on a miss"""
+    if not refresh:
+        payload = load_cached_json(name)
+        if payload is not None:
+            return payload
+
+    payload = fetch_cfbd(endpoint, params)
+    if payload is not None:
+        save_cached_json(name, payload)
+    return payload
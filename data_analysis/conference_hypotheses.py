@@ -8,12 +8,25 @@ import numpy as np
 import psycopg2
 from scipy import stats
 from database_connection import get_database_connection
+from conference_index import attach_season_conferences
+from kickoff_features import attach_kickoff_features
+from travel import TravelMatrix
+from venue_dimension import load_venue_dimension
 import warnings
 warnings.filterwarnings('ignore')
 
+# Columns this analyzer takes from a shared games snapshot (same as its query)
+GAME_COLUMNS = [
+    'id', 'season', 'week', 'home_team_score', 'away_team_score', 'spread', 'over_under',
+    'start_date', 'venue', 'is_neutral_site', 'home_team', 'home_conf', 'away_team',
+    'away_conf', 'home_rank', 'away_rank',
+]
+
 class ConferenceHypothesesAnalyzer:
-    def __init__(self):
-        self.conn = get_database_connection()
+    def __init__(self, games: pd.DataFrame = None):
+        # A snapshot shared by all analyzers (analyzer_pool) replaces the query below
+        self.snapshot = games
+        self.conn = get_database_connection() if games is None else None
         self.games_df = None
         
     def load_conference_data(self):
@@ -25,6 +38,7 @@ class ConferenceHypothesesAnalyzer:
             g.id, g.season, g.week,
             g.home_team_score, g.away_team_score,
             g.spread, g.over_under, g.start_date,
+            g.venue, g.is_neutral_site,
             ht.name as home_team, ht.conference as home_conf,
             at.name as away_team, at.conference as away_conf,
             ht.rank as home_rank, at.rank as away_rank
@@ -38,7 +52,19 @@ class ConferenceHypothesesAnalyzer:
         ORDER BY g.start_date
         """
         
-        self.games_df = pd.read_sql(query, self.conn)
+        if self.snapshot is not None:
+            self.games_df = self.snapshot[GAME_COLUMNS].reset_index(drop=True)
+        else:
+            self.games_df = pd.read_sql(query, self.conn)
+        # Conference as of each game's season, not the team's current affiliation
+        self.games_df = attach_season_conferences(self.games_df)
+        
+        # Venue-local / Eastern kickoff times and away-team body clock
+        venues = load_venue_dimension()
+        if venues is not None:
+            self.games_df = venues.join_games(self.games_df)
+        teams = pd.concat([self.games_df['home_team'], self.games_df['away_team']])
+        self.games_df = attach_kickoff_features(self.games_df, TravelMatrix.for_teams(teams, venues))
         
         # Calculate additional metrics
         self.games_df['total_points'] = (
@@ -237,7 +263,6 @@ class ConferenceHypothesesAnalyzer:
         """H5: Pac-12 late games (after 10 PM ET) have different characteristics"""
         print("\n🌙 HYPOTHESIS 5: Pac-12 After Dark Effect")
         
-        # Convert start times to hour (approximate late games as evening kickoffs)
         pac12_games = self.games_df[
             (self.games_df['home_conf'] == 'Pac-12') |
             (self.games_df['away_conf'] == 'Pac-12')
@@ -246,33 +271,51 @@ class ConferenceHypothesesAnalyzer:
         if len(pac12_games) == 0:
             print("   No Pac-12 games found")
             return None
-            
+        
+        other_p5_games = self.games_df[
+            self.games_df['home_conf'].isin(['SEC', 'Big Ten', 'Big 12', 'ACC']) &
+            self.games_df['away_conf'].isin(['SEC', 'Big Ten', 'Big 12', 'ACC'])
+        ]
+        
         # Use total points as proxy for "weirdness" (higher variance)
         pac12_avg = pac12_games['total_points'].mean()
         pac12_std = pac12_games['total_points'].std()
+        other_p5_avg = other_p5_games['total_points'].mean()
+        other_p5_std = other_p5_games['total_points'].std()
         
-        # Compare to other conferences
-        other_p5_avg = self.games_df[
-            self.games_df['home_conf'].isin(['SEC', 'Big Ten', 'Big 12', 'ACC']) &
-            self.games_df['away_conf'].isin(['SEC', 'Big Ten', 'Big 12', 'ACC'])
-        ]['total_points'].mean()
+        # Kickoff window comes from the actual Eastern kickoff time
+        after_dark = pac12_games[pac12_games['kickoff_window'] == 'After Dark']
+        earlier = pac12_games[pac12_games['kickoff_window'].isin(['Noon', 'Afternoon', 'Prime'])]
+        after_dark_std = after_dark['total_points'].std()
+        earlier_std = earlier['total_points'].std()
         
-        other_p5_std = self.games_df[
-            self.games_df['home_conf'].isin(['SEC', 'Big Ten', 'Big 12', 'ACC']) &
-            self.games_df['away_conf'].isin(['SEC', 'Big Ten', 'Big 12', 'ACC'])
-        ]['total_points'].std()
+        # Eastern teams playing late out West kick off well past their body clock
+        body_clock = after_dark['away_body_clock_offset']
+        jet_lagged = after_dark[body_clock <= -2]
+        jet_lag_cover = (jet_lagged['home_margin'] + jet_lagged['spread'] > 0).mean() * 100 \
+            if len(jet_lagged) > 0 else np.nan
         
         print(f"   Pac-12 scoring: {pac12_avg:.1f} ± {pac12_std:.1f}")
         print(f"   Other P5 scoring: {other_p5_avg:.1f} ± {other_p5_std:.1f}")
         print(f"   Pac-12 variance factor: {pac12_std / other_p5_std:.2f}x")
-        print(f"   'After Dark' weirdness: {'Confirmed' if pac12_std > other_p5_std * 1.1 else 'Not significant'}")
+        print(f"   After Dark games (10 PM+ ET): {len(after_dark)} "
+              f"({after_dark['total_points'].mean():.1f} ± {after_dark_std:.1f})")
+        print(f"   Earlier Pac-12 kickoffs: {len(earlier)} "
+              f"({earlier['total_points'].mean():.1f} ± {earlier_std:.1f})")
+        if len(jet_lagged) > 0:
+            print(f"   Home ATS vs visitors 2+ hours off their body clock: {jet_lag_cover:.1f}% ({len(jet_lagged)} games)")
+        print(f"   'After Dark' weirdness: {'Confirmed' if after_dark_std > other_p5_std * 1.1 else 'Not significant'}")
         
         return {
             'pac12_avg': pac12_avg,
             'pac12_std': pac12_std,
             'other_p5_std': other_p5_std,
             'variance_factor': pac12_std / other_p5_std,
-            'is_weirder': pac12_std > other_p5_std * 1.1
+            'after_dark_games': len(after_dark),
+            'after_dark_std': after_dark_std,
+            'earlier_std': earlier_std,
+            'jet_lag_home_cover_pct': jet_lag_cover,
+            'is_weirder': after_dark_std > other_p5_std * 1.1
         }
         
     def hypothesis_6_acc_coastal_chaos(self):
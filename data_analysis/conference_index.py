@@ -0,0 +1,125 @@
+"""
+Season-Aware Conference Index
+Maps (team, season) to the conference the team actually played in that year,
+built from CFBD per-season team lists and cached locally. teams.conference only
+holds today's affiliation, which misfiles every realigned program's history.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional, Sequence
+from cfbd_cache import cached_cfbd
+
+
+class ConferenceIndex:
+    """
+    Dense team x season matrix of int16 conference codes (-1 = unknown).
+    Lookups factorize team names once and index the matrix, so a whole games
+    frame resolves without any per-game work.
+    """
+
+    def __init__(self, memberships: pd.DataFrame):
+        """memberships: one row per team, season and conference"""
+        memberships = memberships.dropna(subset=['team', 'season', 'conference'])
+        seasons = memberships['season'].astype(np.int64).to_numpy()
+
+        self.teams = pd.Index(sorted(memberships['team'].unique()))
+        conferences = pd.Categorical(memberships['conference'])
+        self.categories = conferences.categories
+        self.first_season = int(seasons.min()) if len(seasons) else 0
+        self.last_season = int(seasons.max()) if len(seasons) else -1
+
+        self.codes = np.full((len(self.teams), self.last_season - self.first_season + 1), -1, dtype=np.int16)
+        team_rows = self.teams.get_indexer(memberships['team'])
+        self.codes[team_rows, seasons - self.first_season] = conferences.codes
+
+    @classmethod
+    def from_cfbd(cls, team_records_by_season: Dict[int, List[Dict]]) -> 'ConferenceIndex':
+        """Build from CFBD /teams?year= payloads keyed by season"""
+        rows = [
+            {'team': team.get('school'), 'season': int(season), 'conference': team.get('conference')}
+            for season, records in team_records_by_season.items()
+            for team in records or []
+        ]
+        return cls(pd.DataFrame(rows, columns=['team', 'season', 'conference']))
+
+    @classmethod
+    def load(cls, seasons: Iterable[int], refresh: bool = False) -> 'ConferenceIndex':
+        """Load per-season team lists from the local cache, fetching any missing seasons"""
+        payloads = {}
+        for season in sorted({int(season) for season in seasons}):
+            records = cached_cfbd(f'teams_{season}.json', '/teams', {'year': season}, refresh=refresh)
+            if records is not None:
+                payloads[season] = records
+        index = cls.from_cfbd(payloads)
+        print(f"🏆 Conference index: {len(index.teams)} teams, "
+              f"seasons {index.first_season}-{index.last_season}")
+        return index
+
+    def lookup(self, teams, seasons) -> pd.Categorical:
+        """
+        Conference for each (team, season) pair. Seasons past the indexed range
+        use the nearest indexed season so upcoming games resolve to the latest
+        known membership.
+        """
+        seasons = np.asarray(seasons, dtype=np.int64)
+        codes, uniques = pd.factorize(pd.Series(teams, dtype=object))
+        if self.codes.size == 0:
+            return pd.Categorical.from_codes(np.full(len(codes), -1), categories=self.categories)
+
+        rows = self.teams.get_indexer(uniques)[codes] if len(uniques) else np.full(len(codes), -1)
+        rows = np.where(codes >= 0, rows, -1)
+        columns = np.clip(seasons - self.first_season, 0, self.codes.shape[1] - 1)
+        conference_codes = np.where(rows >= 0, self.codes[np.clip(rows, 0, None), columns], -1)
+        return pd.Categorical.from_codes(conference_codes, categories=self.categories)
+
+    def attach(self, games: pd.DataFrame, team_columns: Sequence[str] = ('home_team', 'away_team'),
+               conference_columns: Sequence[str] = ('home_conf', 'away_conf'),
+               season_column: str = 'season') -> pd.DataFrame:
+        """
+        Overwrite conference columns with the per-season conference as a
+        categorical. Teams the index does not know keep their existing value.
+        """
+        if len(games) == 0:
+            return games
+
+        games = games.copy()
+        seasons = games[season_column].to_numpy()
+        resolved = {}
+        for team_column, conference_column in zip(team_columns, conference_columns):
+            conference = pd.Series(self.lookup(games[team_column].to_numpy(), seasons), index=games.index)
+            if conference_column in games:
+                conference = conference.astype(object).fillna(games[conference_column])
+            resolved[conference_column] = conference.astype(object)
+
+        # Share one category set so home/away columns compare directly
+        categories = pd.Index(pd.unique(pd.concat(resolved.values()).dropna())).sort_values()
+        for conference_column, conference in resolved.items():
+            games[conference_column] = pd.Categorical(conference, categories=categories)
+        return games
+
+
+def load_conference_index(seasons: Iterable[int], refresh: bool = False) -> Optional[ConferenceIndex]:
+    """Load the cached conference index, returning None when CFBD data is unavailable"""
+    try:
+        return ConferenceIndex.load(seasons, refresh=refresh)
+    except Exception as e:
+        print(f"⚠️ Conference index unavailable: {e}")
+        return None
+
+
+def attach_season_conferences(games: pd.DataFrame, conference_index: Optional[ConferenceIndex] = None,
+                              **columns) -> pd.DataFrame:
+    """
+    Attach per-season conferences to a games frame, loading the index for the
+    frame's seasons when none is given. Games are returned unchanged when the
+    index is unavailable.
+    """
+    if len(games) == 0:
+        return games
+    if conference_index is None:
+        seasons = games['season'].astype(np.int64)
+        conference_index = load_conference_index(range(int(seasons.min()), int(seasons.max()) + 1))
+    if conference_index is None:
+        return games
+    return conference_index.attach(games, **columns)
@@ -0,0 +1,56 @@
+"""
+Conference Matchup Matrix
+The conference factor depends only on the (home, away) conference pair, so
+every pair is scored once into dense matrices and games look their factor up
+by conference code
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Sequence
+
+POWER_5 = ['SEC', 'Big Ten', 'Big 12', 'ACC', 'Pac-12']
+
+# Descriptor codes for the rating differential
+NO_MISMATCH, CONFERENCE_ADVANTAGE, MAJOR_MISMATCH = 0, 1, 2
+
+
+class ConferenceMatchupMatrix:
+    """
+    Conference x conference score, rating differential, Power 5 tier and
+    mismatch descriptor matrices. The last row/column is the slot for missing
+    or unrated conferences (rating 0, not Power 5).
+    """
+
+    def __init__(self, ratings: Dict[str, float], power5: Sequence[str] = POWER_5,
+                 scale: float = 0.3, tier_points: float = 1.5):
+        self.ratings = dict(ratings)
+        self.conferences = pd.Index(list(dict.fromkeys(list(self.ratings) + list(power5))))
+        self.unknown = len(self.conferences)
+
+        rating = np.append([self.ratings.get(c, 0) for c in self.conferences], 0.0).astype(np.float64)
+        is_p5 = np.append(self.conferences.isin(list(power5)), False)
+
+        self.differential = rating[:, None] - rating[None, :]
+        self.tier = ((is_p5[:, None] & ~is_p5[None, :]).astype(np.int8) -
+                     (is_p5[None, :] & ~is_p5[:, None]))
+        self.scores = self.differential * scale + tier_points * self.tier
+        magnitude = np.abs(self.differential)
+        self.mismatch = np.where(magnitude > 3, MAJOR_MISMATCH,
+                                 np.where(magnitude > 1, CONFERENCE_ADVANTAGE, NO_MISMATCH)).astype(np.int8)
+
+    def codes(self, conferences) -> np.ndarray:
+        """Matrix index per conference name; unknown and missing names share the last slot"""
+        if isinstance(conferences, pd.Series) and isinstance(conferences.dtype, pd.CategoricalDtype):
+            # Resolve each category once, then map the integer codes
+            category_codes = np.append(self.conferences.get_indexer(conferences.cat.categories), -1)
+            indexes = category_codes[conferences.cat.codes.to_numpy()]
+        else:
+            indexes = self.conferences.get_indexer(pd.Index(pd.Series(conferences, dtype=object)))
+        return np.where(indexes >= 0, indexes, self.unknown)
+
+    def lookup(self, home_conferences, away_conferences):
+        """(score, differential, tier, mismatch) arrays for each game's conference pair"""
+        home = self.codes(home_conferences)
+        away = self.codes(away_conferences)
+        return self.scores[home, away], self.differential[home, away], self.tier[home, away], self.mismatch[home, away]
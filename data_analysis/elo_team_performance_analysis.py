@@ -8,12 +8,22 @@ import numpy as np
 import psycopg2
 from scipy import stats
 from database_connection import get_database_connection
+from conference_index import attach_season_conferences
 import warnings
 warnings.filterwarnings('ignore')
 
+# Columns this analyzer takes from a shared games snapshot (same as its query)
+GAME_COLUMNS = [
+    'id', 'season', 'week', 'home_team_score', 'away_team_score', 'spread', 'over_under',
+    'start_date', 'home_team', 'home_conf', 'home_elo', 'home_rank', 'away_team',
+    'away_conf', 'away_elo', 'away_rank',
+]
+
 class ELOTeamPerformanceAnalyzer:
-    def __init__(self):
-        self.conn = get_database_connection()
+    def __init__(self, games: pd.DataFrame = None):
+        # A snapshot shared by all analyzers (analyzer_pool) replaces the query below
+        self.snapshot = games
+        self.conn = get_database_connection() if games is None else None
         self.games_df = None
         
     def load_team_data(self):
@@ -39,7 +49,12 @@ class ELOTeamPerformanceAnalyzer:
         ORDER BY g.start_date
         """
         
-        self.games_df = pd.read_sql(query, self.conn)
+        if self.snapshot is not None:
+            self.games_df = self.snapshot[GAME_COLUMNS].reset_index(drop=True)
+        else:
+            self.games_df = pd.read_sql(query, self.conn)
+        # Conference as of each game's season, not the team's current affiliation
+        self.games_df = attach_season_conferences(self.games_df)
         
         # Calculate metrics
         self.games_df['home_margin'] = (
@@ -0,0 +1,85 @@
+"""
+Factor Contribution Matrix
+Games x factors matrix of each factor's point contribution for a batch of
+predictions, with per-factor metadata (category, units, sign convention and
+how the factor feeds the spread and total). Analysts sort, filter and
+aggregate it with pandas or NumPy instead of parsing key_factors strings.
+
+Both engines produce one: PredictionBatch.contributions() and
+ScoringCore.factor_contributions(frame) for prediction_algorithm;
+ComprehensiveScoringCore.factor_contributions(frame) and
+IncrementalSlate.contributions() for the comprehensive system.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Sequence
+
+# Metadata fields every factor carries
+METADATA_FIELDS = ['category', 'description', 'sign', 'spread_weight', 'total_weight']
+
+
+class FactorContributions:
+    """Contribution matrix aligned with a batch's game index, plus factor metadata"""
+
+    __slots__ = ('values', 'factors', 'index', 'metadata')
+
+    def __init__(self, values: np.ndarray, factors: Sequence[str], index=None,
+                 metadata: Dict[str, Dict] = None):
+        self.values = np.asarray(values, dtype=np.float64).reshape(-1, len(factors))
+        self.factors = list(factors)
+        self.index = index if index is not None else pd.RangeIndex(len(self.values))
+        self.metadata = {factor: dict((metadata or {}).get(factor, {})) for factor in self.factors}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def column(self, factor: str) -> np.ndarray:
+        return self.values[:, self.factors.index(factor)]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Games x factors DataFrame indexed like the scored batch"""
+        return pd.DataFrame(self.values, index=self.index, columns=self.factors)
+
+    def metadata_frame(self) -> pd.DataFrame:
+        """One row per factor with METADATA_FIELDS"""
+        return pd.DataFrame.from_dict(self.metadata, orient='index').reindex(columns=METADATA_FIELDS)
+
+    def spread_contribution(self) -> np.ndarray:
+        """Per-game sum of the factors weighted by how they enter the spread"""
+        weights = np.array([self.metadata[factor].get('spread_weight', 1.0) for factor in self.factors])
+        return self.values @ weights
+
+    def top_factors(self, n: int = 3) -> pd.DataFrame:
+        """The n largest |contributions| per game: factor names and values, biggest first"""
+        n = min(n, len(self.factors))
+        order = np.argsort(-np.abs(self.values), axis=1, kind='stable')[:, :n]
+        names = np.array(self.factors, dtype=object)[order]
+        values = np.take_along_axis(self.values, order, axis=1)
+        columns = {}
+        for rank in range(n):
+            columns[f'factor_{rank + 1}'] = names[:, rank]
+            columns[f'value_{rank + 1}'] = values[:, rank]
+        return pd.DataFrame(columns, index=self.index)
+
+    def summary(self) -> pd.DataFrame:
+        """Per factor: games it moved, mean and mean absolute contribution, share of all absolute points"""
+        magnitude = np.abs(self.values)
+        total = magnitude.sum()
+        return pd.DataFrame({
+            'games_active': (self.values != 0).sum(axis=0),
+            'mean': self.values.mean(axis=0) if len(self) else np.zeros(len(self.factors)),
+            'mean_abs': magnitude.mean(axis=0) if len(self) else np.zeros(len(self.factors)),
+            'share_of_abs': magnitude.sum(axis=0) / total if total else np.zeros(len(self.factors)),
+        }, index=pd.Index(self.factors, name='factor'))
+
+    @classmethod
+    def concat(cls, parts: List['FactorContributions']) -> 'FactorContributions':
+        """Stack batches with the same factors (e.g. weekly slates into a season)"""
+        first = parts[0]
+        index = first.index.append([part.index for part in parts[1:]]) if len(parts) > 1 else first.index
+        return cls(np.vstack([part.values for part in parts]), first.factors, index, first.metadata)
@@ -0,0 +1,327 @@
+"""
+Per-Game Feature Matrix Export
+Assembles ratings, weather, travel, rest, conference and market features for
+every game into one float32 matrix and writes it as an .npy/.npz pair:
+
+    <path>.npy  the (games x features) float32 matrix, memory-mappable
+    <path>.npz  manifest: column names, game ids, categorical code tables and
+                the data fingerprint the export was built from
+
+Backtests, weight optimizers and worker processes open the .npy with
+mmap_mode='r', so they load in milliseconds and share pages through the OS
+page cache instead of each rebuilding the features from SQL and pandas.
+
+Usage:
+    python feature_matrix.py [--seasons 2022 2023 ...] [--output PATH]
+"""
+
+import os
+import json
+import hashlib
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence
+from cfbd_cache import CACHE_DIR
+from feature_store import AsOfFeatureStore, to_epoch_seconds
+from schedule_features import attach_rest_features, REST_FEATURES
+from venue_dimension import load_venue_dimension
+from travel import TravelMatrix
+from kickoff_features import attach_kickoff_features, KICKOFF_WINDOWS
+from weather_kernel import ALGORITHM_PROFILE, weather_codes, weather_points
+
+FEATURE_MATRIX_PATH = os.path.join(CACHE_DIR, 'feature_matrix')
+MANIFEST_VERSION = 2
+
+FEATURE_GROUPS = {
+    'game': ['season', 'week', 'is_neutral_site', 'is_conference_game', 'completed'],
+    'ratings': ['home_elo', 'away_elo', 'elo_diff', 'home_rank', 'away_rank'],
+    'weather': ['temperature', 'wind_speed', 'humidity', 'precipitation', 'is_dome',
+                'temperature_code', 'wind_code', 'weather_points'],
+    'travel': ['home_travel_miles', 'away_travel_miles', 'travel_tz_delta', 'venue_capacity', 'venue_elevation'],
+    'kickoff': ['kickoff_local_hour', 'kickoff_et_hour', 'kickoff_window', 'local_dst',
+                'kickoff_after_sunset', 'away_body_clock_offset'],
+    'rest': [f'{side}_{feature}' for feature in REST_FEATURES for side in ('home', 'away')] + ['rest_advantage'],
+    'conference': ['home_conf', 'away_conf'],
+    'market': ['spread', 'over_under'],
+    'outcome': ['home_margin', 'total_points'],
+}
+FEATURE_COLUMNS = [column for columns in FEATURE_GROUPS.values() for column in columns]
+
+# Stored as category codes; the manifest keeps the labels
+CATEGORICAL_COLUMNS = ['home_conf', 'away_conf', 'kickoff_window']
+# Share one category list so home and away conferences compare with each other
+CONFERENCE_COLUMNS = ['home_conf', 'away_conf']
+
+# Modules whose code shapes the features; editing one invalidates exports
+FEATURE_MODULES = [
+    'feature_matrix', 'feature_store', 'schedule_features', 'venue_dimension', 'travel',
+    'kickoff_features', 'weather_kernel', 'conference_index',
+]
+
+FINGERPRINT_SQL = """
+SELECT
+    (SELECT md5(coalesce(string_agg(g::text, '|' ORDER BY g.id), ''))
+     FROM games g WHERE g.start_date IS NOT NULL),
+    (SELECT md5(coalesce(string_agg(t::text, '|' ORDER BY t.id), '')) FROM teams t)
+"""
+
+
+def feature_data_fingerprint(conn) -> str:
+    """
+    Hash of every scheduled game row, every team row (ELO, rank, conference...)
+    and the feature code, so an export built before a recompute or a feature
+    change no longer matches
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(FINGERPRINT_SQL)
+        games_digest, teams_digest = cursor.fetchone()
+    digest = hashlib.sha1(f"{games_digest}:{teams_digest}".encode())
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for module in FEATURE_MODULES:
+        path = os.path.join(directory, f'{module}.py')
+        if os.path.exists(path):
+            with open(path, 'rb') as source:
+                digest.update(source.read())
+    return digest.hexdigest()[:16]
+
+
+def load_feature_games(conn, seasons: Optional[Sequence[int]] = None) -> pd.DataFrame:
+    """Every game (completed and upcoming) with the raw columns the features derive from"""
+    query = """
+    SELECT
+        g.id, g.season, g.week, g.start_date, g.completed,
+        g.home_team_id, g.away_team_id,
+        g.home_team_score, g.away_team_score,
+        g.spread, g.over_under,
+        g.temperature, g.wind_speed, g.humidity, g.precipitation, g.is_dome,
+        g.venue, g.stadium, g.is_neutral_site, g.is_conference_game,
+        ht.name as home_team, ht.conference as home_conf,
+        at.name as away_team, at.conference as away_conf
+    FROM games g
+    JOIN teams ht ON g.home_team_id = ht.id
+    JOIN teams at ON g.away_team_id = at.id
+    WHERE g.start_date IS NOT NULL
+    """
+    params = None
+    if seasons is not None:
+        query += " AND g.season = ANY(%s)"
+        params = ([int(season) for season in seasons],)
+    query += " ORDER BY g.id"
+    return pd.read_sql(query, conn, params=params)
+
+
+def build_feature_frame(conn, seasons: Optional[Sequence[int]] = None,
+                        feature_store: Optional[AsOfFeatureStore] = None) -> pd.DataFrame:
+    """Run every feature stage over the games frame and return it with FEATURE_COLUMNS"""
+    games = load_feature_games(conn, seasons)
+    if len(games) == 0:
+        return games
+
+    if feature_store is None:
+        feature_store = AsOfFeatureStore.from_connection(conn)
+    # The store resolves conferences through the season-aware index
+    games = feature_store.attach(games)
+    games = attach_rest_features(games, conn)
+
+    venues = load_venue_dimension()
+    if venues is not None:
+        games = venues.join_games(games)
+    teams = pd.concat([games['home_team'], games['away_team']])
+    travel = TravelMatrix.for_teams(teams, venues)
+    games = travel.attach(games)
+    games = attach_kickoff_features(games, travel)
+
+    is_dome = games['is_dome'].eq(True)
+    if 'venue_dome' in games:
+        is_dome |= games['venue_dome'].eq(True)
+    games['is_dome'] = is_dome
+    codes = weather_codes(games['temperature'], games['wind_speed'], games['precipitation'],
+                          is_dome, profile=ALGORITHM_PROFILE)
+    games['temperature_code'] = codes['temperature']
+    games['wind_code'] = codes['wind']
+    games['weather_points'] = weather_points(codes, ALGORITHM_PROFILE)['total']
+
+    games['elo_diff'] = games['home_elo'] - games['away_elo']
+    games['home_margin'] = games['home_team_score'] - games['away_team_score']
+    games['total_points'] = games['home_team_score'] + games['away_team_score']
+    return games
+
+
+def to_feature_matrix(games: pd.DataFrame, columns: Sequence[str] = FEATURE_COLUMNS):
+    """
+    Convert a feature frame to (float32 matrix, game ids, categorical labels).
+    Booleans become 0/1, categoricals become their codes, missing values NaN.
+    """
+    matrix = np.full((len(games), len(columns)), np.nan, dtype=np.float32)
+    categories = {}
+    conferences = sorted(pd.concat([games[column].astype(object) for column in CONFERENCE_COLUMNS
+                                    if column in games]).dropna().unique()) if len(games) else []
+    for j, column in enumerate(columns):
+        if column not in games:
+            continue
+        values = games[column]
+        if column in CATEGORICAL_COLUMNS:
+            if column == 'kickoff_window':
+                labels = pd.Categorical(values, categories=KICKOFF_WINDOWS)
+            elif column in CONFERENCE_COLUMNS:
+                labels = pd.Categorical(values.astype(object), categories=conferences)
+            else:
+                labels = pd.Categorical(values)
+            categories[column] = [str(label) for label in labels.categories]
+            matrix[:, j] = np.where(labels.codes >= 0, labels.codes, np.nan)
+        else:
+            numeric = pd.to_numeric(values, errors='coerce').astype('Float64')
+            matrix[:, j] = numeric.to_numpy(np.float64, na_value=np.nan)
+    return matrix, games['id'].to_numpy(np.int64), categories
+
+
+def write_feature_matrix(games: pd.DataFrame, path: str = FEATURE_MATRIX_PATH,
+                         columns: Sequence[str] = FEATURE_COLUMNS, fingerprint: str = '') -> str:
+    """
+    Write the .npy matrix and .npz manifest atomically; rows are ordered by
+    game id. fingerprint is feature_data_fingerprint at build time.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    games = games.sort_values('id')
+    matrix, game_ids, categories = to_feature_matrix(games, columns)
+
+    for suffix, writer in (
+        ('.npy', lambda f: np.save(f, matrix)),
+        ('.npz', lambda f: np.savez(
+            f,
+            columns=np.array(columns),
+            game_ids=game_ids,
+            start_epochs=to_epoch_seconds(games['start_date']),
+            categories=np.array(json.dumps(categories)),
+            fingerprint=np.array(fingerprint),
+            version=np.array(MANIFEST_VERSION),
+            created=np.array(time.time())
+        )),
+    ):
+        tmp_path = f"{path}.tmp{suffix}"
+        with open(tmp_path, 'wb') as f:
+            writer(f)
+        os.replace(tmp_path, f"{path}{suffix}")
+    return path
+
+
+class FeatureMatrix:
+    """Read-only view of an exported feature matrix"""
+
+    def __init__(self, values: np.ndarray, columns: Sequence[str], game_ids: np.ndarray,
+                 categories: Dict[str, List[str]] = None, start_epochs: np.ndarray = None,
+                 fingerprint: str = ''):
+        self.values = values
+        self.fingerprint = fingerprint
+        self.columns = list(columns)
+        self.game_ids = game_ids
+        self.categories = categories or {}
+        self.start_epochs = start_epochs
+        self._column_index = {column: j for j, column in enumerate(self.columns)}
+
+    @classmethod
+    def load(cls, path: str = FEATURE_MATRIX_PATH, mmap: bool = True) -> 'FeatureMatrix':
+        """Open an export; with mmap the matrix pages in lazily and is shared across processes"""
+        values = np.load(f"{path}.npy", mmap_mode='r' if mmap else None)
+        with np.load(f"{path}.npz") as manifest:
+            if int(manifest['version']) != MANIFEST_VERSION:
+                raise ValueError(f"feature matrix manifest version {int(manifest['version'])} != {MANIFEST_VERSION}")
+            return cls(
+                values,
+                [str(column) for column in manifest['columns']],
+                manifest['game_ids'],
+                json.loads(str(manifest['categories'])),
+                manifest['start_epochs'],
+                str(manifest['fingerprint'])
+            )
+
+    def column(self, name: str) -> np.ndarray:
+        """One feature column (a strided view into the matrix)"""
+        return self.values[:, self._column_index[name]]
+
+    def rows_for_games(self, game_ids) -> np.ndarray:
+        """Matrix row per game id (-1 when the game is not in the export)"""
+        game_ids = np.asarray(game_ids, dtype=np.int64)
+        if len(self.game_ids) == 0:
+            return np.full(len(game_ids), -1)
+        rows = np.clip(np.searchsorted(self.game_ids, game_ids), 0, len(self.game_ids) - 1)
+        return np.where(self.game_ids[rows] == game_ids, rows, -1)
+
+    def frame(self, columns: Optional[Sequence[str]] = None, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """Selected columns (and rows) as a DataFrame with categoricals decoded"""
+        columns = list(columns or self.columns)
+        selected = self.values[:, [self._column_index[c] for c in columns]]
+        ids = self.game_ids
+        if rows is not None:
+            selected, ids = selected[rows], ids[rows]
+
+        frame = pd.DataFrame(np.asarray(selected), columns=columns)
+        for column in columns:
+            if column in self.categories:
+                codes = frame[column].fillna(-1).to_numpy(np.int64)
+                frame[column] = pd.Categorical.from_codes(codes, categories=self.categories[column])
+        frame.insert(0, 'id', ids)
+        return frame
+
+    def attach(self, games: pd.DataFrame, columns: Sequence[str]) -> Optional[pd.DataFrame]:
+        """
+        Overwrite columns on a games frame (keyed by id) from the export.
+        Returns None when any game is missing, so callers can rebuild instead.
+        """
+        rows = self.rows_for_games(games['id'].to_numpy())
+        if (rows < 0).any():
+            return None
+        features = self.frame(columns, rows)
+        games = games.copy()
+        for column in columns:
+            games[column] = features[column].to_numpy() if column not in self.categories \
+                else features[column].array
+        return games
+
+
+def load_feature_matrix(path: str = FEATURE_MATRIX_PATH, fingerprint: Optional[str] = None) -> Optional[FeatureMatrix]:
+    """
+    Open the exported feature matrix, returning None when it has not been
+    built or (given the current feature_data_fingerprint) was built from
+    different data or feature code
+    """
+    if not (os.path.exists(f"{path}.npy") and os.path.exists(f"{path}.npz")):
+        return None
+    try:
+        matrix = FeatureMatrix.load(path)
+    except Exception as e:
+        print(f"⚠️ Feature matrix unreadable, rebuilding from SQL: {e}")
+        return None
+    if fingerprint is not None and matrix.fingerprint != fingerprint:
+        print("⚠️ Feature matrix is stale (games, teams or feature code changed), rebuilding from SQL")
+        return None
+    return matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the per-game feature matrix")
+    parser.add_argument('--seasons', type=int, nargs='*', help="limit to these seasons (default: all)")
+    parser.add_argument('--output', default=FEATURE_MATRIX_PATH, help="output path without extension")
+    args = parser.parse_args()
+
+    from database_connection import get_database_connection
+
+    print("🧮 BUILDING FEATURE MATRIX")
+    print("=" * 50)
+    started = time.time()
+    conn = get_database_connection()
+    try:
+        fingerprint = feature_data_fingerprint(conn)
+        games = build_feature_frame(conn, args.seasons or None)
+    finally:
+        conn.close()
+
+    path = write_feature_matrix(games, args.output, fingerprint=fingerprint)
+    print(f"✅ {len(games)} games x {len(FEATURE_COLUMNS)} features written to {path}.npy/.npz "
+          f"in {time.time() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
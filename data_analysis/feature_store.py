@@ -0,0 +1,221 @@
+"""
+Point-in-Time Feature Store
+Resolves each team's pregame ELO, poll rank and conference as of any date,
+so historical games are scored with what was known before kickoff
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Sequence
+from conference_index import attach_season_conferences
+
+EPOCH = pd.Timestamp('1970-01-01', tz='UTC')
+
+
+def to_epoch_seconds(values) -> np.ndarray:
+    """Convert datetimes (naive values are treated as UTC) to int64 epoch seconds"""
+    stamps = pd.to_datetime(pd.Series(values), utc=True)
+    return ((stamps - EPOCH) // pd.Timedelta(seconds=1)).to_numpy(np.int64)
+
+
+def season_of(values) -> np.ndarray:
+    """College football season for each date (January and bowl-season games belong to the prior year)"""
+    stamps = pd.to_datetime(pd.Series(values), utc=True)
+    return (stamps.dt.year - (stamps.dt.month < 7)).to_numpy(np.int64)
+
+
+def _forward_fill_within_team(values: np.ndarray, group_start: np.ndarray) -> np.ndarray:
+    """Carry the last non-null value forward without crossing team boundaries"""
+    positions = np.arange(len(values))
+    last_valid = np.where(~np.isnan(values), positions, -1)
+    last_valid = np.maximum.accumulate(last_valid) if len(values) else last_valid
+    filled = np.full(len(values), np.nan)
+    usable = last_valid >= group_start
+    filled[usable] = values[last_valid[usable]]
+    return filled
+
+
+class AsOfFeatureStore:
+    """
+    Sorted per-team timelines of pregame snapshots taken from the games table.
+    Lookups are a single searchsorted over a (team, time) composite key, so any
+    batch of (team, date) pairs resolves in one vectorized call.
+    """
+
+    FEATURES = ('elo', 'rank', 'conference')
+
+    def __init__(self, games: pd.DataFrame):
+        """
+        Build timelines from a games frame with home/away team ids, start_date,
+        pregame/postgame ELO, weekly ranks, season and (optionally) conferences
+        """
+        n = len(games)
+        team_ids = np.concatenate([
+            games['home_team_id'].to_numpy(np.int64),
+            games['away_team_id'].to_numpy(np.int64)
+        ])
+        times = np.tile(to_epoch_seconds(games['start_date']), 2)
+
+        def both(home_col, away_col):
+            if home_col not in games or away_col not in games:
+                return np.full(2 * n, np.nan)
+            return np.concatenate([
+                pd.to_numeric(games[home_col], errors='coerce').to_numpy(np.float64),
+                pd.to_numeric(games[away_col], errors='coerce').to_numpy(np.float64)
+            ])
+
+        pregame = both('home_pregame_elo', 'away_pregame_elo')
+        postgame = both('home_postgame_elo', 'away_postgame_elo')
+        rank = both('home_team_rank', 'away_team_rank')
+        seasons = np.tile(games['season'].to_numpy(np.int64), 2)
+
+        if 'home_conf' in games and 'away_conf' in games:
+            conferences = pd.Categorical(np.concatenate([
+                games['home_conf'].to_numpy(object),
+                games['away_conf'].to_numpy(object)
+            ]))
+        else:
+            conferences = pd.Categorical([None] * (2 * n))
+
+        self.team_index = np.unique(team_ids)
+        codes = np.searchsorted(self.team_index, team_ids)
+        order = np.lexsort((times, codes))
+
+        self.codes = codes[order]
+        self.times = times[order]
+        self.seasons = seasons[order]
+        self.rank = rank[order]
+        self.conference_categories = conferences.categories
+        self.conference_codes = conferences.codes[order]
+
+        # Keys are team_code * span + (time - epoch); span leaves one spare slot
+        # above the latest observation so out-of-range queries can be clamped
+        self._epoch = int(self.times.min()) if len(self.times) else 0
+        self._span = (int(self.times.max()) - self._epoch + 2) if len(self.times) else 2
+        self.keys = self.codes * self._span + (self.times - self._epoch)
+
+        group_start = np.zeros(len(self.codes), dtype=np.int64)
+        if len(self.codes):
+            boundaries = np.flatnonzero(np.diff(self.codes)) + 1
+            group_start[boundaries] = boundaries
+            group_start = np.maximum.accumulate(group_start)
+        self._group_start = group_start
+
+        # ELO known at kickoff is the pregame value; once the game is over the
+        # postgame value (or the pregame one when postgame is missing) applies
+        self.pregame_elo = pregame[order]
+        settled = np.where(np.isnan(postgame[order]), self.pregame_elo, postgame[order])
+        self.settled_elo = _forward_fill_within_team(settled, group_start)
+
+    @classmethod
+    def from_connection(cls, conn, conference_index=None) -> 'AsOfFeatureStore':
+        """
+        Load every game's pregame snapshot from the database. Conferences come
+        from the season-aware conference index when CFBD data is available.
+        """
+        query = """
+        SELECT
+            g.id, g.season, g.start_date,
+            g.home_team_id, g.away_team_id,
+            g.home_pregame_elo, g.away_pregame_elo,
+            g.home_postgame_elo, g.away_postgame_elo,
+            g.home_team_rank, g.away_team_rank,
+            ht.name as home_team, at.name as away_team,
+            ht.conference as home_conf, at.conference as away_conf
+        FROM games g
+        JOIN teams ht ON g.home_team_id = ht.id
+        JOIN teams at ON g.away_team_id = at.id
+        WHERE g.start_date IS NOT NULL
+        """
+        games = attach_season_conferences(pd.read_sql(query, conn), conference_index)
+        store = cls(games)
+        print(f"🗂️ Feature store ready: {len(store.keys)} team-game snapshots for {len(store.team_index)} teams")
+        return store
+
+    def _locate(self, team_ids, query_times):
+        """Return (timeline index, found mask, exact-time mask) for each query"""
+        team_codes = np.searchsorted(self.team_index, team_ids)
+        team_codes = np.clip(team_codes, 0, len(self.team_index) - 1)
+        known_team = self.team_index[team_codes] == team_ids
+
+        offsets = np.clip(query_times - self._epoch, -1, self._span - 1)
+        idx = np.searchsorted(self.keys, team_codes * self._span + offsets, side='right') - 1
+        idx = np.clip(idx, 0, None)
+
+        found = known_team & (self.codes[idx] == team_codes) & (self.times[idx] <= query_times)
+        exact = found & (self.times[idx] == query_times)
+        return idx, found, exact
+
+    def lookup(self, team_ids, dates, seasons=None) -> pd.DataFrame:
+        """Resolve ELO, rank and conference for every (team_id, date) pair as of that date"""
+        team_ids = np.asarray(team_ids, dtype=np.int64)
+        query_times = to_epoch_seconds(dates)
+        if seasons is None:
+            seasons = season_of(dates)
+        seasons = np.asarray(seasons, dtype=np.int64)
+
+        if len(self.keys) == 0:
+            return pd.DataFrame({
+                'elo': np.full(len(team_ids), np.nan),
+                'rank': np.full(len(team_ids), np.nan),
+                'conference': pd.Categorical([None] * len(team_ids)),
+                'as_of': np.full(len(team_ids), -1, dtype=np.int64)
+            })
+
+        idx, found, exact = self._locate(team_ids, query_times)
+
+        # An exact match is the game itself: use its pregame ELO, falling back
+        # to what the team's previous game settled at
+        has_previous = idx > self._group_start[idx]
+        prior_settled = np.where(has_previous, self.settled_elo[np.clip(idx - 1, 0, None)], np.nan)
+        at_kickoff = np.where(np.isnan(self.pregame_elo[idx]), prior_settled, self.pregame_elo[idx])
+        elo = np.where(exact, at_kickoff, self.settled_elo[idx])
+        elo = np.where(found, elo, np.nan)
+
+        # Poll ranks only carry forward within the season they were published
+        same_season = found & (self.seasons[idx] == seasons)
+        rank = np.where(same_season, self.rank[idx], np.nan)
+
+        conference_codes = np.where(found, self.conference_codes[idx], -1)
+        conference = pd.Categorical.from_codes(conference_codes, categories=self.conference_categories)
+
+        return pd.DataFrame({
+            'elo': elo,
+            'rank': rank,
+            'conference': conference,
+            'as_of': np.where(found, self.times[idx], -1)
+        })
+
+    def attach(self, games: pd.DataFrame, features: Sequence[str] = FEATURES,
+               date_column: str = 'start_date') -> pd.DataFrame:
+        """
+        Overwrite home_/away_ elo, rank and conf columns with point-in-time values.
+        Expects home_team_id and away_team_id columns.
+        """
+        if len(games) == 0:
+            return games
+
+        games = games.copy()
+        seasons = games['season'].to_numpy() if 'season' in games else None
+        column_names = {'elo': 'elo', 'rank': 'rank', 'conference': 'conf'}
+        for side in ('home', 'away'):
+            resolved = self.lookup(games[f'{side}_team_id'].to_numpy(), games[date_column], seasons)
+            for feature in features:
+                if feature == 'conference':
+                    games[f'{side}_conf'] = resolved['conference'].array
+                else:
+                    games[f'{side}_{column_names[feature]}'] = resolved[feature].to_numpy(np.float64)
+        return games
+
+
+def load_feature_store(conn=None) -> AsOfFeatureStore:
+    """Build the as-of feature store, opening a connection when none is given"""
+    if conn is not None:
+        return AsOfFeatureStore.from_connection(conn)
+
+    from database_connection import get_database_connection
+    conn = get_database_connection()
+    try:
+        return AsOfFeatureStore.from_connection(conn)
+    finally:
+        conn.close()
@@ -0,0 +1,239 @@
+"""
+Incremental Slate Re-Scoring
+Keeps each upcoming game's inputs, factor contributions and picks from the
+previous run. A refresh diffs the new slate against them, recomputes only the
+factors whose inputs moved for the games that moved, and returns a delta of
+the picks that changed, so intraday line and forecast updates touch a handful
+of games instead of the whole slate. refresh_chunks does the same for a
+slate streamed in chunks, yielding each chunk's picks as soon as it is scored.
+"""
+
+import time
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Iterator, List
+from scoring_core import (
+    ComprehensiveScoringCore, FACTOR_INPUTS, FACTOR_METHODS, FACTOR_SCORE_METHODS, FACTOR_METADATA, PICK_INPUTS,
+    GAME_PREDICTION_INPUTS
+)
+from factor_contributions import FactorContributions
+
+FACTORS = list(FACTOR_METHODS)
+
+# A prediction counts as changed when any of these differ
+PICK_FIELDS = ['spread_pick', 'spread_confidence', 'total_pick', 'total_confidence']
+
+
+# Column positions of each factor's inputs (and the pick inputs) in GAME_PREDICTION_INPUTS
+FACTOR_INPUT_POSITIONS = [[GAME_PREDICTION_INPUTS.index(column) for column in FACTOR_INPUTS[factor]]
+                          for factor in FACTORS]
+PICK_INPUT_POSITIONS = [GAME_PREDICTION_INPUTS.index(column) for column in PICK_INPUTS]
+
+
+def normalized_inputs(games: pd.DataFrame) -> np.ndarray:
+    """
+    Games x GAME_PREDICTION_INPUTS object matrix with numbers as floats and
+    every missing value as None, so None == None and 7 == 7.0 compare equal.
+    Kept as a raw NumPy array; a DataFrame would turn None back into NaN.
+    """
+    values = np.full((len(games), len(GAME_PREDICTION_INPUTS)), None, dtype=object)
+    for j, column in enumerate(GAME_PREDICTION_INPUTS):
+        if column not in games:
+            continue
+        series = games[column]
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            values[:, j] = series.to_numpy(np.float64, na_value=np.nan)
+        else:
+            values[:, j] = series.to_numpy(object)
+        values[series.isna().to_numpy(), j] = None
+    return values
+
+
+def _moved(previous: np.ndarray, current: np.ndarray, positions: List[int]) -> np.ndarray:
+    return (previous[:, positions] != current[:, positions]).any(axis=1)
+
+
+class IncrementalSlate:
+    """Per-game factor contributions and picks for the current slate, updated on each refresh"""
+
+    def __init__(self, core: ComprehensiveScoringCore):
+        self.core = core
+        self.config_version = None
+        self.game_ids = pd.Index([])   # slate order from the last refresh
+        self.inputs = None             # normalized inputs per game, aligned with game_ids
+        self.factors = None            # contributions per game x FACTORS, aligned with game_ids
+        self.predictions: Dict = {}
+        self.note_codes: Dict = {}     # note_codes row per game, for render_notes
+        self.pending_note_codes: Dict = {}   # note codes of a refresh still streaming
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+    def current_predictions(self) -> List[Dict]:
+        """Copies of the predictions in slate order, notes included"""
+        return [dict(prediction) for prediction in
+                self.render_notes([self.predictions[game_id] for game_id in self.game_ids])]
+
+    def render_notes(self, predictions: List[Dict]) -> List[Dict]:
+        """Fill in rick_notes for picks scored without them (only games that are shown need the text)"""
+        for prediction in predictions:
+            if prediction['rick_notes'] is None:
+                game_id = prediction['game_id']
+                codes = self.pending_note_codes.get(game_id, self.note_codes.get(game_id))
+                prediction['rick_notes'] = self.core.notes_text(codes)
+        return predictions
+    
+    def contributions(self) -> FactorContributions:
+        """The kept factor contributions as a games x FACTORS matrix indexed by game id"""
+        values = self.factors.copy() if self.factors is not None else np.empty((0, len(FACTORS)))
+        return FactorContributions(values, FACTORS, self.game_ids.rename('game_id'), FACTOR_METADATA)
+
+    def refresh(self, games: pd.DataFrame) -> Dict:
+        """
+        Bring the slate up to date with a freshly loaded games frame.
+        Returns the delta (added, changed and removed picks) and how much
+        rescoring the refresh needed.
+        """
+        return combine_deltas(list(self.refresh_chunks([games])))
+
+    def refresh_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[Dict]:
+        """
+        refresh for a slate that arrives in chunks: each chunk is scored as
+        soon as it arrives and its delta yielded, with 'predictions' holding
+        all of the chunk's picks in slate order. Once the chunks run out a
+        last delta carries the removed games. The slate only switches to the
+        new games, picks and notes after the stream is fully consumed, so an
+        abandoned stream leaves the previous slate intact.
+        """
+        # New insights move every factor, so then nothing carries over; the
+        # old picks are still kept to diff against
+        carry_over = self.inputs is not None and self.config_version == self.core.config_version
+        previous_ids = set(self.game_ids)
+        seen = set()
+        game_ids, inputs, factors = [], [], []
+        predictions, note_codes = {}, {}
+
+        # Picks yielded mid-stream can still have their notes rendered
+        self.pending_note_codes = note_codes
+        try:
+            for games in chunks:
+                started = time.time()
+                games = games.drop_duplicates('id')
+                games = games[~games['id'].isin(seen)].reset_index(drop=True)
+                seen.update(games['id'])
+                delta, chunk_inputs, chunk_factors = self._score_chunk(
+                    games, previous_ids, carry_over, predictions, note_codes)
+                game_ids.append(games['id'].to_numpy())
+                inputs.append(chunk_inputs)
+                factors.append(chunk_factors)
+                delta['elapsed_ms'] = (time.time() - started) * 1000
+                yield delta
+        finally:
+            self.pending_note_codes = {}
+
+        started = time.time()
+        removed = [game_id for game_id in self.game_ids if game_id not in seen]
+        self.config_version = self.core.config_version
+        self.predictions = predictions
+        self.note_codes = note_codes
+        self.game_ids = pd.Index(np.concatenate(game_ids)) if game_ids else pd.Index([])
+        self.inputs = np.concatenate(inputs) if inputs else normalized_inputs(pd.DataFrame())
+        self.factors = np.concatenate(factors) if factors else np.empty((0, len(FACTORS)))
+        yield {
+            'added': [],
+            'changed': [],
+            'removed': removed,
+            'predictions': [],
+            'rescored_games': 0,
+            'factor_evaluations': 0,
+            'elapsed_ms': (time.time() - started) * 1000,
+        }
+
+    def _score_chunk(self, games: pd.DataFrame, previous_ids: set, carry_over: bool,
+                     predictions: Dict, note_codes: Dict):
+        """
+        Delta, normalized inputs and factor values for one chunk of the new
+        slate. The chunk's picks and note codes go into predictions and
+        note_codes; the kept slate is only read.
+        """
+        inputs = normalized_inputs(games)
+        game_ids = pd.Index(games['id'].to_numpy())
+
+        # Row of each game in the previous refresh (-1 for new games)
+        if carry_over:
+            previous_rows = self.game_ids.get_indexer(game_ids)
+        else:
+            previous_rows = np.full(len(games), -1)
+        known = previous_rows >= 0
+
+        # Rows x factors still to compute; new games need all of them
+        factor_values = np.full((len(games), len(FACTORS)), np.nan)
+        stale = np.ones((len(games), len(FACTORS)), dtype=bool)
+        rescore = np.ones(len(games), dtype=bool)
+        if known.any():
+            current = inputs[known]
+            previous = self.inputs[previous_rows[known]]
+            factor_values[known] = self.factors[previous_rows[known]]
+            stale[known] = np.column_stack([_moved(previous, current, positions)
+                                            for positions in FACTOR_INPUT_POSITIONS])
+            rescore[known] = stale[known].any(axis=1) | _moved(previous, current, PICK_INPUT_POSITIONS)
+
+        # One vectorized pass per factor over just the games where it went stale
+        for j, factor in enumerate(FACTORS):
+            stale_rows = np.flatnonzero(stale[:, j])
+            if len(stale_rows):
+                factor_values[stale_rows, j] = getattr(self.core, FACTOR_SCORE_METHODS[factor])(games.iloc[stale_rows])
+        evaluations = int(stale.sum())
+
+        # Picks for the rescored games at once; notes wait until a game is displayed
+        rows = np.flatnonzero(rescore)
+        rescored_games = games.iloc[rows]
+        rescored = self.core.predictions_from_scores(rescored_games, factor_values[rows], notes=False)
+        for game_id in game_ids[~rescore]:
+            predictions[game_id] = self.predictions[game_id]
+            note_codes[game_id] = self.note_codes[game_id]
+        note_codes.update(zip(game_ids[rows], map(tuple, self.core.note_codes(rescored_games).tolist())))
+
+        added, changed = [], []
+        for game_id, prediction in zip(game_ids[rows], rescored):
+            previous_prediction = self.predictions.get(game_id)
+            predictions[game_id] = prediction
+            if game_id not in previous_ids:
+                added.append(game_id)
+            elif any(previous_prediction[field] != prediction[field] for field in PICK_FIELDS):
+                changed.append(game_id)
+
+        # Probabilities and intervals for every rescored game in one vectorized pass
+        self.core.add_calibration(rescored)
+
+        # Copies, so callers editing a pick never alter the kept slate
+        chunk_predictions = {game_id: dict(predictions[game_id]) for game_id in game_ids}
+        delta = {
+            'added': [chunk_predictions[game_id] for game_id in added],
+            'changed': [chunk_predictions[game_id] for game_id in changed],
+            'removed': [],
+            'predictions': list(chunk_predictions.values()),
+            'rescored_games': int(rescore.sum()),
+            'factor_evaluations': evaluations,
+        }
+        return delta, inputs, factor_values
+
+
+def combine_deltas(deltas: List[Dict]) -> Dict:
+    """One delta for a whole refresh from its per-chunk deltas"""
+    return {
+        'added': [prediction for delta in deltas for prediction in delta['added']],
+        'changed': [prediction for delta in deltas for prediction in delta['changed']],
+        'removed': [game_id for delta in deltas for game_id in delta['removed']],
+        'predictions': [prediction for delta in deltas for prediction in delta['predictions']],
+        'rescored_games': sum(delta['rescored_games'] for delta in deltas),
+        'factor_evaluations': sum(delta['factor_evaluations'] for delta in deltas),
+        'elapsed_ms': sum(delta['elapsed_ms'] for delta in deltas),
+    }
+
+
+def format_slate_delta(delta: Dict) -> str:
+    """One-line summary of an IncrementalSlate.refresh delta"""
+    return (f"{len(delta['added'])} added, {len(delta['changed'])} changed, {len(delta['removed'])} removed "
+            f"({delta['rescored_games']} games rescored, {delta['factor_evaluations']} factor evaluations, "
+            f"{delta['elapsed_ms']:.1f} ms)")
@@ -0,0 +1,87 @@
+"""
+Historical Insights Cache
+The four hypothesis analyzers only produce new results when completed games
+change, so their combined insights dict is pickled to .cache and reused while
+the key matches. The key joins a fingerprint of the completed games (with
+their pregame ELO and ranks, plus the team names and conferences they are
+joined to) with a hash of the analyzer source code, so new results, rescored
+games or an edited analyzer all force a rerun; a ratings sync alone does not.
+"""
+
+import os
+import time
+import pickle
+import hashlib
+from typing import Dict, Optional
+from cfbd_cache import CACHE_DIR
+
+INSIGHTS_CACHE_PATH = os.path.join(CACHE_DIR, 'historical_insights.pkl')
+INSIGHTS_CACHE_VERSION = 1
+
+# Modules whose code shapes the insights: the analyzers and the helpers they import
+ANALYZER_MODULES = [
+    'weather_hypotheses', 'conference_hypotheses', 'betting_hypothesis_testing',
+    'elo_team_performance_analysis', 'conference_index', 'venue_dimension',
+    'kickoff_features', 'travel', 'analyzer_pool',
+]
+
+GAMES_FINGERPRINT_SQL = """
+SELECT
+    (SELECT count(*) FROM games g WHERE g.completed = true),
+    (SELECT md5(coalesce(string_agg(g::text, '|' ORDER BY g.id), ''))
+     FROM games g
+     WHERE g.completed = true AND g.home_team_score IS NOT NULL AND g.away_team_score IS NOT NULL),
+    (SELECT md5(coalesce(string_agg(concat_ws(',', t.id, t.name, t.conference), '|' ORDER BY t.id), ''))
+     FROM teams t)
+"""
+
+
+def analyzer_code_version() -> str:
+    """Hash of the analyzer source files"""
+    digest = hashlib.sha1(str(INSIGHTS_CACHE_VERSION).encode())
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for module in ANALYZER_MODULES:
+        path = os.path.join(directory, f'{module}.py')
+        digest.update(module.encode())
+        if os.path.exists(path):
+            with open(path, 'rb') as source:
+                digest.update(source.read())
+    return digest.hexdigest()[:12]
+
+
+def games_fingerprint(conn) -> str:
+    """Hash of every completed game row plus team names and conferences"""
+    with conn.cursor() as cursor:
+        cursor.execute(GAMES_FINGERPRINT_SQL)
+        completed, games_digest, teams_digest = cursor.fetchone()
+    return hashlib.sha1(f"{completed}:{games_digest}:{teams_digest}".encode()).hexdigest()[:16]
+
+
+def insights_key(conn) -> str:
+    return f"{games_fingerprint(conn)}-{analyzer_code_version()}"
+
+
+def load_cached_insights(key: str, path: str = INSIGHTS_CACHE_PATH) -> Optional[Dict]:
+    """The cached insights when they were stored under key, otherwise None"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as artifact:
+            payload = pickle.load(artifact)
+    except Exception as e:
+        print(f"⚠️ Insights cache unreadable, rerunning analyzers: {e}")
+        return None
+    if payload.get('key') != key:
+        return None
+    return payload['insights']
+
+
+def save_insights(insights: Dict, key: str, path: str = INSIGHTS_CACHE_PATH) -> str:
+    """Write the insights atomically under key"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as artifact:
+        pickle.dump({'key': key, 'created': time.time(), 'insights': insights}, artifact,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return path
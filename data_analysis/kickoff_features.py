@@ -0,0 +1,157 @@
+"""
+Kickoff Time Features
+Converts every kickoff to venue-local and Eastern time, assigns TV windows
+(noon / afternoon / prime / after dark), measures how far the away team's body
+clock is from local time and flags daylight saving and post-sunset kickoffs.
+Time-zone conversion runs once per distinct zone over whole columns.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional
+from travel import TravelMatrix, standard_utc_offsets
+
+EASTERN = 'America/New_York'
+
+# Windows are defined on Eastern kickoff hour, the way networks slot games;
+# anything from 10 PM ET through the early morning counts as after dark
+KICKOFF_WINDOWS = ['Noon', 'Afternoon', 'Prime', 'After Dark']
+WINDOW_EDGES_ET = [15, 19, 22]
+AFTER_DARK_BEFORE_ET = 6
+
+KICKOFF_FEATURES = [
+    'kickoff_local_hour', 'kickoff_et_hour', 'kickoff_window', 'local_dst',
+    'kickoff_after_sunset', 'away_body_clock_offset', 'away_body_clock_hour'
+]
+
+
+def _utc(values) -> pd.Series:
+    return pd.to_datetime(pd.Series(values).reset_index(drop=True), utc=True)
+
+
+def _hours(stamps: pd.Series) -> np.ndarray:
+    return (stamps.dt.hour + stamps.dt.minute / 60).to_numpy(np.float64)
+
+
+def local_times(start_dates, timezones) -> pd.DataFrame:
+    """
+    Local kickoff hour and actual UTC offset per game. Each distinct zone is
+    converted in a single tz_convert over its rows; games without a zone get NaN.
+    """
+    stamps = _utc(start_dates)
+    codes, zones = pd.factorize(pd.Series(timezones, dtype=object))
+    hours = np.full(len(stamps), np.nan)
+    offsets = np.full(len(stamps), np.nan)
+
+    naive_utc = stamps.dt.tz_localize(None)
+    for code, zone in enumerate(zones):
+        rows = np.flatnonzero(codes == code)
+        try:
+            local = stamps.iloc[rows].dt.tz_convert(zone)
+        except Exception:
+            continue
+        hours[rows] = _hours(local)
+        offsets[rows] = ((local.dt.tz_localize(None) - naive_utc.iloc[rows]) / pd.Timedelta(hours=1)).to_numpy()
+
+    return pd.DataFrame({'local_hour': hours, 'utc_offset': offsets})
+
+
+def kickoff_window_codes(et_hours) -> np.ndarray:
+    """Window code per Eastern kickoff hour (index into KICKOFF_WINDOWS, -1 when unknown)"""
+    et_hours = np.asarray(et_hours, dtype=np.float64)
+    codes = np.digitize(et_hours, WINDOW_EDGES_ET)
+    codes = np.where(et_hours < AFTER_DARK_BEFORE_ET, len(KICKOFF_WINDOWS) - 1, codes)
+    return np.where(np.isnan(et_hours), -1, codes).astype(np.int8)
+
+
+def sunset_local_hours(latitudes, longitudes, day_of_year, utc_offsets) -> np.ndarray:
+    """Approximate local sunset hour from the solar declination and equation of time"""
+    latitudes = np.radians(np.asarray(latitudes, dtype=np.float64))
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    day_of_year = np.asarray(day_of_year, dtype=np.float64)
+
+    declination = np.radians(23.44) * np.sin(2 * np.pi * (284 + day_of_year) / 365)
+    b = 2 * np.pi * (day_of_year - 81) / 364
+    equation_of_time = 9.87 * np.sin(2 * b) - 7.53 * np.cos(b) - 1.5 * np.sin(b)  # minutes
+
+    # Sun 0.833° below the horizon at sunset (refraction plus solar radius)
+    cos_hour_angle = (np.sin(np.radians(-0.833)) - np.sin(latitudes) * np.sin(declination)) / \
+        (np.cos(latitudes) * np.cos(declination))
+    hour_angle = np.degrees(np.arccos(np.clip(cos_hour_angle, -1, 1))) / 15
+
+    solar_noon_utc = 12 - longitudes / 15 - equation_of_time / 60
+    return solar_noon_utc + hour_angle + np.asarray(utc_offsets, dtype=np.float64)
+
+
+def build_kickoff_features(games: pd.DataFrame, travel_matrix: Optional[TravelMatrix] = None) -> pd.DataFrame:
+    """
+    Kickoff features for a games frame with start_date and, when joined from the
+    venue dimension, venue_timezone / venue_latitude / venue_longitude. Games
+    without a venue zone fall back to the home team's standard offset shifted
+    by Eastern daylight saving. Returns one row per game in frame order.
+    """
+    n = len(games)
+    stamps = _utc(games['start_date'])
+
+    eastern = stamps.dt.tz_convert(EASTERN)
+    et_hours = _hours(eastern)
+    et_offsets = ((eastern.dt.tz_localize(None) - stamps.dt.tz_localize(None)) / pd.Timedelta(hours=1)).to_numpy()
+    et_dst = et_offsets > standard_utc_offsets([EASTERN], [np.nan])[0]
+
+    zones = games['venue_timezone'].to_numpy(object) if 'venue_timezone' in games else np.full(n, None, dtype=object)
+    latitudes = games['venue_latitude'].to_numpy(np.float64) if 'venue_latitude' in games else np.full(n, np.nan)
+    longitudes = games['venue_longitude'].to_numpy(np.float64) if 'venue_longitude' in games else np.full(n, np.nan)
+    local = local_times(stamps, zones)
+    local_hours = local['local_hour'].to_numpy()
+    utc_offsets = local['utc_offset'].to_numpy()
+    standard = standard_utc_offsets(zones, longitudes)
+
+    home_standard = np.full(n, np.nan)
+    away_standard = np.full(n, np.nan)
+    if travel_matrix is not None and 'home_team' in games and 'away_team' in games:
+        home_codes = travel_matrix.codes(games['home_team'].to_numpy(object))
+        away_codes = travel_matrix.codes(games['away_team'].to_numpy(object))
+        home_standard = np.where(home_codes >= 0, travel_matrix.utc_offsets[home_codes], np.nan)
+        away_standard = np.where(away_codes >= 0, travel_matrix.utc_offsets[away_codes], np.nan)
+        # Campus coordinates stand in for venues missing from the dimension
+        latitudes = np.where(np.isnan(latitudes) & (home_codes >= 0), travel_matrix.latitudes[home_codes], latitudes)
+        longitudes = np.where(np.isnan(longitudes) & (home_codes >= 0), travel_matrix.longitudes[home_codes], longitudes)
+
+    # No venue zone: assume the home campus observes DST alongside the East
+    fallback_offsets = home_standard + et_dst
+    standard = np.where(np.isnan(standard), home_standard, standard)
+    utc_offsets = np.where(np.isnan(utc_offsets), fallback_offsets, utc_offsets)
+    utc_hours = _hours(stamps)
+    local_hours = np.where(np.isnan(local_hours), np.mod(utc_hours + fallback_offsets, 24), local_hours)
+
+    sunset = sunset_local_hours(latitudes, longitudes, stamps.dt.dayofyear.to_numpy(), utc_offsets)
+    # Evening kickoffs in UTC roll past midnight; compare on the local clock
+    after_sunset = np.where(np.isnan(sunset) | np.isnan(local_hours), False,
+                            (local_hours >= sunset) | (local_hours < AFTER_DARK_BEFORE_ET))
+
+    # Positive offset: the venue clock is ahead of the away team's home clock,
+    # which is taken to follow the same daylight saving calendar as the East
+    body_clock_offset = utc_offsets - (away_standard + et_dst)
+    body_clock_hour = np.mod(local_hours - body_clock_offset, 24)
+
+    window_codes = kickoff_window_codes(et_hours)
+    return pd.DataFrame({
+        'kickoff_local_hour': local_hours,
+        'kickoff_et_hour': et_hours,
+        'kickoff_window': pd.Categorical.from_codes(window_codes, categories=KICKOFF_WINDOWS),
+        'local_dst': np.where(np.isnan(utc_offsets), False, utc_offsets > standard),
+        'kickoff_after_sunset': after_sunset,
+        'away_body_clock_offset': body_clock_offset,
+        'away_body_clock_hour': body_clock_hour,
+    })
+
+
+def attach_kickoff_features(games: pd.DataFrame, travel_matrix: Optional[TravelMatrix] = None) -> pd.DataFrame:
+    """Add KICKOFF_FEATURES columns to a games frame"""
+    if len(games) == 0:
+        return games
+    features = build_kickoff_features(games, travel_matrix)
+    games = games.copy()
+    for column in KICKOFF_FEATURES:
+        games[column] = features[column].to_numpy() if column != 'kickoff_window' else features[column].array
+    return games
@@ -0,0 +1,101 @@
+"""
+Prediction Result Cache
+Bounded LRU memo for single-game predictions. Keys are a hash of the
+normalized scoring inputs plus the config version that scores them, so a
+changed line, forecast or config is a miss and everything else is served
+without rescoring. It sits in front of prediction_algorithm's
+generate_prediction; the comprehensive engine scores whole slates through
+incremental_slate, which already skips games whose inputs are unchanged.
+"""
+
+import json
+import math
+import hashlib
+import numbers
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from typing import Dict, Hashable
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def normalize_input(value):
+    """
+    Canonical JSON-safe form of one input: numpy and Python numbers compare
+    equal (7, 7.0 and np.float64(7) all become 7.0), missing values become None
+    """
+    if value is None:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, numbers.Real):
+        value = float(value)
+        return None if math.isnan(value) else value
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+def input_fingerprint(kind: str, config_version: str, inputs: Dict) -> str:
+    """Hash of the normalized inputs, the scoring path and the config version"""
+    payload = json.dumps(
+        [kind, config_version, sorted((name, normalize_input(value)) for name, value in inputs.items())],
+        separators=(',', ':')
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class PredictionCache:
+    """Thread-safe LRU of prediction results with hit/miss/eviction counters"""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable):
+        """Cached value or None; a hit moves the entry to most recently used"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
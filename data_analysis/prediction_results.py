@@ -0,0 +1,304 @@
+"""
+Prediction Results
+Struct-of-arrays container for scored games. Numeric outputs and factor codes
+live in NumPy columns; the prediction sentence, key factors and recommended bet
+are only rendered when a record's text is accessed, so bulk scoring allocates
+no strings.
+"""
+
+import numpy as np
+import pandas as pd
+from collections.abc import Mapping
+from typing import Dict, List, Optional
+from weather_kernel import ALGORITHM_PROFILE
+from conference_matrix import CONFERENCE_ADVANTAGE, MAJOR_MISMATCH
+from engine_config import EngineConfig
+from factor_contributions import FactorContributions
+
+CONFIDENCE_LEVELS = ['Low', 'Medium', 'High']
+
+# Commentary per weather bucket code (see weather_kernel.ALGORITHM_PROFILE)
+TEMPERATURE_NOTES = {
+    0: ("Freezing temps", "Reduced offensive efficiency"),
+    1: ("Cold weather", "Limited offensive impact"),
+    3: ("Hot weather", "Potential fatigue factor"),
+}
+WIND_NOTES = {
+    1: ("Moderate winds", "Some passing difficulty"),
+    2: ("High winds", "Passing game disrupted"),
+}
+
+# Per-game numeric outputs, in factor_breakdown order after the totals
+SCORE_COLUMNS = ['spread', 'base_spread', 'edge', 'vegas_line',
+                 'weather', 'conference', 'home_field', 'rest', 'betting_value']
+FACTOR_COLUMNS = ['weather', 'conference', 'home_field', 'rest', 'betting_value']
+
+# Every factor adds points to the predicted home margin (positive favors home)
+FACTOR_METADATA = {
+    'weather': {'category': 'Weather', 'description': "Temperature, wind, precipitation and dome points",
+                'sign': 'points toward home', 'spread_weight': 1.0, 'total_weight': 0.0},
+    'conference': {'category': 'Conference', 'description': "Conference power gap and Power 5 tier points",
+                   'sign': 'points toward home', 'spread_weight': 1.0, 'total_weight': 0.0},
+    'home_field': {'category': 'Home Field', 'description': "Home field advantage (zero at neutral sites)",
+                   'sign': 'points toward home', 'spread_weight': 1.0, 'total_weight': 0.0},
+    'rest': {'category': 'Rest', 'description': "Bye week and short week differential",
+             'sign': 'points toward home', 'spread_weight': 1.0, 'total_weight': 0.0},
+    'betting_value': {'category': 'Betting Line Value', 'description': "Bonus for disagreeing with the Vegas line",
+                      'sign': 'points toward home', 'spread_weight': 1.0, 'total_weight': 0.0},
+}
+
+# Present in scores only when the core has calibration tables (see calibration.py)
+PROBABILITY_COLUMNS = ['home_win_probability', 'home_cover_probability']
+INTERVAL_COLUMNS = ['margin_low_80', 'margin_high_80', 'margin_low_95', 'margin_high_95', 'margin_std']
+
+# Small-integer codes the explanations are rendered from:
+#   confidence          index into CONFIDENCE_LEVELS
+#   temperature, wind   weather kernel bucket codes; precipitation, dome flags
+#   conference_tier     +1 Power 5 host vs Group of 5, -1 the reverse, 0 neither
+#   conference_mismatch conference_matrix descriptor (none / advantage / major)
+#   rest_bye, rest_short +1 home side only, -1 away side only, 0 neither/both
+#   recommended         +1 take home, -1 take away, 0 no bet
+CODE_COLUMNS = ['confidence', 'temperature', 'wind', 'precipitation', 'dome', 'neutral',
+                'conference_tier', 'conference_mismatch', 'rest_bye', 'rest_short', 'recommended']
+
+# Raw inputs kept by reference for rendering text
+INPUT_COLUMNS = ['home_team', 'away_team', 'home_conference', 'away_conference',
+                 'temperature', 'wind_speed', 'home_rest_days', 'away_rest_days']
+
+
+class PredictionBatch:
+    """Column-oriented results for a batch of games; index a game to get a PredictionRecord"""
+
+    __slots__ = ('scores', 'codes', 'inputs', 'conference_differential', 'index', 'config')
+
+    def __init__(self, scores: Dict[str, np.ndarray], codes: Dict[str, np.ndarray],
+                 inputs: Dict[str, np.ndarray], conference_differential: np.ndarray, index=None,
+                 config: Optional[EngineConfig] = None):
+        self.scores = scores
+        self.codes = codes
+        self.inputs = inputs
+        self.conference_differential = conference_differential
+        self.index = index if index is not None else pd.RangeIndex(len(scores['spread']))
+        # The snapshot that scored the batch; text and version come from it
+        self.config = config or EngineConfig()
+
+    def __len__(self) -> int:
+        return len(self.scores['spread'])
+
+    def __getitem__(self, i: int) -> 'PredictionRecord':
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        return PredictionRecord(self, i % len(self))
+
+    def __iter__(self):
+        return (PredictionRecord(self, i) for i in range(len(self)))
+
+    @property
+    def config_version(self) -> str:
+        return self.config.version
+
+    @property
+    def spread(self) -> np.ndarray:
+        return self.scores['spread']
+
+    @property
+    def edge(self) -> np.ndarray:
+        return self.scores['edge']
+
+    @property
+    def confidence(self) -> np.ndarray:
+        return np.array(CONFIDENCE_LEVELS, dtype=object)[self.codes['confidence']]
+
+    def contributions(self) -> FactorContributions:
+        """Games x FACTOR_COLUMNS point contributions, aligned with the scored frame"""
+        values = np.column_stack([self.scores[column] for column in FACTOR_COLUMNS])
+        return FactorContributions(values, FACTOR_COLUMNS, self.index, FACTOR_METADATA)
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Numeric columns plus confidence and recommended side, aligned with the scored frame"""
+        recommended = self.codes['recommended']
+        frame = pd.DataFrame({column: self.scores[column] for column in SCORE_COLUMNS}, index=self.index)
+        frame.insert(1, 'confidence', self.confidence)
+        frame['recommended_side'] = pd.Series(
+            np.where(recommended > 0, 'home', np.where(recommended < 0, 'away', None)),
+            index=self.index, dtype=object
+        )
+        for column in PROBABILITY_COLUMNS + INTERVAL_COLUMNS:
+            if column in self.scores:
+                frame[column] = self.scores[column]
+        frame['config_version'] = self.config_version
+        return frame
+
+
+class PredictionRecord(Mapping):
+    """
+    One game's view into a PredictionBatch. Reads like the dict
+    generate_prediction used to return; text keys render on access.
+    """
+
+    __slots__ = ('batch', 'i')
+
+    KEYS = ('prediction', 'spread', 'confidence', 'key_factors', 'recommended_bet',
+            'vegas_line', 'edge', 'factor_breakdown', 'probabilities', 'intervals', 'config_version')
+
+    def __init__(self, batch: PredictionBatch, i: int):
+        self.batch = batch
+        self.i = i
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def to_dict(self) -> Dict:
+        """Plain dict with every field rendered (JSON-serializable)"""
+        return {key: getattr(self, key) for key in self.KEYS}
+
+    def _score(self, column: str) -> float:
+        return float(self.batch.scores[column][self.i])
+
+    def _code(self, column: str) -> int:
+        return int(self.batch.codes[column][self.i])
+
+    def _input(self, column: str):
+        return self.batch.inputs[column][self.i]
+
+    @property
+    def spread(self) -> float:
+        return self._score('spread')
+
+    @property
+    def config_version(self) -> str:
+        return self.batch.config_version
+
+    @property
+    def confidence(self) -> str:
+        return CONFIDENCE_LEVELS[self._code('confidence')]
+
+    @property
+    def vegas_line(self) -> Optional[float]:
+        vegas = self._score('vegas_line')
+        return None if np.isnan(vegas) else vegas
+
+    @property
+    def edge(self) -> Optional[float]:
+        edge = self._score('edge')
+        return None if np.isnan(edge) else edge
+
+    @property
+    def probabilities(self) -> Optional[Dict[str, Optional[float]]]:
+        """Calibrated home win / cover probabilities, or None when the batch has none"""
+        if PROBABILITY_COLUMNS[0] not in self.batch.scores:
+            return None
+        values = {column: self._score(column) for column in PROBABILITY_COLUMNS}
+        return {column: None if np.isnan(value) else value for column, value in values.items()}
+    
+    @property
+    def intervals(self) -> Optional[Dict]:
+        """80%/95% home margin intervals ([low, high]) and standard deviation, or None"""
+        if INTERVAL_COLUMNS[0] not in self.batch.scores:
+            return None
+        return {
+            'margin_80': [self._score('margin_low_80'), self._score('margin_high_80')],
+            'margin_95': [self._score('margin_low_95'), self._score('margin_high_95')],
+            'margin_std': self._score('margin_std'),
+        }
+    
+    @property
+    def factor_breakdown(self) -> Dict[str, float]:
+        return {column: self._score(column) for column in FACTOR_COLUMNS}
+
+    @property
+    def prediction(self) -> str:
+        spread = self.spread
+        team = self._input('home_team') if spread > 0 else self._input('away_team')
+        return f"{team} favored by {abs(spread):.1f} points"
+
+    @property
+    def recommended_bet(self) -> Optional[str]:
+        recommended = self._code('recommended')
+        if recommended == 0:
+            return None
+        return f"Take {self._input('home_team') if recommended > 0 else self._input('away_team')}"
+
+    @property
+    def key_factors(self) -> List[str]:
+        return (self._weather_text() + self._conference_text() + self._home_field_text() +
+                self._rest_text() + self._betting_text())
+
+    def _weather_text(self) -> List[str]:
+        if self._code('dome'):
+            return [f"Dome: Controlled climate favors offense ({ALGORITHM_PROFILE['dome_points']:+.1f})"]
+
+        text = []
+        temperature_points = np.append(ALGORITHM_PROFILE['temperature_points'], [0.0, 0.0])
+        wind_points = np.append(ALGORITHM_PROFILE['wind_points'], [0.0, 0.0])
+        temperature_code, wind_code = self._code('temperature'), self._code('wind')
+        if temperature_points[temperature_code]:
+            note = TEMPERATURE_NOTES[temperature_code]
+            text.append(f"{note[0]} ({self._input('temperature')}°F): {note[1]} "
+                        f"({temperature_points[temperature_code]:+.1f})")
+        if wind_points[wind_code]:
+            note = WIND_NOTES[wind_code]
+            text.append(f"{note[0]} ({self._input('wind_speed')} MPH): {note[1]} ({wind_points[wind_code]:+.1f})")
+        if self._code('precipitation'):
+            text.append(f"Precipitation: Ball handling challenges, favors ground game "
+                        f"({ALGORITHM_PROFILE['precipitation_points']:+.1f})")
+        return text
+
+    def _conference_text(self) -> List[str]:
+        text = []
+        differential = float(self.batch.conference_differential[self.i])
+        matchup = f"{self._input('home_conference')} vs {self._input('away_conference')}"
+        mismatch = self._code('conference_mismatch')
+        if mismatch == MAJOR_MISMATCH:
+            text.append(f"Major conference mismatch: {matchup} ({differential:+.1f})")
+        elif mismatch == CONFERENCE_ADVANTAGE:
+            text.append(f"Conference advantage: {matchup} ({differential:+.1f})")
+
+        tier = self._code('conference_tier')
+        tier_points = self.batch.config.thresholds['power5_tier_points']
+        if tier > 0:
+            text.append(f"Power 5 vs Group of 5: Historical 77.4% advantage ({tier_points:+.1f})")
+        elif tier < 0:
+            text.append(f"Group of 5 vs Power 5: Facing 77.4% disadvantage ({-tier_points:+.1f})")
+        return text
+
+    def _home_field_text(self) -> List[str]:
+        if self._code('neutral'):
+            return ["Neutral site: No home field advantage"]
+        return [f"Home field advantage: Traditional boost, but away teams cover 53.3% (+{self._score('home_field')})"]
+
+    def _rest_text(self) -> List[str]:
+        text = []
+        home_rest, away_rest = self._input('home_rest_days'), self._input('away_rest_days')
+        bye, short = self._code('rest_bye'), self._code('rest_short')
+        if bye > 0:
+            text.append(f"Home team off a bye ({home_rest:.0f} days rest) (+1.0)")
+        elif bye < 0:
+            text.append(f"Away team off a bye ({away_rest:.0f} days rest) (-1.0)")
+        if short > 0:
+            text.append(f"Home team on a short week ({home_rest:.0f} days rest) (-1.0)")
+        elif short < 0:
+            text.append(f"Away team on a short week ({away_rest:.0f} days rest) (+1.0)")
+        return text
+
+    def _betting_text(self) -> List[str]:
+        if self.vegas_line is None:
+            return ["No betting line available"]
+        betting_value = self._score('betting_value')
+        if not betting_value:
+            return []
+        base_spread = self._score('base_spread')
+        line_differential = abs(base_spread - self.vegas_line)
+        direction = 'undervaluing' if base_spread > self.vegas_line else 'overvaluing'
+        return [f"Vegas {direction} home team by {line_differential:.1f} points (+{betting_value:.1f})"]
@@ -0,0 +1,253 @@
+"""
+Prediction Service
+Long-lived local HTTP server around prediction_algorithm's engine. The
+process imports, loads the engine config and builds the lookup tables once,
+then answers requests from memory, so the Node server gets picks in
+milliseconds instead of spawning a cold Python process per request.
+
+Endpoints (JSON):
+    POST /predict        one game; generate_prediction keyword arguments
+    POST /predict/batch  {"games": [...], "text": true, "contributions": false} scored in
+                         one vectorized pass; contributions adds the games x factors matrix
+    GET  /health         status and engine config version
+    GET  /stats          request counts, p50/p99 latency per endpoint, cache stats
+
+Usage:
+    python prediction_service.py [--host 127.0.0.1] [--port 8765]
+    python prediction_service.py --socket /tmp/ricks_picks.sock
+"""
+
+import os
+import json
+import time
+import socket
+import argparse
+import threading
+import numpy as np
+import pandas as pd
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Dict
+from prediction_algorithm import RicksPicksPredictionEngine, PREDICTION_SIGNATURE
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+LATENCY_WINDOW = 10000
+MAX_BATCH_GAMES = 5000
+
+PREDICTION_ARGUMENTS = [name for name in PREDICTION_SIGNATURE.parameters if name != 'self']
+
+
+class LatencyTracker:
+    """Rolling request latencies per endpoint (the last LATENCY_WINDOW of each)"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, ok: bool = True):
+        with self._lock:
+            self._samples.setdefault(endpoint, deque(maxlen=self.window)).append(seconds)
+            self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+            if not ok:
+                self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+
+    def summary(self) -> Dict:
+        with self._lock:
+            snapshot = {endpoint: np.array(samples) for endpoint, samples in self._samples.items()}
+            counts, errors = dict(self._counts), dict(self._errors)
+        summary = {}
+        for endpoint, samples in snapshot.items():
+            p50, p99 = np.percentile(samples, [50, 99]) * 1000
+            summary[endpoint] = {
+                'requests': counts[endpoint],
+                'errors': errors.get(endpoint, 0),
+                'p50_ms': round(float(p50), 3),
+                'p99_ms': round(float(p99), 3),
+                'max_ms': round(float(samples.max()) * 1000, 3),
+            }
+        return summary
+
+
+class PredictionService:
+    """Request handling independent of the transport, so HTTP and Unix sockets share it"""
+
+    def __init__(self, engine: RicksPicksPredictionEngine):
+        self.engine = engine
+        self.latency = LatencyTracker()
+        self.started = time.time()
+
+    def predict(self, payload: Dict) -> Dict:
+        unknown = set(payload) - set(PREDICTION_ARGUMENTS)
+        if unknown:
+            raise ValueError(f"unknown fields: {', '.join(sorted(unknown))}")
+        return self.engine.generate_prediction(**payload).to_dict()
+
+    def predict_batch(self, payload: Dict) -> Dict:
+        games = payload.get('games')
+        if not isinstance(games, list):
+            raise ValueError("body must contain a 'games' list")
+        if len(games) > MAX_BATCH_GAMES:
+            raise ValueError(f"batch of {len(games)} games exceeds {MAX_BATCH_GAMES}")
+
+        batch = self.engine.generate_predictions(pd.DataFrame(games))
+        if payload.get('text', True):
+            predictions = [record.to_dict() for record in batch]
+        else:
+            # Numbers only: skips rendering the prediction text and key factors
+            predictions = json.loads(batch.to_frame().to_json(orient='records'))
+        response = {'config_version': batch.config_version, 'predictions': predictions}
+        if payload.get('contributions', False):
+            contributions = batch.contributions()
+            response['contributions'] = {
+                'factors': contributions.factors,
+                'metadata': contributions.metadata,
+                'values': contributions.values.tolist(),
+            }
+        return response
+
+    def health(self) -> Dict:
+        return {
+            'status': 'ok',
+            'config_version': self.engine.config_version,
+            'uptime_seconds': round(time.time() - self.started, 1),
+        }
+
+    def stats(self) -> Dict:
+        cache = self.engine.prediction_cache
+        return {
+            **self.health(),
+            'latency': self.latency.summary(),
+            'prediction_cache': cache.stats() if cache is not None else None,
+        }
+
+    def routes(self):
+        return {
+            ('POST', '/predict'): self.predict,
+            ('POST', '/predict/batch'): self.predict_batch,
+            ('GET', '/health'): lambda payload: self.health(),
+            ('GET', '/stats'): lambda payload: self.stats(),
+        }
+
+
+class PredictionRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'RicksPicksPredictionService/1.0'
+    protocol_version = 'HTTP/1.1'    # keep-alive, so clients reuse one connection
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def _dispatch(self, method: str):
+        started = time.perf_counter()
+        path = self.path.split('?', 1)[0].rstrip('/') or '/'
+        handler = self.server.service.routes().get((method, path))
+        status, body = 200, None
+
+        # Read the whole body before routing so a kept-alive connection is
+        # positioned at the next request whatever this one's outcome
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = None
+        if length is None or length < 0 or 'Transfer-Encoding' in self.headers:
+            # The body cannot be framed, so the connection cannot be reused
+            self.close_connection = True
+            handler, status, body = None, 400, {'error': "request body needs a valid Content-Length"}
+        else:
+            raw = self.rfile.read(length) if length else b''
+            if handler is None:
+                status, body = 404, {'error': f"no route for {method} {path}"}
+            else:
+                try:
+                    payload = json.loads(raw or b'{}')
+                    body = handler(payload)
+                except (ValueError, TypeError) as e:
+                    status, body = 400, {'error': str(e)}
+                except Exception as e:
+                    status, body = 500, {'error': f"{type(e).__name__}: {e}"}
+
+        encoded = json.dumps(body, default=_json_default).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(encoded)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(encoded)
+        if handler is not None:
+            self.server.service.latency.record(f"{method} {path}", time.perf_counter() - started, status < 400)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no host/port
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        # Per-request logging would dominate latency; /stats has the numbers
+        pass
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(engine: RicksPicksPredictionEngine, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+          socket_path: str = None):
+    """Serve until interrupted; a socket_path listens on a Unix socket instead of TCP"""
+    service = PredictionService(engine)
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, PredictionRequestHandler)
+        where = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, port), PredictionRequestHandler)
+        server.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        where = f"http://{host}:{port}"
+    server.service = service
+
+    print(f"🚀 Prediction service on {where} (engine config {engine.config_version})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Prediction service stopping")
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+    return service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Rick's Picks predictions from a warm process")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--socket', help="listen on this Unix socket path instead of TCP")
+    parser.add_argument('--no-watch-config', action='store_true', help="do not hot-reload engine_config.json")
+    args = parser.parse_args()
+
+    engine = RicksPicksPredictionEngine()
+    if not args.no_watch_config:
+        engine.watch_config()
+    # First call pays the one-time pandas/NumPy warm-up before traffic arrives
+    engine.generate_predictions(pd.DataFrame([{'home_team': 'A', 'away_team': 'B'}]))
+    try:
+        serve(engine, args.host, args.port, args.socket)
+    finally:
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
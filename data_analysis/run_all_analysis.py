@@ -7,10 +7,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from weather_hypotheses import WeatherHypothesesAnalyzer
-from conference_hypotheses import ConferenceHypothesesAnalyzer  
-from betting_hypothesis_testing import BettingHypothesesAnalyzer
-from elo_team_performance_analysis import ELOTeamPerformanceAnalyzer
+from database_connection import get_database_connection
+from analyzer_pool import load_games_snapshot, run_analyzers
+from insights_cache import insights_key, save_insights
 from comprehensive_prediction_system import RicksPicksPredictionEngine
 import warnings
 warnings.filterwarnings('ignore')
@@ -24,49 +23,25 @@ def run_complete_analysis():
     
     results = {}
     
+    conn = None
     try:
-        # 1. Weather Analysis
-        print("\n1️⃣ WEATHER HYPOTHESES ANALYSIS")
-        print("-" * 40)
-        weather_analyzer = WeatherHypothesesAnalyzer()
-        results['weather'] = weather_analyzer.run_comprehensive_weather_analysis()
-        
-    except Exception as e:
-        print(f"Weather analysis error: {e}")
-        results['weather'] = None
-        
-    try:
-        # 2. Conference Analysis  
-        print("\n2️⃣ CONFERENCE PERFORMANCE ANALYSIS")
-        print("-" * 40)
-        conference_analyzer = ConferenceHypothesesAnalyzer()
-        results['conferences'] = conference_analyzer.run_comprehensive_conference_analysis()
-        
-    except Exception as e:
-        print(f"Conference analysis error: {e}")
-        results['conferences'] = None
+        # 1-4. Weather, conference, betting and ELO analyzers, run concurrently
+        # on one games snapshot; a failing analyzer is reported and left as None
+        conn = get_database_connection()
+        key = insights_key(conn)
+        results.update(run_analyzers(load_games_snapshot(conn), headings=True))
         
-    try:
-        # 3. Betting Market Analysis
-        print("\n3️⃣ BETTING MARKET EFFICIENCY ANALYSIS")
-        print("-" * 40)
-        betting_analyzer = BettingHypothesesAnalyzer()
-        results['betting'] = betting_analyzer.run_comprehensive_betting_analysis()
-        
-    except Exception as e:
-        print(f"Betting analysis error: {e}")
-        results['betting'] = None
-        
-    try:
-        # 4. ELO & Team Performance
-        print("\n4️⃣ ELO & TEAM PERFORMANCE ANALYSIS")
-        print("-" * 40)
-        elo_analyzer = ELOTeamPerformanceAnalyzer()
-        results['elo'] = elo_analyzer.run_comprehensive_analysis()
+        # Lets the prediction engine below reuse these instead of rerunning them
+        if all(results[name] is not None for name in ('weather', 'conferences', 'betting', 'elo')):
+            save_insights(results, key)
         
     except Exception as e:
-        print(f"ELO analysis error: {e}")
-        results['elo'] = None
+        print(f"Historical analysis error: {e}")
+        for name in ('weather', 'conferences', 'betting', 'elo'):
+            results.setdefault(name, None)
+    finally:
+        if conn is not None:
+            conn.close()
         
     try:
         # 5. Generate Predictions
@@ -0,0 +1,138 @@
+"""
+Rest and Schedule Density Features
+Days of rest, bye weeks, short weeks, road streaks and recent game load for
+both teams in every game, computed in one pass over per-team sorted arrays.
+Days of rest count calendar days at the venue (Eastern when the venue's zone
+is unknown), so a late Saturday kickoff is still a Saturday game.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+from feature_store import to_epoch_seconds
+from kickoff_features import EASTERN, local_times
+
+SECONDS_PER_DAY = 86400
+BYE_MIN_DAYS = 13          # a skipped Saturday leaves two weeks between games
+SHORT_WEEK_MAX_DAYS = 5    # Thursday/Friday games after a Saturday
+DENSITY_WINDOW_DAYS = 21
+
+REST_FEATURES = ['days_rest', 'off_bye', 'short_week', 'road_streak', 'games_last_window']
+
+
+def local_epoch_days(start_dates, timezones=None) -> np.ndarray:
+    """
+    Local calendar date of each kickoff as days since the epoch. timezones
+    holds each venue's zone; missing zones (or none given) use Eastern.
+    """
+    seconds = to_epoch_seconds(start_dates)
+    zones = pd.Series(timezones if timezones is not None else [None] * len(seconds), dtype=object)
+    zones = zones.where(zones.notna(), EASTERN).to_numpy(object)
+    offsets = local_times(start_dates, zones)['utc_offset'].to_numpy(np.float64)
+    if np.isnan(offsets).any():
+        # Unrecognized zone names fall back to Eastern too
+        eastern = local_times(start_dates, [EASTERN] * len(seconds))['utc_offset'].to_numpy(np.float64)
+        offsets = np.where(np.isnan(offsets), eastern, offsets)
+    return (seconds + np.round(offsets * 3600).astype(np.int64)) // SECONDS_PER_DAY
+
+
+def build_rest_features(schedule: pd.DataFrame, window_days: int = DENSITY_WINDOW_DAYS) -> pd.DataFrame:
+    """
+    Compute rest features for every game in a schedule frame with id, season,
+    start_date, home_team_id, away_team_id and (optionally) is_neutral_site
+    and venue_timezone. Returns one row per game id with home_* and away_*
+    feature columns.
+    """
+    n = len(schedule)
+    game_ids = schedule['id'].to_numpy()
+    teams = np.concatenate([
+        schedule['home_team_id'].to_numpy(np.int64),
+        schedule['away_team_id'].to_numpy(np.int64)
+    ])
+    times = np.tile(to_epoch_seconds(schedule['start_date']), 2)
+    local_days = np.tile(local_epoch_days(schedule['start_date'], schedule.get('venue_timezone')), 2)
+    seasons = np.tile(schedule['season'].to_numpy(np.int64), 2)
+    neutral = schedule['is_neutral_site'].eq(True).to_numpy() if 'is_neutral_site' in schedule else np.zeros(n, bool)
+    # Neutral sites count as time away from campus for both teams
+    on_road = np.concatenate([neutral, np.ones(n, dtype=bool)])
+
+    order = np.lexsort((times, seasons, teams))
+    teams, times, seasons, on_road = teams[order], times[order], seasons[order], on_road[order]
+    days = local_days[order]
+    positions = np.arange(2 * n)
+
+    # A segment is one team's season; rest and streaks reset at its start
+    segment_start = np.ones(2 * n, dtype=bool)
+    segment_start[1:] = (teams[1:] != teams[:-1]) | (seasons[1:] != seasons[:-1])
+
+    days_rest = np.full(2 * n, np.nan)
+    continuing = ~segment_start
+    days_rest[continuing] = (days[1:] - days[:-1])[continuing[1:]]
+
+    off_bye = days_rest >= BYE_MIN_DAYS
+    short_week = days_rest <= SHORT_WEEK_MAX_DAYS
+
+    # Consecutive road games ending with this one (0 when playing at home)
+    reset_at = np.where(~on_road, positions, -1)
+    reset_at = np.where(segment_start & on_road, positions - 1, reset_at)
+    road_streak = positions - np.maximum.accumulate(reset_at)
+
+    # Games the team played in the trailing window before this kickoff
+    _, team_codes = np.unique(teams, return_inverse=True)
+    window = window_days * SECONDS_PER_DAY
+    base = times.min() - window if len(times) else 0
+    span = (times.max() - base + 1) if len(times) else 1
+    keys = team_codes * span + (times - base)
+    window_open = np.searchsorted(keys, keys - window, side='left')
+    games_last_window = positions - window_open
+
+    per_entry = pd.DataFrame({
+        'days_rest': days_rest,
+        'off_bye': off_bye,
+        'short_week': short_week,
+        'road_streak': road_streak,
+        'games_last_window': games_last_window
+    })
+    # Undo the sort: entry k < n is the home side of game k, k >= n the away side
+    unsorted = per_entry.set_axis(order).sort_index()
+
+    features = pd.DataFrame({'id': game_ids})
+    for column in REST_FEATURES:
+        values = unsorted[column].to_numpy()
+        features[f'home_{column}'] = values[:n]
+        features[f'away_{column}'] = values[n:]
+    features['rest_advantage'] = features['home_days_rest'] - features['away_days_rest']
+    return features
+
+
+def load_schedule(conn, seasons: Optional[Sequence[int]] = None) -> pd.DataFrame:
+    """Load the game schedule (completed and upcoming) needed to compute rest features"""
+    query = """
+    SELECT g.id, g.season, g.start_date, g.home_team_id, g.away_team_id, g.is_neutral_site
+    FROM games g
+    WHERE g.start_date IS NOT NULL
+    """
+    params = None
+    if seasons is not None:
+        query += " AND g.season = ANY(%s)"
+        params = ([int(season) for season in seasons],)
+    return pd.read_sql(query, conn, params=params)
+
+
+def attach_rest_features(games: pd.DataFrame, conn=None, schedule: Optional[pd.DataFrame] = None,
+                         features: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Add rest feature columns to a games frame keyed by id. Features are computed
+    over the full schedule of the games' seasons so sampled frames still see
+    every prior game. Callers attaching many frames from one schedule can pass
+    its build_rest_features table as features to skip recomputing it.
+    """
+    if len(games) == 0:
+        return games
+    if features is None:
+        if schedule is None:
+            schedule = load_schedule(conn, sorted(games['season'].unique()))
+        features = build_rest_features(schedule)
+
+    games = games.drop(columns=[c for c in features.columns if c != 'id' and c in games])
+    return games.merge(features, on='id', how='left')
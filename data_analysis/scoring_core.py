@@ -0,0 +1,965 @@
+"""
+Pure Scoring Cores
+Stateless, picklable scoring logic for both prediction engines: ratings,
+weights and lookup tables only, no database connections. Worker processes
+receive a core cheaply (or inherit it through fork) so backtests, parameter
+sweeps and Monte Carlo runs can fan out across every CPU.
+"""
+
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from schedule_features import BYE_MIN_DAYS, SHORT_WEEK_MAX_DAYS
+from weather_kernel import ALGORITHM_PROFILE, COMPREHENSIVE_PROFILE, weather_codes, weather_points, weather_adjustment
+from conference_matrix import CONFERENCE_ADVANTAGE, MAJOR_MISMATCH
+from engine_config import EngineConfig
+from calibration import CalibrationTables
+from factor_contributions import FactorContributions
+from prediction_results import (
+    PredictionBatch, PredictionRecord, TEMPERATURE_NOTES, WIND_NOTES, INPUT_COLUMNS
+)
+
+# Frame columns generate_predictions reads for each generate_prediction
+# argument, in order of preference
+PREDICTION_INPUT_COLUMNS = {
+    'home_team': ('home_team',),
+    'away_team': ('away_team',),
+    'home_conference': ('home_conference', 'home_conf'),
+    'away_conference': ('away_conference', 'away_conf'),
+    'temperature': ('temperature',),
+    'wind_speed': ('wind_speed',),
+    'is_dome': ('is_dome',),
+    'vegas_spread': ('vegas_spread', 'spread'),
+    'precipitation': ('precipitation',),
+    'is_neutral_site': ('is_neutral_site',),
+    'home_rest_days': ('home_rest_days', 'home_days_rest'),
+    'away_rest_days': ('away_rest_days', 'away_days_rest'),
+}
+
+
+class ScoringCore:
+    """
+    Points-system scoring from prediction_algorithm, with scalar and batch
+    paths. Weights, ratings, thresholds and the conference matchup matrix come
+    from one EngineConfig snapshot held in self.config. With calibration
+    tables, batches also carry calibrated win and cover probabilities and
+    margin intervals.
+    """
+    
+    def __init__(self, conference_power_ratings: Optional[Dict[str, float]] = None,
+                 scoring_weights: Optional[Dict[str, float]] = None,
+                 config: Optional[EngineConfig] = None,
+                 calibration: Optional[CalibrationTables] = None):
+        config = config or EngineConfig()
+        if conference_power_ratings is not None or scoring_weights is not None:
+            config = config.replace(
+                conference_power_ratings=dict(conference_power_ratings or config.conference_power_ratings),
+                scoring_weights=dict(scoring_weights or config.scoring_weights)
+            )
+        self.config = config
+        self.calibration = calibration
+    
+    @property
+    def conference_power_ratings(self) -> Dict[str, float]:
+        return self.config.conference_power_ratings
+    
+    @conference_power_ratings.setter
+    def conference_power_ratings(self, ratings: Dict[str, float]):
+        """Assigning new ratings swaps in a new config snapshot (mutate a copy, then assign)"""
+        self.config = self.config.replace(conference_power_ratings=ratings)
+    
+    @property
+    def scoring_weights(self) -> Dict[str, float]:
+        return self.config.scoring_weights
+    
+    @scoring_weights.setter
+    def scoring_weights(self, weights: Dict[str, float]):
+        self.config = self.config.replace(scoring_weights=weights)
+    
+    @property
+    def conference_matrix(self):
+        return self.config.conference_matrix
+    
+    @property
+    def config_version(self) -> str:
+        return self.config.version
+    
+    def calculate_weather_factor(self, temperature: Optional[float], wind_speed: Optional[float], 
+                               is_dome: bool, precipitation: Optional[float] = None) -> Dict:
+        """
+        Calculate weather impact based on our dome/outdoor analysis
+        Dome games average 7.9 more points, wind >15 MPH reduces scoring by 1.7 points
+        """
+        codes = weather_codes(temperature, wind_speed, precipitation, is_dome, profile=ALGORITHM_PROFILE)
+        points = weather_points(codes, ALGORITHM_PROFILE)
+        factor_score = float(points['total'][0])
+        
+        impact_description = []
+        if points['dome'][0]:
+            impact_description.append(f"Dome: Controlled climate favors offense ({points['dome'][0]:+.1f})")
+        if points['temperature'][0]:
+            note = TEMPERATURE_NOTES[codes['temperature'][0]]
+            impact_description.append(f"{note[0]} ({temperature}°F): {note[1]} ({points['temperature'][0]:+.1f})")
+        if points['wind'][0]:
+            note = WIND_NOTES[codes['wind'][0]]
+            impact_description.append(f"{note[0]} ({wind_speed} MPH): {note[1]} ({points['wind'][0]:+.1f})")
+        if points['precipitation'][0]:
+            impact_description.append(
+                f"Precipitation: Ball handling challenges, favors ground game ({points['precipitation'][0]:+.1f})"
+            )
+        
+        return {
+            'score': factor_score,
+            'impact': impact_description,
+            'category': 'Weather Impact'
+        }
+    
+    def calculate_conference_factor(self, home_conference: str, away_conference: str) -> Dict:
+        """
+        Conference strength differential based on our Power 5 vs G5 analysis
+        SEC leads with +5.7 differential, Power 5 beats G5 77.4% of time
+        """
+        score, differential, tier, mismatch = (
+            values[0] for values in self.conference_matrix.lookup([home_conference], [away_conference])
+        )
+        factor_score = float(score)
+        tier_points = self.config.thresholds['power5_tier_points']
+        
+        impact_description = []
+        if mismatch == MAJOR_MISMATCH:
+            impact_description.append(f"Major conference mismatch: {home_conference} vs {away_conference} ({differential:+.1f})")
+        elif mismatch == CONFERENCE_ADVANTAGE:
+            impact_description.append(f"Conference advantage: {home_conference} vs {away_conference} ({differential:+.1f})")
+        
+        # Power 5 vs Group of 5 bonus
+        if tier > 0:
+            impact_description.append(f"Power 5 vs Group of 5: Historical 77.4% advantage ({tier_points:+.1f})")
+        elif tier < 0:
+            impact_description.append(f"Group of 5 vs Power 5: Facing 77.4% disadvantage ({-tier_points:+.1f})")
+        
+        return {
+            'score': factor_score,
+            'impact': impact_description,
+            'category': 'Conference Strength'
+        }
+    
+    def calculate_home_field_factor(self, is_neutral_site: bool = False) -> Dict:
+        """
+        Home field advantage calculation
+        Our data shows away teams cover 53.3% vs 46.7%, suggesting declining home advantage
+        """
+        if is_neutral_site:
+            return {
+                'score': 0,
+                'impact': ["Neutral site: No home field advantage"],
+                'category': 'Home Field'
+            }
+        
+        # Traditional home field is worth about 2.5-3 points, but our data suggests it's declining
+        factor_score = self.config.thresholds['home_field_points']  # Reduced from traditional 3 points
+        
+        return {
+            'score': factor_score,
+            'impact': [f"Home field advantage: Traditional boost, but away teams cover 53.3% (+{factor_score})"],
+            'category': 'Home Field'
+        }
+    
+    def calculate_rest_factor(self, home_rest_days: Optional[float] = None,
+                              away_rest_days: Optional[float] = None) -> Dict:
+        """
+        Rest differential from the schedule features
+        Coming off a bye is worth about a point; a short week costs about one
+        """
+        if home_rest_days is None or away_rest_days is None or \
+           pd.isna(home_rest_days) or pd.isna(away_rest_days):
+            return {
+                'score': 0,
+                'impact': [],
+                'category': 'Rest'
+            }
+        
+        factor_score = 0
+        impact_description = []
+        
+        home_bye = home_rest_days >= BYE_MIN_DAYS
+        away_bye = away_rest_days >= BYE_MIN_DAYS
+        if home_bye and not away_bye:
+            factor_score += 1.0
+            impact_description.append(f"Home team off a bye ({home_rest_days:.0f} days rest) (+1.0)")
+        elif away_bye and not home_bye:
+            factor_score -= 1.0
+            impact_description.append(f"Away team off a bye ({away_rest_days:.0f} days rest) (-1.0)")
+        
+        home_short = home_rest_days <= SHORT_WEEK_MAX_DAYS
+        away_short = away_rest_days <= SHORT_WEEK_MAX_DAYS
+        if home_short and not away_short:
+            factor_score -= 1.0
+            impact_description.append(f"Home team on a short week ({home_rest_days:.0f} days rest) (-1.0)")
+        elif away_short and not home_short:
+            factor_score += 1.0
+            impact_description.append(f"Away team on a short week ({away_rest_days:.0f} days rest) (+1.0)")
+        
+        return {
+            'score': factor_score,
+            'impact': impact_description,
+            'category': 'Rest'
+        }
+    
+    def calculate_betting_line_value(self, vegas_spread: Optional[float], 
+                                   predicted_spread: float) -> Dict:
+        """
+        Identify betting value based on our prediction vs Vegas line
+        34% of games have 14+ point errors, showing Vegas inefficiencies
+        """
+        if vegas_spread is None:
+            return {
+                'score': 0,
+                'impact': ["No betting line available"],
+                'category': 'Betting Value'
+            }
+        
+        thresholds = self.config.thresholds
+        line_differential = abs(predicted_spread - vegas_spread)
+        factor_score = 0
+        impact_description = []
+        
+        if line_differential >= thresholds['betting_min_differential']:
+            factor_score = min(line_differential * thresholds['betting_value_rate'],
+                               thresholds['betting_value_cap'])
+            if predicted_spread > vegas_spread:
+                impact_description.append(f"Vegas undervaluing home team by {line_differential:.1f} points (+{factor_score:.1f})")
+            else:
+                impact_description.append(f"Vegas overvaluing home team by {line_differential:.1f} points (+{factor_score:.1f})")
+        
+        return {
+            'score': factor_score,
+            'impact': impact_description,
+            'category': 'Betting Line Value'
+        }
+    
+    def generate_prediction(self, home_team: str, away_team: str, 
+                          home_conference: str, away_conference: str,
+                          temperature: Optional[float] = None,
+                          wind_speed: Optional[float] = None,
+                          is_dome: bool = False,
+                          vegas_spread: Optional[float] = None,
+                          precipitation: Optional[float] = None,
+                          is_neutral_site: bool = False,
+                          home_rest_days: Optional[float] = None,
+                          away_rest_days: Optional[float] = None) -> PredictionRecord:
+        """
+        Generate comprehensive prediction with point-based scoring system
+        Scores through the batch path; the record reads like a dict and only
+        renders its prediction text and key factors when they are accessed
+        """
+        inputs = {
+            'home_team': home_team, 'away_team': away_team,
+            'home_conference': home_conference, 'away_conference': away_conference,
+            'temperature': temperature, 'wind_speed': wind_speed, 'is_dome': is_dome,
+            'vegas_spread': vegas_spread, 'precipitation': precipitation,
+            'is_neutral_site': is_neutral_site,
+            'home_rest_days': home_rest_days, 'away_rest_days': away_rest_days
+        }
+        columns = {name: np.array([value], dtype=object) for name, value in inputs.items()}
+        return self._score_columns(columns, 1)[0]
+    
+    # Vectorized scoring: each method mirrors its scalar calculate_* counterpart
+    # over whole columns and returns the factor scores as a float array
+    
+    def weather_scores(self, temperature, wind_speed, is_dome, precipitation=None) -> np.ndarray:
+        """Weather factor score per game"""
+        codes = weather_codes(temperature, wind_speed, precipitation, is_dome, profile=ALGORITHM_PROFILE)
+        return weather_points(codes, ALGORITHM_PROFILE)['total']
+    
+    def conference_scores(self, home_conferences, away_conferences) -> np.ndarray:
+        """Conference strength factor score per game, one matrix lookup each"""
+        return self.conference_matrix.lookup(home_conferences, away_conferences)[0]
+    
+    def home_field_scores(self, is_neutral_site, config: Optional[EngineConfig] = None) -> np.ndarray:
+        """Home field factor score per game (missing neutral-site flags count as campus games)"""
+        config = config or self.config
+        neutral = pd.Series(is_neutral_site, dtype=object).eq(True).to_numpy()
+        return np.where(neutral, 0.0, config.thresholds['home_field_points'])
+    
+    def _rest_components(self, home_rest_days, away_rest_days):
+        """(score, bye code, short-week code) per game; codes are +1 home-only, -1 away-only"""
+        home = pd.to_numeric(pd.Series(home_rest_days, dtype=object), errors='coerce').to_numpy(np.float64)
+        away = pd.to_numeric(pd.Series(away_rest_days, dtype=object), errors='coerce').to_numpy(np.float64)
+        known = ~np.isnan(home) & ~np.isnan(away)
+        
+        home_bye, away_bye = home >= BYE_MIN_DAYS, away >= BYE_MIN_DAYS
+        home_short, away_short = home <= SHORT_WEEK_MAX_DAYS, away <= SHORT_WEEK_MAX_DAYS
+        bye = np.where(known, (home_bye & ~away_bye).astype(np.int8) - (away_bye & ~home_bye), 0)
+        short = np.where(known, (home_short & ~away_short).astype(np.int8) - (away_short & ~home_short), 0)
+        return (bye - short).astype(np.float64), bye.astype(np.int8), short.astype(np.int8)
+    
+    def rest_scores(self, home_rest_days, away_rest_days) -> np.ndarray:
+        """Rest factor score per game (0 when either side's rest is unknown)"""
+        return self._rest_components(home_rest_days, away_rest_days)[0]
+    
+    def betting_line_scores(self, vegas_spreads, predicted_spreads,
+                            config: Optional[EngineConfig] = None) -> np.ndarray:
+        """Betting line value score per game (0 without a line)"""
+        thresholds = (config or self.config).thresholds
+        vegas = pd.to_numeric(pd.Series(vegas_spreads, dtype=object), errors='coerce').to_numpy(np.float64)
+        line_differential = np.abs(np.asarray(predicted_spreads, dtype=np.float64) - vegas)
+        return np.where(line_differential >= thresholds['betting_min_differential'],
+                        np.minimum(line_differential * thresholds['betting_value_rate'],
+                                   thresholds['betting_value_cap']), 0.0)
+    
+    def generate_predictions(self, frame: pd.DataFrame) -> PredictionBatch:
+        """
+        Score a whole slate or history at once. Inputs are read from the columns
+        in PREDICTION_INPUT_COLUMNS; every game matches generate_prediction.
+        Returns a PredictionBatch aligned with the frame's index.
+        """
+        columns = {}
+        for name, candidates in PREDICTION_INPUT_COLUMNS.items():
+            present = [candidate for candidate in candidates if candidate in frame]
+            if present:
+                columns[name] = frame[present[0]].to_numpy()
+        return self._score_columns(columns, len(frame), frame.index)
+    
+    def _score_columns(self, columns: Dict[str, np.ndarray], n: int, index=None) -> PredictionBatch:
+        """
+        Shared scoring path for generate_prediction and generate_predictions.
+        The config snapshot is read once, so a reload mid-batch cannot mix versions.
+        """
+        config = self.config
+        thresholds = config.thresholds
+        
+        def column(name, default=None):
+            return columns[name] if name in columns else np.full(n, default, dtype=object)
+        
+        weather_code = weather_codes(column('temperature'), column('wind_speed'), column('precipitation'),
+                                     column('is_dome', False), profile=ALGORITHM_PROFILE)
+        weather = weather_points(weather_code, ALGORITHM_PROFILE)['total']
+        conference, differential, tier, mismatch = config.conference_matrix.lookup(
+            column('home_conference'), column('away_conference'))
+        neutral = pd.Series(column('is_neutral_site', False), dtype=object).eq(True).to_numpy()
+        home_field = self.home_field_scores(neutral, config)
+        rest, rest_bye, rest_short = self._rest_components(column('home_rest_days'), column('away_rest_days'))
+        
+        base_prediction = home_field + conference + weather + rest
+        vegas = pd.to_numeric(pd.Series(column('vegas_spread'), dtype=object), errors='coerce').to_numpy(np.float64)
+        betting_value = self.betting_line_scores(vegas, base_prediction, config)
+        total_score = base_prediction + betting_value
+        
+        factor_count = ((weather != 0).astype(np.int64) + (conference != 0) + (home_field != 0) +
+                        (betting_value != 0) + (rest != 0))
+        confidence = np.where(
+            (np.abs(total_score) > thresholds['high_confidence_score']) &
+            (factor_count >= thresholds['high_confidence_factors']), 2,
+            np.where((np.abs(total_score) > thresholds['medium_confidence_score']) &
+                     (factor_count >= thresholds['medium_confidence_factors']), 1, 0)
+        ).astype(np.int8)
+        
+        # A zero or missing line gives no edge and no recommendation
+        has_line = ~np.isnan(vegas) & (vegas != 0)
+        home_favored = total_score > 0
+        margin = thresholds['recommend_margin']
+        take_home = has_line & home_favored & (total_score > vegas + margin)
+        take_away = has_line & ~home_favored & (np.abs(total_score) > np.abs(vegas) + margin)
+        
+        scores = {
+            'spread': total_score,
+            'base_spread': base_prediction,
+            'edge': np.where(has_line, np.abs(total_score - np.nan_to_num(vegas)), np.nan),
+            'vegas_line': vegas,
+            'weather': weather,
+            'conference': conference,
+            'home_field': home_field,
+            'rest': rest,
+            'betting_value': betting_value,
+        }
+        calibration = self.calibration
+        if calibration is not None:
+            # The points total is the predicted home margin; vegas follows games.spread
+            scores.update(calibration.probabilities(total_score, vegas))
+            scores.update(calibration.prediction_intervals(total_score, vegas))
+        codes = {
+            'confidence': confidence,
+            'temperature': weather_code['temperature'].astype(np.int8),
+            'wind': weather_code['wind'].astype(np.int8),
+            'precipitation': weather_code['precipitation'],
+            'dome': weather_code['dome'],
+            'neutral': neutral,
+            'conference_tier': tier,
+            'conference_mismatch': mismatch,
+            'rest_bye': rest_bye,
+            'rest_short': rest_short,
+            'recommended': take_home.astype(np.int8) - take_away,
+        }
+        inputs = {name: column(name) for name in INPUT_COLUMNS}
+        return PredictionBatch(scores, codes, inputs, differential, index, config)
+    
+    def score_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Numeric results for a frame (see PredictionBatch.to_frame)"""
+        return self.generate_predictions(frame).to_frame()
+    
+    def factor_contributions(self, frame: pd.DataFrame) -> FactorContributions:
+        """Games x factors point contributions for a frame (see PredictionBatch.contributions)"""
+        return self.generate_predictions(frame).contributions()
+
+
+# Game fields each comprehensive factor reads
+FACTOR_INPUTS = {
+    'weather': ['temperature', 'wind_speed', 'precipitation', 'is_dome', 'weather_condition'],
+    'conference': ['home_conf', 'away_conf'],
+    'elo': ['home_elo', 'away_elo'],
+    'betting': ['spread', 'home_rank', 'away_rank'],
+    'rest': ['home_days_rest', 'away_days_rest'],
+}
+
+# ComprehensiveScoringCore method computing each factor
+FACTOR_METHODS = {
+    'weather': 'calculate_weather_factor',
+    'conference': 'calculate_conference_factor',
+    'elo': 'calculate_elo_factor',
+    'betting': 'calculate_betting_factors',
+    'rest': 'calculate_rest_factor',
+}
+
+# Comprehensive factors are added to the Vegas spread (games.spread sign: negative
+# favors home); the ELO edge only informs key factors. Total weights apply to the
+# line-adjustment fallback used when a game has no model_total.
+FACTOR_METADATA = {
+    'weather': {'category': 'Weather', 'description': "Weather and dome points from the historical insights",
+                'sign': 'added to home spread', 'spread_weight': 1.0, 'total_weight': 1.0},
+    'conference': {'category': 'Conference', 'description': "SEC cross-conference, Big Ten defense, Big 12 shootouts",
+                   'sign': 'added to home spread', 'spread_weight': 1.0, 'total_weight': 0.5},
+    'elo': {'category': 'ELO', 'description': "Pregame ELO edge with home field, in points",
+            'sign': 'points toward home', 'spread_weight': 0.0, 'total_weight': 0.0},
+    'betting': {'category': 'Market', 'description': "Home favorite and ranked team market biases",
+                'sign': 'added to home spread', 'spread_weight': 1.0, 'total_weight': 0.0},
+    'rest': {'category': 'Rest', 'description': "Bye week and short week differential",
+             'sign': 'added to home spread', 'spread_weight': 1.0, 'total_weight': 0.0},
+}
+
+# Fields read when turning factors into picks and notes
+PICK_INPUTS = ['id', 'home_team', 'away_team', 'spread', 'over_under', 'is_dome', 'temperature',
+               'wind_speed', 'home_conf', 'away_conf', 'home_rank', 'model_total']
+
+# Game fields generate_game_prediction reads
+GAME_PREDICTION_INPUTS = list(dict.fromkeys(
+    PICK_INPUTS + [column for columns in FACTOR_INPUTS.values() for column in columns]
+))
+
+# ComprehensiveScoringCore method computing each factor for a whole frame
+FACTOR_SCORE_METHODS = {
+    'weather': 'weather_scores',
+    'conference': 'conference_scores',
+    'elo': 'elo_scores',
+    'betting': 'betting_scores',
+    'rest': 'rest_scores',
+}
+
+SEC_RIVAL_CONFERENCES = ['Big Ten', 'Big 12', 'ACC', 'Pac-12']
+
+# generate_rick_notes phrases by note code (0 = no note), see note_codes
+WEATHER_NOTES = {
+    1: "Dome advantage favors scoring",
+    2: "Cold weather limits offense",
+    3: "High winds hurt passing game",
+}
+CONFERENCE_NOTES = {
+    1: "SEC home field advantage in cross-conference",
+    2: "Big Ten defensive style lowers scoring",
+    3: "Big 12 shootout potential",
+}
+RANKED_FAVORITE_NOTE = "Ranked home favorites historically struggle ATS"
+
+
+def _numeric(games: pd.DataFrame, column: str) -> np.ndarray:
+    """Float array of a frame column, NaN where missing (or everywhere when absent)"""
+    if column not in games:
+        return np.full(len(games), np.nan)
+    return pd.to_numeric(games[column], errors='coerce').to_numpy(np.float64)
+
+
+def _truthy(values: pd.Series) -> np.ndarray:
+    """Python truthiness of each value, as `if game[column]` tests it"""
+    if values.dtype == bool:
+        return values.to_numpy()
+    return np.fromiter(map(bool, values.to_numpy(object)), dtype=bool, count=len(values))
+
+
+class ComprehensiveScoringCore:
+    """
+    Insight-driven scoring from comprehensive_prediction_system. Only the
+    handful of numbers the factors read are kept from the historical insights,
+    so the core pickles in a few hundred bytes (plus any calibration tables).
+    """
+    
+    PARAMETERS = ('dome_advantage', 'sec_win_pct', 'big_ten_defensive_advantage',
+                  'home_favorite_penalty', 'ranked_team_penalty')
+    
+    def __init__(self, dome_advantage: float = 0, sec_win_pct: float = 50,
+                 big_ten_defensive_advantage: float = 0, home_favorite_penalty: float = 0,
+                 ranked_team_penalty: float = 0, calibration: Optional[CalibrationTables] = None):
+        self.calibration = calibration
+        self.dome_advantage = dome_advantage
+        self.sec_win_pct = sec_win_pct
+        self.big_ten_defensive_advantage = big_ten_defensive_advantage
+        self.home_favorite_penalty = home_favorite_penalty
+        self.ranked_team_penalty = ranked_team_penalty
+    
+    @staticmethod
+    def insight_parameters(insights: Dict) -> Dict[str, float]:
+        """Pull the scoring parameters out of the analyzers' result dicts"""
+        def section(group, key):
+            return ((insights.get(group) or {}).get(key)) or {}
+        
+        return {
+            'dome_advantage': section('weather', 'dome_advantage').get('difference', 0),
+            'sec_win_pct': section('conferences', 'sec_dominance').get('sec_win_pct', 50),
+            'big_ten_defensive_advantage': section('conferences', 'big_ten_defense').get('defensive_advantage', 0),
+            'home_favorite_penalty': section('betting', 'home_favorite_bias').get('home_penalty', 0),
+            'ranked_team_penalty': section('betting', 'ranked_team_bias').get('ranked_penalty', 0),
+        }
+    
+    @classmethod
+    def from_insights(cls, insights: Dict) -> 'ComprehensiveScoringCore':
+        return cls(**cls.insight_parameters(insights))
+    
+    def set_insights(self, insights: Dict):
+        """Refresh the scoring parameters from newly loaded historical insights"""
+        for name, value in self.insight_parameters(insights).items():
+            setattr(self, name, value)
+    
+    @property
+    def config_version(self) -> str:
+        """Short hash of the scoring parameters; changes whenever new insights move them"""
+        parameters = repr([float(getattr(self, name)) for name in self.PARAMETERS])
+        return hashlib.sha1(parameters.encode()).hexdigest()[:12]
+    
+    def scoring_core(self) -> 'ComprehensiveScoringCore':
+        """Plain core with the current parameters (drops any engine state)"""
+        return ComprehensiveScoringCore(calibration=self.calibration,
+                                        **{name: getattr(self, name) for name in self.PARAMETERS})
+    
+    def score_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """One generate_game_prediction row per game, aligned with the frame"""
+        predictions = self.predictions_from_scores(frame, self.factor_scores(frame))
+        return pd.DataFrame(self.add_calibration(predictions), index=frame.index)
+    
+    def factor_contributions(self, frame: pd.DataFrame) -> FactorContributions:
+        """Games x FACTOR_METHODS contributions for a frame, aligned with its index"""
+        return FactorContributions(self.factor_scores(frame), list(FACTOR_METHODS), frame.index, FACTOR_METADATA)
+    
+    def calculate_weather_factor(self, game):
+        """Calculate weather impact score for a game"""
+        weather_score = weather_adjustment(
+            game['temperature'], game['wind_speed'], game['precipitation'], game['is_dome'],
+            game['weather_condition'], profile=COMPREHENSIVE_PROFILE,
+            dome_points=self.dome_advantage * 0.5  # Convert to spread points
+        )[0]
+            
+        return weather_score
+        
+    def calculate_conference_factor(self, game):
+        """Calculate conference strength factors"""
+        conf_score = 0
+        
+        # SEC advantage in cross-conference
+        if (game['home_conf'] == 'SEC' and game['away_conf'] in ['Big Ten', 'Big 12', 'ACC', 'Pac-12']) or \
+           (game['away_conf'] == 'SEC' and game['home_conf'] in ['Big Ten', 'Big 12', 'ACC', 'Pac-12']):
+            sec_advantage = self.sec_win_pct - 50
+            if game['home_conf'] == 'SEC':
+                conf_score += sec_advantage * 0.1
+            else:
+                conf_score -= sec_advantage * 0.1
+                
+        # Big Ten defensive adjustment
+        if game['home_conf'] == 'Big Ten' or game['away_conf'] == 'Big Ten':
+            big_ten_under = self.big_ten_defensive_advantage
+            conf_score -= big_ten_under * 0.3  # Favor unders
+            
+        # Big 12 offensive adjustment
+        if game['home_conf'] == 'Big 12' and game['away_conf'] == 'Big 12':
+            conf_score += 2.0  # Favor overs
+            
+        return conf_score
+        
+    def calculate_elo_factor(self, game):
+        """Calculate ELO-based prediction"""
+        if pd.isna(game['home_elo']) or pd.isna(game['away_elo']):
+            return 0
+            
+        # Basic ELO difference with home field advantage
+        elo_diff = (game['home_elo'] + 65) - game['away_elo']  # +65 home field
+        predicted_spread = elo_diff / 25  # ~25 ELO points = 1 point spread
+        
+        return predicted_spread
+        
+    def calculate_betting_factors(self, game):
+        """Apply betting market insights"""
+        betting_score = 0
+        
+        # Home favorite penalty
+        if pd.notna(game['spread']) and game['spread'] < 0:  # Home favorite
+            home_penalty = self.home_favorite_penalty
+            betting_score -= home_penalty * 0.1
+            
+        # Ranked team penalty (if applicable)
+        if pd.notna(game['home_rank']) or pd.notna(game['away_rank']):
+            ranked_penalty = self.ranked_team_penalty
+            if pd.notna(game['home_rank']) and game['spread'] < 0:  # Ranked home favorite
+                betting_score -= ranked_penalty * 0.1
+            elif pd.notna(game['away_rank']) and game['spread'] > 0:  # Ranked away favorite
+                betting_score += ranked_penalty * 0.1
+                
+        return betting_score
+        
+    def calculate_rest_factor(self, game):
+        """Bye week and short week differential (negative favors the home side)"""
+        home_rest = game.get('home_days_rest')
+        away_rest = game.get('away_days_rest')
+        if pd.isna(home_rest) or pd.isna(away_rest):
+            return 0
+            
+        rest_score = 0
+        rest_score -= int(home_rest >= BYE_MIN_DAYS) - int(away_rest >= BYE_MIN_DAYS)
+        rest_score += int(home_rest <= SHORT_WEEK_MAX_DAYS) - int(away_rest <= SHORT_WEEK_MAX_DAYS)
+        return float(rest_score)
+        
+    # Vectorized scoring: each *_scores method mirrors its scalar calculate_*
+    # counterpart over a whole games frame and returns a float array
+    
+    def weather_scores(self, games: pd.DataFrame) -> np.ndarray:
+        """Weather impact score per game"""
+        return weather_adjustment(
+            games['temperature'].to_numpy(), games['wind_speed'].to_numpy(), games['precipitation'].to_numpy(),
+            games['is_dome'].to_numpy(), games['weather_condition'].to_numpy(), profile=COMPREHENSIVE_PROFILE,
+            dome_points=self.dome_advantage * 0.5
+        )
+    
+    def conference_scores(self, games: pd.DataFrame) -> np.ndarray:
+        """Conference strength score per game"""
+        home, away = games['home_conf'], games['away_conf']
+        home_sec = home.eq('SEC').to_numpy()
+        sec_cross = ((home_sec & away.isin(SEC_RIVAL_CONFERENCES).to_numpy()) |
+                     (away.eq('SEC').to_numpy() & home.isin(SEC_RIVAL_CONFERENCES).to_numpy()))
+        sec_points = (self.sec_win_pct - 50) * 0.1
+        
+        scores = np.zeros(len(games))
+        scores = np.where(sec_cross & home_sec, scores + sec_points, scores)
+        scores = np.where(sec_cross & ~home_sec, scores - sec_points, scores)
+        big_ten = (home.eq('Big Ten') | away.eq('Big Ten')).to_numpy()
+        scores = np.where(big_ten, scores - self.big_ten_defensive_advantage * 0.3, scores)
+        big_12 = (home.eq('Big 12') & away.eq('Big 12')).to_numpy()
+        return np.where(big_12, scores + 2.0, scores)
+    
+    def elo_scores(self, games: pd.DataFrame) -> np.ndarray:
+        """ELO spread per game (0 when either rating is missing)"""
+        home, away = _numeric(games, 'home_elo'), _numeric(games, 'away_elo')
+        return np.where(np.isnan(home) | np.isnan(away), 0.0, ((home + 65) - away) / 25)
+    
+    def betting_scores(self, games: pd.DataFrame) -> np.ndarray:
+        """Betting market score per game"""
+        spread = _numeric(games, 'spread')
+        home_ranked = games['home_rank'].notna().to_numpy()
+        away_ranked = games['away_rank'].notna().to_numpy()
+        home_favorite = spread < 0  # NaN compares False, as in the scalar checks
+        ranked_points = self.ranked_team_penalty * 0.1
+        
+        scores = np.where(home_favorite, 0 - self.home_favorite_penalty * 0.1, 0.0)
+        ranked_home_favorite = home_ranked & home_favorite
+        ranked_away_favorite = ~ranked_home_favorite & away_ranked & (spread > 0)
+        scores = np.where(ranked_home_favorite, scores - ranked_points, scores)
+        return np.where(ranked_away_favorite, scores + ranked_points, scores)
+    
+    def rest_scores(self, games: pd.DataFrame) -> np.ndarray:
+        """Bye week and short week differential per game (0 when either side's rest is unknown)"""
+        home, away = _numeric(games, 'home_days_rest'), _numeric(games, 'away_days_rest')
+        bye = (home >= BYE_MIN_DAYS).astype(np.int64) - (away >= BYE_MIN_DAYS)
+        short = (home <= SHORT_WEEK_MAX_DAYS).astype(np.int64) - (away <= SHORT_WEEK_MAX_DAYS)
+        return np.where(np.isnan(home) | np.isnan(away), 0.0, (0 - bye + short).astype(np.float64))
+    
+    def factor_scores(self, games: pd.DataFrame) -> np.ndarray:
+        """Games x FACTOR_METHODS contributions, one vectorized pass per factor"""
+        return np.column_stack([getattr(self, method)(games) for method in FACTOR_SCORE_METHODS.values()]
+                               ).reshape(len(games), len(FACTOR_SCORE_METHODS))
+    
+    def note_codes(self, games: pd.DataFrame) -> np.ndarray:
+        """
+        Games x (weather, conference, ranked favorite) codes behind
+        generate_rick_notes, so the text is only built for games shown
+        """
+        temperature, wind_speed = _numeric(games, 'temperature'), _numeric(games, 'wind_speed')
+        weather = np.select([_truthy(games['is_dome']), temperature < 40, wind_speed > 15], [1, 2, 3], 0)
+        
+        home, away = games['home_conf'], games['away_conf']
+        conference = np.select([
+            (home.eq('SEC') & away.isin(SEC_RIVAL_CONFERENCES)).to_numpy(),
+            (home.eq('Big Ten') | away.eq('Big Ten')).to_numpy(),
+            (home.eq('Big 12') & away.eq('Big 12')).to_numpy(),
+        ], [1, 2, 3], 0)
+        
+        ranked_favorite = (_numeric(games, 'spread') < 0) & games['home_rank'].notna().to_numpy()
+        return np.column_stack([weather, conference, ranked_favorite]).astype(np.int8).reshape(len(games), 3)
+    
+    @staticmethod
+    def notes_text(codes) -> str:
+        """generate_rick_notes text for one game's note_codes row"""
+        weather, conference, ranked_favorite = codes
+        notes = [note for note in (WEATHER_NOTES.get(weather), CONFERENCE_NOTES.get(conference),
+                                   RANKED_FAVORITE_NOTE if ranked_favorite else None) if note]
+        return " | ".join(notes) if notes else "Solid fundamental matchup"
+    
+    def predictions_from_scores(self, games: pd.DataFrame, scores: np.ndarray, notes: bool = True) -> List[Dict]:
+        """
+        prediction_from_factors for a whole frame: spreads, totals, picks and
+        confidences are computed on arrays, leaving only the pick strings and
+        key factors per game. With notes=False rick_notes is left None for the
+        caller to fill from note_codes once a game is displayed.
+        """
+        weather, conference, elo, betting, rest = np.asarray(scores, dtype=np.float64).reshape(-1, 5).T
+        spread = _numeric(games, 'spread')
+        over_under = _numeric(games, 'over_under')
+        model_total = _numeric(games, 'model_total')
+        
+        # Rick's adjusted spread
+        rick_spread = spread + weather + conference + betting + rest
+        spread_edge = np.abs(rick_spread - spread)
+        spread_play = spread_edge >= 2.5
+        take_away = rick_spread > spread
+        spread_confidence = 60 + spread_edge * 5
+        
+        # Over/Under: the totals model's number when there is one, otherwise the adjusted line
+        has_model_total = ~np.isnan(model_total)
+        total_adjustment = np.where(has_model_total, model_total - over_under, weather + conference * 0.5)
+        rick_total = np.where(has_model_total, model_total, over_under + total_adjustment)
+        total_edge = np.abs(total_adjustment)
+        total_play = total_edge >= 3.0
+        take_over = total_adjustment > 0
+        total_confidence = 60 + total_edge * 3
+        
+        # Key factors
+        factor_flags = np.column_stack([np.abs(weather) > 1, np.abs(conference) > 1, np.abs(elo) > 2,
+                                        np.abs(betting) > 0.5, rest != 0])
+        factor_labels = ('Weather', 'Conference', 'ELO edge', 'Market', 'Rest')
+        factor_values = np.column_stack([weather, conference, elo, betting, rest]).tolist()
+        
+        ids = games['id'].to_numpy(object)
+        home_teams = games['home_team'].to_numpy(object)
+        away_teams = games['away_team'].to_numpy(object)
+        spread_lines = games['spread'].to_numpy(object)
+        total_lines = games['over_under'].to_numpy(object)
+        codes = self.note_codes(games).tolist() if notes else None
+        
+        has_spread, has_total = (~np.isnan(spread)).tolist(), (~np.isnan(over_under)).tolist()
+        rick_spread, spread_confidence = rick_spread.tolist(), spread_confidence.tolist()
+        rick_total, total_confidence = rick_total.tolist(), total_confidence.tolist()
+        spread_play, take_away = spread_play.tolist(), take_away.tolist()
+        total_play, take_over = total_play.tolist(), take_over.tolist()
+        has_model_total, model_total = has_model_total.tolist(), model_total.tolist()
+        
+        predictions = []
+        for i in range(len(games)):
+            prediction = {
+                'game_id': ids[i],
+                'home_team': home_teams[i],
+                'away_team': away_teams[i],
+                'vegas_spread': spread_lines[i],
+                'vegas_total': total_lines[i]
+            }
+            if has_spread[i]:
+                prediction['rick_spread'] = rick_spread[i]
+                if spread_play[i]:
+                    if take_away[i]:
+                        prediction['spread_pick'] = f"TAKE {away_teams[i]} +{abs(spread_lines[i])}"
+                    else:
+                        prediction['spread_pick'] = f"TAKE {home_teams[i]} {spread_lines[i]}"
+                    prediction['spread_confidence'] = min(85, spread_confidence[i])
+                else:
+                    prediction['spread_pick'] = "NO PLAY"
+                    prediction['spread_confidence'] = 50
+            else:
+                prediction['rick_spread'] = None
+                prediction['spread_pick'] = "NO SPREAD AVAILABLE"
+                prediction['spread_confidence'] = 50
+                
+            if has_total[i]:
+                prediction['rick_total'] = rick_total[i]
+                if total_play[i]:
+                    side = "OVER" if take_over[i] else "UNDER"
+                    prediction['total_pick'] = f"{side} {total_lines[i]}"
+                    prediction['total_confidence'] = min(85, total_confidence[i])
+                else:
+                    prediction['total_pick'] = "NO PLAY"
+                    prediction['total_confidence'] = 50
+            else:
+                prediction['rick_total'] = model_total[i] if has_model_total[i] else None
+                prediction['total_pick'] = "NO TOTAL AVAILABLE"
+                prediction['total_confidence'] = 50
+                
+            key_factors = [f"{label}: {value:+.1f}" for label, value, shown
+                           in zip(factor_labels, factor_values[i], factor_flags[i]) if shown]
+            prediction['key_factors'] = key_factors if key_factors else ["Balanced matchup"]
+            prediction['rick_notes'] = self.notes_text(codes[i]) if notes else None
+            predictions.append(prediction)
+        return predictions
+        
+    def game_factors(self, game) -> Dict[str, float]:
+        """Every factor's contribution for one game, keyed as in FACTOR_METHODS"""
+        return {factor: getattr(self, method)(game) for factor, method in FACTOR_METHODS.items()}
+        
+    def generate_game_prediction(self, game):
+        """Generate comprehensive prediction for a single game"""
+        return self.add_calibration([self.prediction_from_factors(game, self.game_factors(game))])[0]
+    
+    def add_calibration(self, predictions: List[Dict]) -> List[Dict]:
+        """Calibrated probabilities and intervals for a list of predictions (none without tables)"""
+        if self.calibration is not None:
+            self.calibration.annotate(predictions)
+        return predictions
+        
+    def prediction_from_factors(self, game, factors: Dict[str, float]):
+        """Picks, confidences, key factors and notes from precomputed factor contributions"""
+        prediction = {
+            'game_id': game['id'],
+            'home_team': game['home_team'],
+            'away_team': game['away_team'],
+            'vegas_spread': game['spread'],
+            'vegas_total': game['over_under']
+        }
+        
+        weather_factor = factors['weather']
+        conference_factor = factors['conference']
+        elo_factor = factors['elo']
+        betting_factor = factors['betting']
+        rest_factor = factors['rest']
+        
+        # Rick's adjusted spread
+        if pd.notna(game['spread']):
+            rick_spread = game['spread'] + weather_factor + conference_factor + betting_factor + rest_factor
+            prediction['rick_spread'] = rick_spread
+            
+            # Spread recommendation
+            spread_edge = abs(rick_spread - game['spread'])
+            if spread_edge >= 2.5:
+                if rick_spread > game['spread']:
+                    prediction['spread_pick'] = f"TAKE {game['away_team']} +{abs(game['spread'])}"
+                    prediction['spread_confidence'] = min(85, 60 + spread_edge * 5)
+                else:
+                    prediction['spread_pick'] = f"TAKE {game['home_team']} {game['spread']}"
+                    prediction['spread_confidence'] = min(85, 60 + spread_edge * 5)
+            else:
+                prediction['spread_pick'] = "NO PLAY"
+                prediction['spread_confidence'] = 50
+        else:
+            prediction['rick_spread'] = None
+            prediction['spread_pick'] = "NO SPREAD AVAILABLE"
+            prediction['spread_confidence'] = 50
+            
+        # Over/Under prediction: the totals model's number when the game has one
+        # (see totals_model), otherwise the line adjusted by the weather and
+        # conference factors
+        model_total = game.get('model_total')
+        has_model_total = model_total is not None and pd.notna(model_total)
+        if pd.notna(game['over_under']):
+            if has_model_total:
+                rick_total = model_total
+                total_adjustment = model_total - game['over_under']
+            else:
+                total_adjustment = weather_factor + (conference_factor * 0.5)
+                rick_total = game['over_under'] + total_adjustment
+            prediction['rick_total'] = rick_total
+            
+            total_edge = abs(total_adjustment)
+            if total_edge >= 3.0:
+                if total_adjustment > 0:
+                    prediction['total_pick'] = f"OVER {game['over_under']}"
+                    prediction['total_confidence'] = min(85, 60 + total_edge * 3)
+                else:
+                    prediction['total_pick'] = f"UNDER {game['over_under']}"
+                    prediction['total_confidence'] = min(85, 60 + total_edge * 3)
+            else:
+                prediction['total_pick'] = "NO PLAY"
+                prediction['total_confidence'] = 50
+        else:
+            prediction['rick_total'] = model_total if has_model_total else None
+            prediction['total_pick'] = "NO TOTAL AVAILABLE"
+            prediction['total_confidence'] = 50
+            
+        # Key factors
+        factors = []
+        if abs(weather_factor) > 1:
+            factors.append(f"Weather: {weather_factor:+.1f}")
+        if abs(conference_factor) > 1:
+            factors.append(f"Conference: {conference_factor:+.1f}")
+        if abs(elo_factor) > 2:
+            factors.append(f"ELO edge: {elo_factor:+.1f}")
+        if abs(betting_factor) > 0.5:
+            factors.append(f"Market: {betting_factor:+.1f}")
+        if rest_factor != 0:
+            factors.append(f"Rest: {rest_factor:+.1f}")
+            
+        prediction['key_factors'] = factors if factors else ["Balanced matchup"]
+        prediction['rick_notes'] = self.generate_rick_notes(game, prediction)
+        
+        return prediction
+        
+    def generate_rick_notes(self, game, prediction):
+        """Generate Rick's commentary for the prediction"""
+        notes = []
+        
+        # Weather commentary
+        if game['is_dome']:
+            notes.append("Dome advantage favors scoring")
+        elif pd.notna(game['temperature']) and game['temperature'] < 40:
+            notes.append("Cold weather limits offense")
+        elif pd.notna(game['wind_speed']) and game['wind_speed'] > 15:
+            notes.append("High winds hurt passing game")
+            
+        # Conference commentary
+        if game['home_conf'] == 'SEC' and game['away_conf'] in ['Big Ten', 'Big 12', 'ACC', 'Pac-12']:
+            notes.append("SEC home field advantage in cross-conference")
+        elif game['home_conf'] == 'Big Ten' or game['away_conf'] == 'Big Ten':
+            notes.append("Big Ten defensive style lowers scoring")
+        elif game['home_conf'] == 'Big 12' and game['away_conf'] == 'Big 12':
+            notes.append("Big 12 shootout potential")
+            
+        # Betting market commentary
+        if pd.notna(game['spread']) and game['spread'] < 0 and pd.notna(game['home_rank']):
+            notes.append("Ranked home favorites historically struggle ATS")
+            
+        if not notes:
+            notes.append("Solid fundamental matchup")
+            
+        return " | ".join(notes)
+
+
+# Per-process core installed by the pool initializer, so each worker receives
+# it once rather than with every chunk
+_worker_core = None
+
+
+def _install_core(core):
+    global _worker_core
+    _worker_core = core
+
+
+def _score_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    return _worker_core.score_frame(chunk)
+
+
+def parallel_predictions(core, frame: pd.DataFrame, workers: Optional[int] = None,
+                         chunk_size: int = 5000) -> pd.DataFrame:
+    """
+    Score a frame with core.score_frame across a process pool. The core must
+    be a plain scoring core (use engine.scoring_core()), never an engine with
+    a live connection. Small frames or workers=1 score in-process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(frame) <= chunk_size:
+        return core.score_frame(frame)
+    
+    chunks = [frame.iloc[start:start + chunk_size] for start in range(0, len(frame), chunk_size)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                             initializer=_install_core, initargs=(core,)) as pool:
+        return pd.concat(pool.map(_score_chunk, chunks))
@@ -0,0 +1,232 @@
+"""
+Bulk Slate Job
+Scores the whole upcoming slate with the comprehensive engine and persists it
+to the predictions and ricks_picks tables (shared/schema.ts) in bulk: one
+COPY into a temporary staging table, then a single statement that merges the
+staged rows into both tables with INSERT ... ON CONFLICT (game_id).
+
+ricks_picks is Rick's admin override table, so the job's rows carry
+source = 'slate_job' and only those are ever updated: Rick's own picks, and
+job rows he has since edited or that are locked, are left alone. The unique
+game_id indexes the merge relies on come from unique-game-predictions.sql.
+
+Usage:
+    python slate_job.py [--dry-run]
+"""
+
+import io
+import csv
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+from incremental_slate import FACTORS
+
+# Staging columns, in COPY order, with their Postgres types
+STAGING_COLUMNS = {
+    'game_id': 'integer',
+    'week': 'integer',
+    'season': 'integer',
+    'predicted_winner_id': 'integer',
+    'confidence': 'real',
+    'predicted_spread': 'real',
+    'predicted_total': 'real',
+    'notes': 'text',
+    'spread_pick': 'varchar(50)',
+    'spread_confidence': 'integer',
+    'total_pick': 'varchar(50)',
+    'total_confidence': 'integer',
+    'key_factors': 'text[]',
+}
+
+STAGING_DDL = "CREATE TEMP TABLE slate_staging ({}) ON COMMIT DROP".format(
+    ', '.join(f"{column} {column_type}" for column, column_type in STAGING_COLUMNS.items())
+)
+
+MERGE_SQL = """
+WITH merged_predictions AS (
+    INSERT INTO predictions (game_id, predicted_winner_id, confidence, predicted_spread, predicted_total, notes)
+    SELECT game_id, predicted_winner_id, confidence, predicted_spread, predicted_total, notes
+    FROM slate_staging
+    ON CONFLICT (game_id) DO UPDATE SET
+        predicted_winner_id = EXCLUDED.predicted_winner_id,
+        confidence = EXCLUDED.confidence,
+        predicted_spread = EXCLUDED.predicted_spread,
+        predicted_total = EXCLUDED.predicted_total,
+        notes = EXCLUDED.notes
+    RETURNING (xmax = 0) AS inserted
+), merged_picks AS (
+    INSERT INTO ricks_picks (game_id, week, season, spread_pick, spread_confidence,
+                             total_pick, total_confidence, personal_notes, key_factors, source, updated_at)
+    SELECT game_id, week, season, spread_pick, spread_confidence,
+           total_pick, total_confidence, notes, key_factors, 'slate_job', NOW()
+    FROM slate_staging
+    ON CONFLICT (game_id) DO UPDATE SET
+        spread_pick = EXCLUDED.spread_pick,
+        spread_confidence = EXCLUDED.spread_confidence,
+        total_pick = EXCLUDED.total_pick,
+        total_confidence = EXCLUDED.total_confidence,
+        personal_notes = EXCLUDED.personal_notes,
+        key_factors = EXCLUDED.key_factors,
+        updated_at = NOW()
+    WHERE ricks_picks.source = 'slate_job' AND ricks_picks.is_locked IS NOT TRUE
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    (SELECT count(*) FILTER (WHERE inserted) FROM merged_predictions),
+    (SELECT count(*) FILTER (WHERE NOT inserted) FROM merged_predictions),
+    (SELECT count(*) FILTER (WHERE inserted) FROM merged_picks),
+    (SELECT count(*) FILTER (WHERE NOT inserted) FROM merged_picks)
+"""
+
+
+def pg_array_literal(values: List[str]) -> str:
+    """Postgres text[] literal, e.g. {"Weather: +1.0","Rest: -1.0"}"""
+    quoted = ('"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"' for value in values)
+    return '{' + ','.join(quoted) + '}'
+
+
+def build_slate_rows(games: pd.DataFrame, predictions: List[Dict], elo_edges: np.ndarray) -> pd.DataFrame:
+    """
+    One staging row per game. The predicted winner follows Rick's spread
+    (negative favors the home side, as in games.spread); games without a line
+    fall back to the ELO edge. Confidence is the calibrated probability that
+    the predicted winner wins, where calibration tables exist, and the spread
+    confidence otherwise; both as a 0-1 fraction like the Node routes store.
+    The ricks_picks confidences stay on their 1-100 scale.
+    """
+    games = games.drop_duplicates('id').set_index('id')
+    picks = pd.DataFrame(predictions).set_index('game_id')
+    games = games.loc[picks.index]
+
+    rick_spread = pd.to_numeric(picks['rick_spread'], errors='coerce').to_numpy(np.float64)
+    home_favored = np.where(np.isnan(rick_spread), elo_edges >= 0, rick_spread <= 0)
+
+    confidence = picks['spread_confidence'].to_numpy(np.float64) / 100
+    if 'home_win_probability' in picks:
+        home_win = pd.to_numeric(picks['home_win_probability'], errors='coerce').to_numpy(np.float64)
+        winner_probability = np.where(home_favored, home_win, 1 - home_win)
+        confidence = np.where(np.isnan(winner_probability), confidence, winner_probability)
+
+    return pd.DataFrame({
+        'game_id': picks.index.to_numpy(np.int64),
+        'week': games['week'].to_numpy(np.int64),
+        'season': games['season'].to_numpy(np.int64),
+        'predicted_winner_id': np.where(home_favored, games['home_team_id'], games['away_team_id']).astype(np.int64),
+        'confidence': confidence,
+        'predicted_spread': rick_spread,
+        'predicted_total': pd.to_numeric(picks['rick_total'], errors='coerce').to_numpy(np.float64),
+        'notes': picks['rick_notes'].to_numpy(object),
+        'spread_pick': picks['spread_pick'].to_numpy(object),
+        'spread_confidence': np.round(picks['spread_confidence'].to_numpy(np.float64)).astype(np.int64),
+        'total_pick': picks['total_pick'].to_numpy(object),
+        'total_confidence': np.round(picks['total_confidence'].to_numpy(np.float64)).astype(np.int64),
+        'key_factors': [pg_array_literal(factors) for factors in picks['key_factors']],
+    }, columns=list(STAGING_COLUMNS))
+
+
+# Missing numbers are written as "" (QUOTE_NONNUMERIC quotes na_rep); COPY maps them to NULL
+NULLABLE_COLUMNS = ['confidence', 'predicted_spread', 'predicted_total']
+
+COPY_SQL = "COPY slate_staging ({}) FROM STDIN WITH (FORMAT csv, FORCE_NULL ({}))".format(
+    ', '.join(STAGING_COLUMNS), ', '.join(NULLABLE_COLUMNS)
+)
+
+
+def to_copy_buffer(rows: pd.DataFrame) -> io.StringIO:
+    """CSV for COPY_SQL with every text field quoted"""
+    buffer = io.StringIO()
+    rows.to_csv(buffer, index=False, header=False, quoting=csv.QUOTE_NONNUMERIC, na_rep='')
+    buffer.seek(0)
+    return buffer
+
+
+def write_slate(conn, rows: pd.DataFrame) -> Optional[Dict]:
+    """Stage rows with COPY and merge them into predictions and ricks_picks in one transaction"""
+    timings = {}
+    started = time.time()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(STAGING_DDL)
+            timings['setup_ms'] = (time.time() - started) * 1000
+
+            mark = time.time()
+            cursor.copy_expert(COPY_SQL, to_copy_buffer(rows))
+            timings['copy_ms'] = (time.time() - mark) * 1000
+
+            mark = time.time()
+            cursor.execute(MERGE_SQL)
+            predictions_inserted, predictions_updated, picks_inserted, picks_updated = cursor.fetchone()
+            timings['merge_ms'] = (time.time() - mark) * 1000
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Slate write failed: {e}")
+        return None
+
+    timings['total_ms'] = (time.time() - started) * 1000
+    return {
+        'rows': len(rows),
+        'predictions_inserted': predictions_inserted,
+        'predictions_updated': predictions_updated,
+        'picks_inserted': picks_inserted,
+        'picks_updated': picks_updated,
+        # Conflicting rows the WHERE clause skipped: Rick's own or locked picks
+        'picks_kept': len(rows) - picks_inserted - picks_updated,
+        **timings,
+    }
+
+
+def run_slate_job(engine=None, dry_run: bool = False) -> Optional[Dict]:
+    """Score every upcoming game and persist the slate; returns counts and stage timings"""
+    from comprehensive_prediction_system import RicksPicksPredictionEngine
+
+    print("📦 SLATE JOB")
+    print("=" * 50)
+    engine = engine or RicksPicksPredictionEngine()
+
+    mark = time.time()
+    engine.load_historical_insights()
+    engine.load_upcoming_games()
+    load_seconds = time.time() - mark
+    games = engine.upcoming_games
+    if games is None or len(games) == 0:
+        print("No upcoming games found")
+        return None
+
+    mark = time.time()
+    engine.slate.refresh(games)
+    predictions = engine.slate.current_predictions()
+    elo_edges = engine.slate.factors[:, FACTORS.index('elo')]
+    score_seconds = time.time() - mark
+
+    mark = time.time()
+    rows = build_slate_rows(games, predictions, elo_edges)
+    build_seconds = time.time() - mark
+
+    print(f"⏱️ load {load_seconds:.2f}s | score {score_seconds * 1000:.1f} ms | "
+          f"stage rows {build_seconds * 1000:.1f} ms ({len(rows)} games)")
+    if dry_run:
+        print(rows.head(10).to_string())
+        return {'rows': len(rows)}
+
+    result = write_slate(engine.conn, rows)
+    if result is not None:
+        print(f"⏱️ setup {result['setup_ms']:.1f} ms | COPY {result['copy_ms']:.1f} ms | "
+              f"merge {result['merge_ms']:.1f} ms | total {result['total_ms']:.1f} ms")
+        print(f"✅ predictions: {result['predictions_inserted']} new, {result['predictions_updated']} updated | "
+              f"ricks_picks: {result['picks_inserted']} new, {result['picks_updated']} updated, "
+              f"{result['picks_kept']} kept (Rick's or locked)")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score the upcoming slate and bulk-write predictions")
+    parser.add_argument('--dry-run', action='store_true', help="score and stage rows without writing")
+    args = parser.parse_args()
+    run_slate_job(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,10 @@ import seaborn as sns
 from scipy import stats
 from datetime import datetime
 import os
+from venue_dimension import load_venue_dimension
 
 # Stadium capacity data for major college football programs
+# Fallback for games the CFBD venue dimension cannot place
 STADIUM_CAPACITIES = {
     'Michigan': 107601,  # Michigan Stadium
     'Penn State': 106572,  # Beaver Stadium
@@ -118,6 +120,9 @@ def analyze_stadium_size_correlation():
             g.away_team_score,
             ht.name as home_team_name,
             at.name as away_team_name,
+            g.venue,
+            g.stadium,
+            g.is_neutral_site,
             g.is_conference_game,
             g.is_rivalry_game
         FROM games g
@@ -134,8 +139,16 @@ def analyze_stadium_size_correlation():
         df = pd.read_sql_query(query, conn)
         print(f"Loaded {len(df)} completed games with spreads from database")
 
-        # Add stadium capacity data
-        df['stadium_capacity'] = df['home_team_name'].map(STADIUM_CAPACITIES)
+        # Add stadium capacity data from the venue dimension (actual game venue)
+        venues = load_venue_dimension()
+        if venues is not None:
+            df = venues.join_games(df, home_team_column='home_team_name')
+            df['stadium_capacity'] = df['venue_capacity']
+        else:
+            df['stadium_capacity'] = np.nan
+        df['stadium_capacity'] = df['stadium_capacity'].fillna(
+            df['home_team_name'].map(STADIUM_CAPACITIES)
+        )
 
         # Filter to games where we have stadium data
         df = df.dropna(subset=['stadium_capacity'])
@@ -0,0 +1,69 @@
+"""Shared fixtures for the data_analysis tests: a scoring core and a synthetic slate"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scoring_core import ComprehensiveScoringCore
+from prediction_cache import normalize_input
+
+INSIGHTS = {
+    'weather': {'dome_advantage': {'difference': 7.9}},
+    'conferences': {'sec_dominance': {'sec_win_pct': 61}, 'big_ten_defense': {'defensive_advantage': 3.2}},
+    'betting': {'home_favorite_bias': {'home_penalty': 4}, 'ranked_team_bias': {'ranked_penalty': 6}},
+    'elo': None,
+}
+
+CONFERENCES = ['SEC', 'Big Ten', 'Big 12', 'ACC', 'Pac-12', 'Sun Belt', None]
+
+
+def comparable(predictions):
+    """Predictions with NumPy scalars and NaN normalized so scalar and vectorized results compare equal"""
+    return [{key: value if isinstance(value, (list, dict)) else normalize_input(value)
+             for key, value in prediction.items()}
+            for prediction in predictions]
+
+
+def full_rescore(core, games):
+    """One generate_game_prediction per distinct game, the reference the vectorized paths must match"""
+    return [core.generate_game_prediction(game) for _, game in games.drop_duplicates('id').iterrows()]
+
+
+@pytest.fixture
+def core():
+    return ComprehensiveScoringCore.from_insights(INSIGHTS)
+
+
+@pytest.fixture
+def games():
+    """Upcoming games covering missing lines, weather, domes, rankings and unknown conferences"""
+    rng = np.random.default_rng(7)
+    n = 400
+    return pd.DataFrame({
+        'id': np.arange(1000, 1000 + n),
+        'season': 2025,
+        'week': rng.integers(1, 15, n),
+        'home_team_id': rng.integers(1, 130, n),
+        'away_team_id': rng.integers(130, 260, n),
+        'home_team': 'Home',
+        'away_team': 'Away',
+        'spread': np.where(rng.random(n) < 0.1, np.nan, rng.integers(-60, 60, n) / 2),
+        'over_under': np.where(rng.random(n) < 0.1, np.nan, rng.integers(80, 150, n) / 2),
+        'temperature': np.where(rng.random(n) < 0.1, np.nan, rng.integers(0, 100, n)),
+        'wind_speed': rng.integers(0, 30, n),
+        'precipitation': rng.random(n) * 0.3,
+        'is_dome': rng.random(n) < 0.2,
+        'weather_condition': rng.choice(['Clear', 'Rain', 'Snow', None], n),
+        'home_conf': rng.choice(CONFERENCES, n),
+        'away_conf': rng.choice(CONFERENCES, n),
+        'home_elo': np.where(rng.random(n) < 0.1, np.nan, rng.normal(1500, 200, n)),
+        'away_elo': rng.normal(1500, 200, n),
+        'home_rank': np.where(rng.random(n) < 0.8, np.nan, rng.integers(1, 26, n)),
+        'away_rank': np.where(rng.random(n) < 0.8, np.nan, rng.integers(1, 26, n)),
+        'home_days_rest': rng.integers(4, 15, n).astype(float),
+        'away_days_rest': rng.integers(4, 15, n).astype(float),
+    })
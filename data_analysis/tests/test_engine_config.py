@@ -0,0 +1,72 @@
+"""ConfigWatcher reloads of the engine config artifact"""
+
+import os
+import time
+from engine_config import ConfigWatcher, EngineConfig
+
+
+def write_version(path, version, bump):
+    """Save a config and move its mtime forward so the watcher sees a new signature"""
+    EngineConfig(version).save(path)
+    stamp = time.time() + bump
+    os.utime(path, (stamp, stamp))
+
+
+def test_check_applies_each_new_version_once(tmp_path):
+    path = str(tmp_path / 'engine_config.json')
+    write_version(path, 'v1', 0)
+    applied = []
+    watcher = ConfigWatcher(path, applied.append)
+
+    assert not watcher.check()
+    write_version(path, 'v2', 10)
+    assert watcher.check()
+    assert not watcher.check()
+    assert [config.version for config in applied] == ['v2']
+
+
+def test_unreadable_artifact_keeps_the_current_config(tmp_path, capsys):
+    path = str(tmp_path / 'engine_config.json')
+    write_version(path, 'v1', 0)
+    applied = []
+    watcher = ConfigWatcher(path, applied.append)
+
+    with open(path, 'w') as f:
+        f.write('{"scoring_weights": ')
+    os.utime(path, (time.time() + 10,) * 2)
+    assert not watcher.check()
+    assert applied == []
+    assert 'reload failed' in capsys.readouterr().out
+
+    write_version(path, 'v3', 20)
+    assert watcher.check()
+    assert [config.version for config in applied] == ['v3']
+
+
+def test_missing_artifact_is_not_a_change(tmp_path):
+    path = str(tmp_path / 'engine_config.json')
+    applied = []
+    watcher = ConfigWatcher(path, applied.append)
+    assert not watcher.check()
+
+    write_version(path, 'v1', 0)
+    assert watcher.check()
+    os.remove(path)
+    assert not watcher.check()
+    assert [config.version for config in applied] == ['v1']
+
+
+def test_started_watcher_picks_up_a_new_version(tmp_path):
+    path = str(tmp_path / 'engine_config.json')
+    write_version(path, 'v1', 0)
+    applied = []
+    watcher = ConfigWatcher(path, applied.append, interval=0.01).start()
+    try:
+        write_version(path, 'v2', 10)
+        deadline = time.time() + 5
+        while not applied and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+    assert [config.version for config in applied] == ['v2']
+    assert watcher._thread is None
@@ -0,0 +1,70 @@
+"""AsOfFeatureStore lookups: pregame ELO at kickoff, settled ELO afterwards, ranks within a season"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from feature_store import AsOfFeatureStore
+
+
+@pytest.fixture
+def store():
+    """Team 1's 2023 season (ranked), a game with no pregame ELO, then its 2024 opener"""
+    return AsOfFeatureStore(pd.DataFrame({
+        'season': [2023, 2023, 2023, 2024],
+        'start_date': pd.to_datetime(['2023-09-02 16:00', '2023-09-09 19:30', '2023-09-16 23:00',
+                                      '2024-08-31 16:00'], utc=True),
+        'home_team_id': [1, 2, 1, 1],
+        'away_team_id': [2, 1, 3, 4],
+        'home_pregame_elo': [1600.0, 1500.0, np.nan, 1650.0],
+        'away_pregame_elo': [1500.0, 1620.0, 1400.0, 1300.0],
+        'home_postgame_elo': [1620.0, 1490.0, 1640.0, 1660.0],
+        'away_postgame_elo': [1480.0, 1630.0, 1390.0, 1290.0],
+        'home_team_rank': [10.0, np.nan, 8.0, np.nan],
+        'away_team_rank': [np.nan, 9.0, np.nan, np.nan],
+        'home_conf': ['SEC', 'ACC', 'SEC', 'SEC'],
+        'away_conf': ['ACC', 'SEC', 'Sun Belt', 'Big Ten'],
+    }))
+
+
+def lookup_one(store, team_id, date):
+    return store.lookup([team_id], [pd.Timestamp(date, tz='UTC')]).iloc[0]
+
+
+def test_kickoff_uses_that_games_pregame_elo(store):
+    assert lookup_one(store, 1, '2023-09-02 16:00')['elo'] == 1600.0
+    assert lookup_one(store, 1, '2023-09-09 19:30')['elo'] == 1620.0
+    assert lookup_one(store, 2, '2023-09-09 19:30')['elo'] == 1500.0
+
+
+def test_later_dates_use_the_prior_games_postgame_elo(store):
+    # After the opener, before the next kickoff: the opener's result is known
+    assert lookup_one(store, 1, '2023-09-05')['elo'] == 1620.0
+    assert lookup_one(store, 2, '2023-09-05')['elo'] == 1480.0
+    assert lookup_one(store, 1, '2023-09-12')['elo'] == 1630.0
+
+
+def test_missing_pregame_elo_falls_back_to_the_previous_result(store):
+    assert lookup_one(store, 1, '2023-09-16 23:00')['elo'] == 1630.0
+    assert lookup_one(store, 1, '2023-09-20')['elo'] == 1640.0
+
+
+def test_nothing_is_known_before_a_teams_first_game(store):
+    resolved = store.lookup([1, 99], pd.to_datetime(['2023-08-01', '2023-09-20'], utc=True))
+    assert resolved['elo'].isna().all()
+    assert resolved['rank'].isna().all()
+    assert resolved['as_of'].tolist() == [-1, -1]
+
+
+def test_rank_carries_within_the_season_and_resets_at_the_next(store):
+    assert lookup_one(store, 1, '2023-09-12')['rank'] == 9.0
+    assert lookup_one(store, 1, '2023-09-20')['rank'] == 8.0
+    # A January date is still the 2023 season (bowl games)
+    assert lookup_one(store, 1, '2024-01-05')['rank'] == 8.0
+    preseason = lookup_one(store, 1, '2024-08-20')
+    assert np.isnan(preseason['rank'])
+    assert preseason['elo'] == 1640.0
+
+
+def test_conference_is_the_latest_known(store):
+    resolved = store.lookup([1, 3], pd.to_datetime(['2023-09-12', '2023-09-20'], utc=True))
+    assert resolved['conference'].tolist() == ['SEC', 'Sun Belt']
@@ -0,0 +1,71 @@
+"""IncrementalSlate refreshes against a full per-game generate_game_prediction rescore"""
+
+import pandas as pd
+from incremental_slate import IncrementalSlate
+from conftest import INSIGHTS, comparable, full_rescore
+
+
+def test_refresh_matches_full_rescore(core, games):
+    slate = IncrementalSlate(core)
+    delta = slate.refresh(games)
+    assert len(delta['added']) == len(games)
+    assert comparable(slate.current_predictions()) == comparable(full_rescore(core, games))
+
+    # Line move, forecast change, rating change, two games dropped and one new
+    updated = games.copy()
+    updated.loc[5, 'spread'] = updated.loc[5, 'spread'] - 10
+    updated.loc[9, 'temperature'] = 10
+    updated.loc[11, 'home_elo'] = 2500
+    removed_ids = updated.loc[[20, 21], 'id'].tolist()
+    updated = pd.concat([updated.drop(index=[20, 21]), games.iloc[[0]].assign(id=99999)], ignore_index=True)
+
+    delta = slate.refresh(updated)
+    assert sorted(delta['removed']) == sorted(removed_ids)
+    assert [prediction['game_id'] for prediction in delta['added']] == [99999]
+    assert delta['rescored_games'] < len(updated)
+    assert comparable(slate.current_predictions()) == comparable(full_rescore(core, updated))
+
+    # Nothing moved: nothing rescored
+    delta = slate.refresh(updated.copy())
+    assert (delta['rescored_games'], delta['factor_evaluations']) == (0, 0)
+
+    # New insights rescore every game
+    core.set_insights({**INSIGHTS, 'weather': {'dome_advantage': {'difference': 3}}})
+    delta = slate.refresh(updated)
+    assert delta['rescored_games'] == len(updated)
+    assert comparable(slate.current_predictions()) == comparable(full_rescore(core, updated))
+
+
+def test_chunked_refresh_matches_bulk(core, games):
+    bulk = IncrementalSlate(core)
+    bulk.refresh(games)
+
+    chunked = IncrementalSlate(core)
+    deltas = list(chunked.refresh_chunks(games.iloc[start:start + 60] for start in range(0, len(games), 60)))
+    streamed = [prediction for delta in deltas for prediction in delta['predictions']]
+    assert comparable(chunked.render_notes(streamed)) == comparable(bulk.current_predictions())
+    assert comparable(chunked.current_predictions()) == comparable(bulk.current_predictions())
+
+
+def test_abandoned_stream_keeps_previous_slate(core, games):
+    slate = IncrementalSlate(core)
+    slate.refresh(games)
+    before = comparable(slate.current_predictions())
+
+    # Every game rescored with another game's inputs, then the stream is dropped
+    shuffled = games.iloc[::-1].assign(id=games['id'].to_numpy())
+    stream = slate.refresh_chunks([shuffled])
+    next(stream)
+    stream.close()
+
+    assert comparable(slate.current_predictions()) == before
+    assert slate.refresh(games)['rescored_games'] == 0
+    assert comparable(slate.current_predictions()) == before
+
+
+def test_predictions_handed_out_are_copies(core, games):
+    slate = IncrementalSlate(core)
+    delta = slate.refresh(games)
+    delta['predictions'][0]['spread_pick'] = 'EDITED'
+    slate.current_predictions()[1]['spread_pick'] = 'EDITED'
+    assert 'EDITED' not in [prediction['spread_pick'] for prediction in slate.current_predictions()]
@@ -0,0 +1,86 @@
+"""Rest features at the bye and short-week edges, on local calendar dates"""
+
+import numpy as np
+import pandas as pd
+from schedule_features import BYE_MIN_DAYS, SHORT_WEEK_MAX_DAYS, build_rest_features
+
+
+def team_schedule(kickoffs, season=2024, timezones=None, neutral=None):
+    """Team 1 against a new opponent each game, alternating home and away"""
+    n = len(kickoffs)
+    schedule = pd.DataFrame({
+        'id': np.arange(1, n + 1),
+        'season': season,
+        'start_date': pd.to_datetime(kickoffs, utc=True),
+        'home_team_id': [1 if k % 2 == 0 else 100 + k for k in range(n)],
+        'away_team_id': [100 + k if k % 2 == 0 else 1 for k in range(n)],
+        'is_neutral_site': neutral if neutral is not None else False,
+    })
+    if timezones is not None:
+        schedule['venue_timezone'] = timezones
+    return schedule
+
+
+def team_rows(schedule):
+    """Team 1's rest features per game, whichever side it played"""
+    features = build_rest_features(schedule).set_index('id')
+    rows = []
+    for game in schedule.itertuples():
+        side = 'home' if game.home_team_id == 1 else 'away'
+        rows.append({column[len(side) + 1:]: value for column, value in features.loc[game.id].items()
+                     if column.startswith(side + '_')})
+    return pd.DataFrame(rows)
+
+
+def test_bye_edge():
+    # Saturday afternoon kickoffs (Eastern), 12 and then 13 calendar days apart
+    rows = team_rows(team_schedule(['2024-08-31 16:00', '2024-09-12 16:00', '2024-09-25 16:00']))
+    assert np.isnan(rows.loc[0, 'days_rest'])
+    assert rows['days_rest'].tolist()[1:] == [12, BYE_MIN_DAYS]
+    assert rows['off_bye'].tolist() == [False, False, True]
+
+
+def test_short_week_edge():
+    rows = team_rows(team_schedule(['2024-08-31 16:00', '2024-09-05 23:00', '2024-09-11 23:00']))
+    assert rows['days_rest'].tolist()[1:] == [SHORT_WEEK_MAX_DAYS, 6]
+    assert rows['short_week'].tolist() == [False, True, False]
+
+
+def test_late_kickoffs_count_on_the_eastern_date():
+    # Saturday 10:30 PM ET is Sunday in UTC; the following Friday is six days later, not a short week
+    rows = team_rows(team_schedule(['2024-09-08 02:30', '2024-09-13 23:00']))
+    assert rows.loc[1, 'days_rest'] == 6
+    assert not rows.loc[1, 'short_week']
+
+
+def test_venue_timezone_sets_the_calendar_date():
+    # Saturday 10 PM Pacific, then Friday 7 PM Pacific: Sunday and Friday on Eastern dates
+    kickoffs = ['2024-09-08 05:00', '2024-09-14 02:00']
+    pacific = team_rows(team_schedule(kickoffs, timezones=['America/Los_Angeles'] * 2))
+    eastern = team_rows(team_schedule(kickoffs))
+    assert pacific.loc[1, 'days_rest'] == 6 and not pacific.loc[1, 'short_week']
+    assert eastern.loc[1, 'days_rest'] == 5 and eastern.loc[1, 'short_week']
+
+
+def test_unknown_timezones_fall_back_to_eastern():
+    kickoffs = ['2024-09-08 02:30', '2024-09-13 23:00']
+    rows = team_rows(team_schedule(kickoffs, timezones=[None, 'Not/AZone']))
+    assert rows.loc[1, 'days_rest'] == 6
+
+
+def test_rest_and_streaks_reset_each_season():
+    schedule = pd.concat([
+        team_schedule(['2023-11-25 16:00'], season=2023),
+        team_schedule(['2024-08-31 16:00', '2024-09-07 16:00'], season=2024).assign(id=[2, 3]),
+    ], ignore_index=True)
+    rows = team_rows(schedule)
+    assert np.isnan(rows.loc[1, 'days_rest'])
+    assert not rows.loc[1, 'off_bye']
+    assert rows['road_streak'].tolist() == [0, 0, 1]
+
+
+def test_neutral_sites_extend_the_road_streak_and_window_counts_prior_games():
+    kickoffs = ['2024-08-31 16:00', '2024-09-07 16:00', '2024-09-14 16:00', '2024-10-12 16:00']
+    rows = team_rows(team_schedule(kickoffs, neutral=[True, False, True, False]))
+    assert rows['road_streak'].tolist() == [1, 2, 3, 4]
+    assert rows['games_last_window'].tolist() == [0, 1, 2, 0]
@@ -0,0 +1,15 @@
+"""The vectorized comprehensive scorer against per-game generate_game_prediction"""
+
+from conftest import comparable, full_rescore
+
+
+def test_predictions_from_scores_matches_generate_game_prediction(core, games):
+    vectorized = core.predictions_from_scores(games, core.factor_scores(games))
+    assert comparable(vectorized) == comparable(full_rescore(core, games))
+
+
+def test_predictions_without_notes_render_the_same_text(core, games):
+    silent = core.predictions_from_scores(games, core.factor_scores(games), notes=False)
+    assert all(prediction['rick_notes'] is None for prediction in silent)
+    rendered = [core.notes_text(codes) for codes in core.note_codes(games).tolist()]
+    assert rendered == [prediction['rick_notes'] for prediction in full_rescore(core, games)]
@@ -0,0 +1,138 @@
+"""Staging rows and the COPY buffer written by the bulk slate job"""
+
+import csv
+import numpy as np
+import pandas as pd
+from incremental_slate import FACTORS, IncrementalSlate
+from slate_job import (STAGING_COLUMNS, NULLABLE_COLUMNS, COPY_SQL, MERGE_SQL, STAGING_DDL,
+                       build_slate_rows, pg_array_literal, to_copy_buffer, write_slate)
+
+
+class RecordingConnection:
+    """Stands in for a psycopg2 connection: records statements and answers the merge with fixed counts"""
+
+    def __init__(self, counts=(0, 0, 0, 0), fail_on=None):
+        self.counts = counts
+        self.fail_on = fail_on
+        self.statements = []
+        self.copied = None
+        self.committed = False
+        self.rolled_back = False
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        if sql == self.fail_on:
+            raise RuntimeError('merge failed')
+        self.statements.append(sql)
+
+    def copy_expert(self, sql, buffer):
+        self.statements.append(sql)
+        self.copied = buffer.read()
+
+    def fetchone(self):
+        return self.counts
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def slate_rows(core, games):
+    slate = IncrementalSlate(core)
+    slate.refresh(games)
+    predictions = slate.current_predictions()
+    return predictions, build_slate_rows(games, predictions, slate.factors[:, FACTORS.index('elo')])
+
+
+def test_build_slate_rows(core, games):
+    predictions, rows = slate_rows(core, games)
+    assert list(rows.columns) == list(STAGING_COLUMNS)
+    assert rows['game_id'].tolist() == games['id'].tolist()
+
+    by_id = games.set_index('id')
+    for prediction, row in zip(predictions, rows.itertuples()):
+        game = by_id.loc[row.game_id]
+        if pd.isna(prediction['rick_spread']):
+            assert np.isnan(row.predicted_spread)
+        else:
+            # Rick's spread is from the home side: negative favors the home team
+            expected = game['home_team_id'] if prediction['rick_spread'] <= 0 else game['away_team_id']
+            assert row.predicted_winner_id == expected
+        assert row.spread_confidence == round(prediction['spread_confidence'])
+        assert row.confidence == prediction['spread_confidence'] / 100
+        assert row.notes == prediction['rick_notes']
+        assert row.key_factors == pg_array_literal(prediction['key_factors'])
+
+
+def test_games_without_a_line_follow_the_elo_edge(core, games):
+    games = games.assign(spread=np.nan)
+    slate = IncrementalSlate(core)
+    slate.refresh(games)
+    elo_edges = slate.factors[:, FACTORS.index('elo')]
+    rows = build_slate_rows(games, slate.current_predictions(), elo_edges)
+    expected = np.where(elo_edges >= 0, games['home_team_id'], games['away_team_id'])
+    assert rows['predicted_winner_id'].tolist() == expected.tolist()
+
+
+def test_pg_array_literal_escapes_quotes_and_backslashes():
+    assert pg_array_literal(['Weather: +1.0', 'say "hi"', 'a\\b']) == '{"Weather: +1.0","say \\"hi\\"","a\\\\b"}'
+    assert pg_array_literal([]) == '{}'
+
+
+def test_to_copy_buffer_round_trip(core, games):
+    _, rows = slate_rows(core, games)
+    rows.loc[0, 'notes'] = 'Line, "quoted" and\nmultiline'
+    rows.loc[1, 'predicted_spread'] = np.nan
+
+    parsed = list(csv.reader(to_copy_buffer(rows)))
+    assert len(parsed) == len(rows)
+    assert all(len(record) == len(STAGING_COLUMNS) for record in parsed)
+
+    columns = list(STAGING_COLUMNS)
+    assert parsed[0][columns.index('notes')] == 'Line, "quoted" and\nmultiline'
+    # Missing numbers are empty fields, which FORCE_NULL turns into NULL
+    assert 'predicted_spread' in NULLABLE_COLUMNS
+    assert parsed[1][columns.index('predicted_spread')] == ''
+
+    round_trip = pd.DataFrame(parsed, columns=columns)
+    assert round_trip['game_id'].astype(int).tolist() == rows['game_id'].tolist()
+    assert round_trip['key_factors'].tolist() == rows['key_factors'].tolist()
+    assert round_trip['spread_pick'].tolist() == rows['spread_pick'].tolist()
+
+
+def test_write_slate_is_one_copy_and_one_merge(core, games):
+    _, rows = slate_rows(core, games)
+    conn = RecordingConnection(counts=(300, 100, 250, 90))
+    result = write_slate(conn, rows)
+
+    assert conn.statements == [STAGING_DDL, COPY_SQL, MERGE_SQL]
+    assert conn.copied == to_copy_buffer(rows).read()
+    assert conn.committed and not conn.rolled_back
+    assert result['rows'] == len(games)
+    assert (result['picks_inserted'], result['picks_updated']) == (250, 90)
+    # Conflicting picks the merge skipped are Rick's own or locked
+    assert result['picks_kept'] == len(games) - 250 - 90
+
+
+def test_write_slate_rolls_back_on_failure(core, games, capsys):
+    _, rows = slate_rows(core, games)
+    conn = RecordingConnection(fail_on=MERGE_SQL)
+    assert write_slate(conn, rows) is None
+    assert conn.rolled_back and not conn.committed
+    assert 'Slate write failed' in capsys.readouterr().out
+
+
+def test_merge_only_updates_unlocked_slate_job_picks():
+    picks_conflict = MERGE_SQL.split('INSERT INTO ricks_picks')[1]
+    assert "'slate_job'" in picks_conflict
+    assert "WHERE ricks_picks.source = 'slate_job' AND ricks_picks.is_locked IS NOT TRUE" in picks_conflict
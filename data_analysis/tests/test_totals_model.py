@@ -0,0 +1,95 @@
+"""TotalsModel fit/predict on a synthetic league with known team strengths"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from totals_model import MODEL_VERSION, TOTALS_FEATURES, TotalsModel
+
+SEASONS = range(2020, 2024)
+TEAMS = np.arange(1, 41)
+
+
+def synthetic_games(seed=3):
+    """Four seasons of a 40-team league; the last three weeks of the final season are unplayed"""
+    rng = np.random.default_rng(seed)
+    offense = rng.normal(0, 6, len(TEAMS))
+    defense = rng.normal(0, 6, len(TEAMS))
+    rows = []
+    for season in SEASONS:
+        offense = 0.6 * offense + rng.normal(0, 4.5, len(TEAMS))
+        defense = 0.6 * defense + rng.normal(0, 4.5, len(TEAMS))
+        kickoff = pd.Timestamp(f'{season}-09-05 17:00', tz='UTC')
+        for week in range(12):
+            order = rng.permutation(len(TEAMS))
+            for home, away in zip(order[::2], order[1::2]):
+                temperature = rng.normal(60, 18)
+                true_total = 56 + offense[home] - defense[away] + offense[away] - defense[home] - 4 * (temperature < 32)
+                played = not (season == SEASONS[-1] and week >= 9)
+                points = true_total + rng.normal(0, 14) if played else np.nan
+                rows.append({
+                    'id': len(rows) + 1, 'season': season, 'week': week + 1,
+                    'start_date': kickoff + pd.Timedelta(days=7 * week), 'completed': played,
+                    'home_team_id': TEAMS[home], 'away_team_id': TEAMS[away],
+                    'home_team_score': np.round(points / 2), 'away_team_score': np.round(points / 2),
+                    'is_neutral_site': False, 'temperature': temperature, 'wind_speed': 5.0,
+                    'precipitation': 0.0, 'is_dome': False, 'true_total': true_total,
+                })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture(scope='module')
+def games():
+    return synthetic_games()
+
+
+@pytest.fixture(scope='module')
+def model(games):
+    return TotalsModel.fit(games, fingerprint='synthetic')
+
+
+def test_first_season_has_nothing_to_fit_on(games, model):
+    predicted = model.predict(games)['model_total']
+    first = games['season'] == SEASONS[0]
+    assert predicted[first].isna().all()
+    assert predicted[~first].notna().all()
+    assert model.coefficients.shape[1] == len(TOTALS_FEATURES)
+
+
+def test_predictions_track_team_strength(games, model):
+    later = games[(games['season'] > SEASONS[0]) & (games['week'] > 4)]
+    predicted = model.predict(later)['model_total']
+    error = (predicted - later['true_total']).abs().mean()
+    spread = (later['true_total'] - later['true_total'].mean()).abs().mean()
+    assert error < 0.75 * spread
+    # Upcoming games are scored from the ratings as of their kickoff
+    assert predicted[~later['completed']].notna().all()
+
+
+def test_later_results_do_not_move_earlier_predictions(games, model):
+    changed = games.copy()
+    last_played = changed.index[changed['completed']][-20:]
+    changed.loc[last_played, 'home_team_score'] += 21
+
+    before = model.predict(games)['model_total'].to_numpy()
+    after = TotalsModel.fit(changed).predict(changed)['model_total'].to_numpy()
+    through = last_played[-1] + 1
+    np.testing.assert_allclose(after[:through], before[:through], equal_nan=True)
+    assert not np.allclose(after[through:], before[through:])
+
+
+def test_save_and_load_round_trip(games, model, tmp_path):
+    path = str(tmp_path / 'totals_model.npz')
+    loaded = TotalsModel.load(model.save(path))
+    assert loaded.fingerprint == 'synthetic'
+    pd.testing.assert_frame_equal(loaded.predict(games), model.predict(games))
+
+
+def test_load_rejects_other_model_versions(model, tmp_path):
+    path = str(tmp_path / 'totals_model.npz')
+    model.save(path)
+    with np.load(path) as arrays:
+        payload = dict(arrays)
+    payload['version'] = np.array(MODEL_VERSION - 1)
+    np.savez(path, **payload)
+    with pytest.raises(ValueError):
+        TotalsModel.load(path)
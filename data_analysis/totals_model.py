@@ -0,0 +1,425 @@
+"""
+Totals Model
+Over/under predictions from team scoring ratings rather than the spread
+factors. Each team has an offensive and a defensive points rating, fitted as of
+every week of every season (so history is scored only with games played
+before kickoff), a pace proxy from prior-season yardage, and weather/dome
+adjustments fitted on the residual totals:
+
+    total = 2 * mu + (offense_home - defense_home) + (offense_away - defense_away)
+            + coefficients . [1, pace_home + pace_away, weather and dome flags]
+
+mu, the home edge the ratings are fitted against and the coefficients are
+expanding per-season fits: a season's values come only from the seasons
+before it, so backtests score every game out of sample. The earliest season
+has no earlier seasons to fit on and predicts NaN (callers fall back to the
+line there).
+
+Ratings are ridge estimates solved with alternating np.bincount updates, warm
+started week to week, and cached in .cache/totals_model.npz keyed by a
+fingerprint of the completed games. predict() scores any frame of games, the
+upcoming slate or the whole backtest history, in one vectorized call.
+
+Usage:
+    python totals_model.py [--refit]
+"""
+
+import os
+import time
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+from cfbd_cache import CACHE_DIR
+from feature_store import to_epoch_seconds
+from weather_kernel import ALGORITHM_PROFILE, weather_codes
+
+TOTALS_MODEL_PATH = os.path.join(CACHE_DIR, 'totals_model.npz')
+MODEL_VERSION = 2
+
+SHRINKAGE_GAMES = 3.0       # ridge penalty, in games' worth of evidence toward the prior
+SEASON_CARRYOVER = 0.6      # share of last season's final rating kept as this season's prior
+INITIAL_ITERATIONS = 25
+WARM_ITERATIONS = 6
+
+# Residual regressors; weather flags follow the algorithm profile's buckets and
+# are zero indoors
+TOTALS_FEATURES = ['intercept', 'pace', 'dome', 'freezing', 'cold', 'hot',
+                   'moderate_wind', 'high_wind', 'precipitation']
+
+# Rating periods run Tuesday to Monday so a week's Thursday and Saturday games share one
+SECONDS_PER_DAY = 86400
+PERIOD_DAYS = 7
+TUESDAY_OFFSET = 2          # epoch day 0 was a Thursday, two days after a Tuesday
+
+
+def load_totals_games(conn) -> pd.DataFrame:
+    """Every dated game with the fields the ratings and weather adjustments read"""
+    query = """
+    SELECT
+        g.id, g.season, g.week, g.start_date, g.completed,
+        g.home_team_id, g.away_team_id, g.home_team_score, g.away_team_score,
+        g.is_neutral_site, g.over_under,
+        g.temperature, g.wind_speed, g.precipitation, g.is_dome
+    FROM games g
+    WHERE g.start_date IS NOT NULL
+    ORDER BY g.start_date
+    """
+    return pd.read_sql(query, conn)
+
+
+def load_pace_proxies(conn) -> pd.DataFrame:
+    """Yards gained plus allowed per game for each team-season (team_season_stats)"""
+    query = """
+    SELECT team_id, season,
+           (total_offense_yards + total_defense_yards)::float / NULLIF(wins + losses, 0) AS yards_per_game
+    FROM team_season_stats
+    """
+    return pd.read_sql(query, conn)
+
+
+def games_fingerprint(conn) -> str:
+    """Changes whenever a game is completed, rescored or added"""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT count(*), max(id), sum(home_team_score), sum(away_team_score)
+            FROM games WHERE completed = true AND home_team_score IS NOT NULL
+        """)
+        summary = cursor.fetchone()
+    return hashlib.sha1(repr((MODEL_VERSION, *summary)).encode()).hexdigest()[:16]
+
+
+def _epoch_days(dates) -> np.ndarray:
+    return to_epoch_seconds(dates) // SECONDS_PER_DAY
+
+
+def _period_origin(first_day: int) -> int:
+    """The Tuesday on or before a season's first game day"""
+    return first_day - (first_day + TUESDAY_OFFSET) % PERIOD_DAYS
+
+
+def _prior_season_means(positions: np.ndarray, values: np.ndarray, n_seasons: int) -> np.ndarray:
+    """
+    Mean of values over all earlier seasons for each season position. The
+    earliest season with data has nothing before it and uses its own mean;
+    seasons with no data at all get 0.
+    """
+    totals = np.bincount(positions, values, minlength=n_seasons)
+    counts = np.bincount(positions, minlength=n_seasons).astype(np.float64)
+    prior_totals = np.cumsum(totals) - totals
+    prior_counts = np.cumsum(counts) - counts
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(prior_counts > 0, prior_totals / prior_counts, totals / counts)
+    return np.nan_to_num(means)
+
+
+def _fit_ratings(offense, defense, points, baseline, n_teams, prior_offense, prior_defense,
+                 start_offense, start_defense, iterations):
+    """
+    Ridge offense/defense ratings by alternating exact updates: points =
+    baseline + offense[o] - defense[d], each rating shrunk toward its prior.
+    """
+    offense_games = np.bincount(offense, minlength=n_teams) + SHRINKAGE_GAMES
+    defense_games = np.bincount(defense, minlength=n_teams) + SHRINKAGE_GAMES
+    ratings_offense, ratings_defense = start_offense.copy(), start_defense.copy()
+    for _ in range(iterations):
+        ratings_offense = (np.bincount(offense, points - baseline + ratings_defense[defense], n_teams)
+                           + SHRINKAGE_GAMES * prior_offense) / offense_games
+        ratings_defense = (np.bincount(defense, baseline + ratings_offense[offense] - points, n_teams)
+                           + SHRINKAGE_GAMES * prior_defense) / defense_games
+    return ratings_offense, ratings_defense
+
+
+def weather_features(games: pd.DataFrame) -> np.ndarray:
+    """Dome, temperature, wind and precipitation flags per game (outdoor flags zero under a dome)"""
+    codes = weather_codes(games['temperature'], games['wind_speed'], games.get('precipitation'),
+                          games.get('is_dome'), profile=ALGORITHM_PROFILE)
+    outdoor = ~codes['dome']
+    return np.column_stack([
+        codes['dome'],
+        outdoor & (codes['temperature'] == 0),
+        outdoor & (codes['temperature'] == 1),
+        outdoor & (codes['temperature'] == 3),
+        outdoor & (codes['wind'] == 1),
+        outdoor & (codes['wind'] == 2),
+        outdoor & codes['precipitation'],
+    ]).astype(np.float64)
+
+
+class TotalsModel:
+    """Week-by-week team scoring ratings, pace proxies and residual coefficients"""
+
+    ARRAYS = ('team_ids', 'snapshot_keys', 'offense', 'defense', 'season_origins',
+              'pace_keys', 'pace_values', 'parameter_seasons', 'season_mu', 'coefficients')
+
+    def __init__(self, team_ids, snapshot_keys, offense, defense, season_origins, pace_keys, pace_values,
+                 parameter_seasons, season_mu, coefficients, fingerprint: str = ''):
+        self.team_ids = np.asarray(team_ids, dtype=np.int64)
+        self.snapshot_keys = np.asarray(snapshot_keys, dtype=np.int64)   # season * 100 + period
+        self.offense = np.asarray(offense, dtype=np.float64)             # snapshots x teams
+        self.defense = np.asarray(defense, dtype=np.float64)
+        self.season_origins = np.asarray(season_origins, dtype=np.int64)  # (season, first period day) pairs
+        self.pace_keys = np.asarray(pace_keys, dtype=np.int64)           # team_id * 10000 + season
+        self.pace_values = np.asarray(pace_values, dtype=np.float64)
+        self.parameter_seasons = np.asarray(parameter_seasons, dtype=np.int64)
+        self.season_mu = np.asarray(season_mu, dtype=np.float64)         # per parameter season
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)   # parameter seasons x TOTALS_FEATURES
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def fit(cls, games: pd.DataFrame, pace: Optional[pd.DataFrame] = None, fingerprint: str = '') -> 'TotalsModel':
+        """
+        Fit ratings for every season and period in games, then each season's
+        residual coefficients on the seasons before it
+        """
+        games = games[games['start_date'].notna()].reset_index(drop=True)
+        if len(games) == 0:
+            raise ValueError("no games to fit")
+        team_ids = np.unique(np.concatenate([games['home_team_id'].to_numpy(np.int64),
+                                             games['away_team_id'].to_numpy(np.int64)]))
+        n_teams = len(team_ids)
+        seasons = games['season'].to_numpy(np.int64)
+        days = _epoch_days(games['start_date'])
+
+        first_days = pd.Series(days).groupby(seasons).min()
+        season_origins = np.array([(season, _period_origin(day)) for season, day in first_days.items()],
+                                  dtype=np.int64).reshape(-1, 2)
+        # One season past the last, so the upcoming season has parameters too
+        parameter_seasons = np.arange(int(seasons.min()), int(seasons.max()) + 2)
+        model = cls(team_ids, [], np.empty((0, n_teams)), np.empty((0, n_teams)), season_origins,
+                    [], [], parameter_seasons, np.zeros(len(parameter_seasons)),
+                    np.full((len(parameter_seasons), len(TOTALS_FEATURES)), np.nan), fingerprint)
+        periods = model._periods(seasons, days)
+
+        completed = (games['completed'].eq(True) & games['home_team_score'].notna() &
+                     games['away_team_score'].notna()).to_numpy()
+        home = np.searchsorted(team_ids, games['home_team_id'].to_numpy(np.int64))
+        away = np.searchsorted(team_ids, games['away_team_id'].to_numpy(np.int64))
+        home_points = pd.to_numeric(games['home_team_score'], errors='coerce').to_numpy(np.float64)
+        away_points = pd.to_numeric(games['away_team_score'], errors='coerce').to_numpy(np.float64)
+        side = np.where(games['is_neutral_site'].eq(True).to_numpy() if 'is_neutral_site' in games
+                        else np.zeros(len(games), dtype=bool), 0.0, 1.0)
+
+        # One row per team-game: the scoring side's offense against the other's defense
+        offense = np.concatenate([home[completed], away[completed]])
+        defense = np.concatenate([away[completed], home[completed]])
+        points = np.concatenate([home_points[completed], away_points[completed]])
+        venue = np.concatenate([side[completed], -side[completed]])
+        row_seasons = np.tile(seasons[completed], 2)
+        row_periods = np.tile(periods[completed], 2)
+        hosted = completed & (side > 0)
+
+        # Points per team-game and half the home margin, from earlier seasons only
+        row_position = row_seasons - parameter_seasons[0]
+        hosted_position = seasons[hosted] - parameter_seasons[0]
+        mu = _prior_season_means(row_position, points, len(parameter_seasons))
+        home_edge = _prior_season_means(hosted_position, (home_points[hosted] - away_points[hosted]) / 2,
+                                        len(parameter_seasons))
+        baseline = mu[row_position] + home_edge[row_position] * venue
+
+        keys, offense_snapshots, defense_snapshots = [], [], []
+        final_offense, final_defense = np.zeros(n_teams), np.zeros(n_teams)
+        for season in parameter_seasons:
+            prior_offense = SEASON_CARRYOVER * final_offense
+            prior_defense = SEASON_CARRYOVER * final_defense
+            ratings_offense, ratings_defense = prior_offense, prior_defense
+            in_season = np.flatnonzero(row_seasons == season)
+            season_periods = row_periods[in_season]
+            last_period = int(season_periods.max()) + 1 if len(in_season) else 0
+            fitted = 0
+            for period in range(last_period + 1):
+                # Snapshot for games in this period: everything played before it
+                rows = in_season[season_periods < period]
+                if len(rows) > fitted:
+                    ratings_offense, ratings_defense = _fit_ratings(
+                        offense[rows], defense[rows], points[rows], baseline[rows], n_teams,
+                        prior_offense, prior_defense, ratings_offense, ratings_defense,
+                        INITIAL_ITERATIONS if fitted == 0 else WARM_ITERATIONS)
+                    fitted = len(rows)
+                keys.append(season * 100 + period)
+                offense_snapshots.append(ratings_offense)
+                defense_snapshots.append(ratings_defense)
+            final_offense, final_defense = ratings_offense, ratings_defense
+
+        model.snapshot_keys = np.array(keys, dtype=np.int64)
+        model.offense = np.array(offense_snapshots)
+        model.defense = np.array(defense_snapshots)
+        model.season_mu = mu
+        if pace is not None and len(pace):
+            model.pace_keys, model.pace_values = cls._pace_table(pace)
+
+        # Residual coefficients on completed games, each scored with its as-of
+        # ratings; a season's fit accumulates the normal equations of the
+        # seasons before it (lstsq keeps the min-norm solution when a flag
+        # has not occurred yet)
+        components = model.components(games[completed])
+        residual = home_points[completed] + away_points[completed] - components['ratings_total']
+        design = model._design(games[completed], components['pace'])
+        game_position = seasons[completed] - parameter_seasons[0]
+        gram = np.zeros((len(TOTALS_FEATURES), len(TOTALS_FEATURES)))
+        moment = np.zeros(len(TOTALS_FEATURES))
+        for position in range(len(parameter_seasons)):
+            if gram[0, 0] > 0:
+                model.coefficients[position] = np.linalg.lstsq(gram, moment, rcond=None)[0]
+            rows = game_position == position
+            gram += design[rows].T @ design[rows]
+            moment += design[rows].T @ residual[rows]
+        return model
+
+    @staticmethod
+    def _pace_table(pace: pd.DataFrame):
+        """Yards per game standardized within each season, keyed by team and season"""
+        pace = pace.dropna(subset=['yards_per_game'])
+        grouped = pace.groupby('season')['yards_per_game']
+        spread = grouped.transform('std').replace(0, np.nan)
+        values = ((pace['yards_per_game'] - grouped.transform('mean')) / spread).fillna(0.0)
+        keys = pace['team_id'].to_numpy(np.int64) * 10000 + pace['season'].to_numpy(np.int64)
+        order = np.argsort(keys)
+        return keys[order], values.to_numpy(np.float64)[order]
+
+    def _periods(self, seasons: np.ndarray, days: np.ndarray) -> np.ndarray:
+        """Rating period of each game within its season (unknown seasons start at period 0)"""
+        origin_seasons, origin_days = self.season_origins[:, 0], self.season_origins[:, 1]
+        position = np.minimum(np.searchsorted(origin_seasons, seasons), len(origin_seasons) - 1)
+        known = origin_seasons[position] == seasons
+        return np.where(known, np.clip((days - origin_days[position]) // PERIOD_DAYS, 0, 99), 0)
+
+    def _team_rows(self, team_ids) -> np.ndarray:
+        """Column of each team in the rating arrays, -1 for teams never seen"""
+        team_ids = np.asarray(team_ids, dtype=np.int64)
+        position = np.minimum(np.searchsorted(self.team_ids, team_ids), len(self.team_ids) - 1)
+        return np.where(self.team_ids[position] == team_ids, position, -1)
+
+    def _pace(self, team_ids, seasons) -> np.ndarray:
+        """Previous season's standardized pace (0 when unknown)"""
+        if len(self.pace_keys) == 0:
+            return np.zeros(len(seasons))
+        keys = np.asarray(team_ids, dtype=np.int64) * 10000 + (np.asarray(seasons, dtype=np.int64) - 1)
+        position = np.minimum(np.searchsorted(self.pace_keys, keys), len(self.pace_keys) - 1)
+        return np.where(self.pace_keys[position] == keys, self.pace_values[position], 0.0)
+
+    def _parameter_rows(self, seasons: np.ndarray) -> np.ndarray:
+        """Row of each season's mu and coefficients (later seasons use the latest fit)"""
+        position = np.searchsorted(self.parameter_seasons, seasons, side='right') - 1
+        return np.clip(position, 0, len(self.parameter_seasons) - 1)
+
+    def _design(self, games: pd.DataFrame, pace: np.ndarray) -> np.ndarray:
+        return np.column_stack([np.ones(len(games)), pace, weather_features(games)])
+
+    def components(self, games: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """As-of ratings total and summed pace proxy per game"""
+        seasons = games['season'].to_numpy(np.int64)
+        periods = self._periods(seasons, _epoch_days(games['start_date']))
+        snapshot = np.searchsorted(self.snapshot_keys, seasons * 100 + periods, side='right') - 1
+        usable = snapshot >= 0
+
+        def team_total(team_ids):
+            column = self._team_rows(games[team_ids].to_numpy(np.int64))
+            known = usable & (column >= 0)
+            rows, columns = np.maximum(snapshot, 0), np.maximum(column, 0)
+            return np.where(known, self.offense[rows, columns] - self.defense[rows, columns], 0.0)
+
+        pace = self._pace(games['home_team_id'], seasons) + self._pace(games['away_team_id'], seasons)
+        mu = self.season_mu[self._parameter_rows(seasons)]
+        return {
+            'ratings_total': 2 * mu + team_total('home_team_id') + team_total('away_team_id'),
+            'pace': pace,
+        }
+
+    def predict(self, games: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predicted total per game (needs season, start_date, home/away team ids
+        and the weather columns), aligned with the frame's index. NaN for
+        games in seasons with no earlier season to fit on.
+        """
+        components = self.components(games)
+        design = self._design(games, components['pace'])
+        coefficients = self.coefficients[self._parameter_rows(games['season'].to_numpy(np.int64))]
+        weather = (design[:, 2:] * coefficients[:, 2:]).sum(axis=1)
+        return pd.DataFrame({
+            'model_total': components['ratings_total'] + (design * coefficients).sum(axis=1),
+            'ratings_total': components['ratings_total'],
+            'pace_adjustment': components['pace'] * coefficients[:, 1],
+            'weather_adjustment': weather,
+        }, index=games.index)
+
+    def save(self, path: str = TOTALS_MODEL_PATH) -> str:
+        """Write the model atomically"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, version=np.array(MODEL_VERSION), fingerprint=np.array(self.fingerprint),
+                 **{name: getattr(self, name) for name in self.ARRAYS})
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str = TOTALS_MODEL_PATH) -> 'TotalsModel':
+        with np.load(path) as arrays:
+            if int(arrays['version']) != MODEL_VERSION:
+                raise ValueError(f"totals model version {int(arrays['version'])} != {MODEL_VERSION}")
+            return cls(*(arrays[name] for name in cls.ARRAYS), fingerprint=str(arrays['fingerprint']))
+
+
+def fit_totals_model(conn, fingerprint: str = '') -> TotalsModel:
+    """Fit from the database (pace proxies are skipped when team_season_stats is unavailable)"""
+    games = load_totals_games(conn)
+    try:
+        pace = load_pace_proxies(conn)
+    except Exception as e:
+        conn.rollback()
+        print(f"⚠️ No pace proxies, fitting without them: {e}")
+        pace = None
+    return TotalsModel.fit(games, pace, fingerprint)
+
+
+def load_totals_model(conn, path: str = TOTALS_MODEL_PATH, refit: bool = False) -> Optional[TotalsModel]:
+    """
+    The cached model when it was fitted on the current completed games,
+    otherwise a fresh fit written back to the cache. None if fitting fails.
+    """
+    try:
+        fingerprint = games_fingerprint(conn)
+        if not refit and os.path.exists(path):
+            try:
+                model = TotalsModel.load(path)
+                if model.fingerprint == fingerprint:
+                    return model
+            except Exception as e:
+                print(f"⚠️ Totals model cache unreadable, refitting: {e}")
+
+        started = time.time()
+        model = fit_totals_model(conn, fingerprint)
+        model.save(path)
+        print(f"🧮 Totals model fitted in {time.time() - started:.1f}s "
+              f"({len(model.team_ids)} teams, {len(model.snapshot_keys)} weekly snapshots)")
+        return model
+    except Exception as e:
+        print(f"❌ Totals model unavailable: {e}")
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit and cache the totals model")
+    parser.add_argument('--refit', action='store_true', help="ignore the cached fit")
+    args = parser.parse_args()
+
+    from database_connection import get_database_connection
+
+    print("🧮 TOTALS MODEL")
+    print("=" * 50)
+    conn = get_database_connection()
+    try:
+        model = load_totals_model(conn, refit=args.refit)
+    finally:
+        conn.close()
+    if model is not None:
+        season = model.parameter_seasons[-1]
+        print(f"Coefficients for {season} (fitted on {model.parameter_seasons[0]}-{season - 1}):")
+        for name, value in zip(TOTALS_FEATURES, model.coefficients[-1]):
+            print(f"   {name:14} {value:+.2f}")
+        print(f"✅ Baseline {2 * model.season_mu[-1]:.1f} points per game, cached at {TOTALS_MODEL_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Travel Distance Features
+Resolves every team to home coordinates once, precomputes a team x team
+distance and time-zone matrix, and looks up travel for any set of games
+"""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Optional
+
+EARTH_RADIUS_MILES = 3956
+
+# State name mapping for major college football teams (fallback when a team
+# has no CFBD home venue)
+TEAM_STATES = {
+    'Alabama': 'Alabama',
+    'Auburn': 'Alabama',
+    'Arizona': 'Arizona',
+    'Arizona State': 'Arizona',
+    'Arkansas': 'Arkansas',
+    'California': 'California',
+    'UCLA': 'California',
+    'USC': 'California',
+    'Stanford': 'California',
+    'Colorado': 'Colorado',
+    'UConn': 'Connecticut',
+    'Connecticut': 'Connecticut',
+    'Delaware': 'Delaware',
+    'Florida': 'Florida',
+    'Miami': 'Florida',
+    'Florida State': 'Florida',
+    'UCF': 'Florida',
+    'Georgia': 'Georgia',
+    'Georgia Tech': 'Georgia',
+    'Hawaii': 'Hawaii',
+    'Idaho': 'Idaho',
+    'Illinois': 'Illinois',
+    'Northwestern': 'Illinois',
+    'Indiana': 'Indiana',
+    'Notre Dame': 'Indiana',
+    'Iowa': 'Iowa',
+    'Iowa State': 'Iowa',
+    'Kansas': 'Kansas',
+    'Kansas State': 'Kansas',
+    'Kentucky': 'Kentucky',
+    'Louisiana': 'Louisiana',
+    'LSU': 'Louisiana',
+    'Tulane': 'Louisiana',
+    'Maine': 'Maine',
+    'Maryland': 'Maryland',
+    'Boston College': 'Massachusetts',
+    'Harvard': 'Massachusetts',
+    'Michigan': 'Michigan',
+    'Michigan State': 'Michigan',
+    'Minnesota': 'Minnesota',
+    'Mississippi': 'Mississippi',
+    'Ole Miss': 'Mississippi',
+    'Mississippi State': 'Mississippi',
+    'Missouri': 'Missouri',
+    'Montana': 'Montana',
+    'Nebraska': 'Nebraska',
+    'Nevada': 'Nevada',
+    'UNLV': 'Nevada',
+    'Rutgers': 'New Jersey',
+    'New Mexico': 'New Mexico',
+    'Syracuse': 'New York',
+    'Army': 'New York',
+    'Duke': 'North Carolina',
+    'North Carolina': 'North Carolina',
+    'NC State': 'North Carolina',
+    'Wake Forest': 'North Carolina',
+    'North Dakota': 'North Dakota',
+    'Ohio State': 'Ohio',
+    'Cincinnati': 'Ohio',
+    'Ohio': 'Ohio',
+    'Oklahoma': 'Oklahoma',
+    'Oklahoma State': 'Oklahoma',
+    'Oregon': 'Oregon',
+    'Oregon State': 'Oregon',
+    'Penn State': 'Pennsylvania',
+    'Pitt': 'Pennsylvania',
+    'Temple': 'Pennsylvania',
+    'South Carolina': 'South Carolina',
+    'Clemson': 'South Carolina',
+    'South Dakota': 'South Dakota',
+    'Tennessee': 'Tennessee',
+    'Vanderbilt': 'Tennessee',
+    'Texas': 'Texas',
+    'Texas A&M': 'Texas',
+    'Texas Tech': 'Texas',
+    'Baylor': 'Texas',
+    'TCU': 'Texas',
+    'Rice': 'Texas',
+    'Houston': 'Texas',
+    'Utah': 'Utah',
+    'Utah State': 'Utah',
+    'BYU': 'Utah',
+    'Vermont': 'Vermont',
+    'Virginia': 'Virginia',
+    'Virginia Tech': 'Virginia',
+    'Washington': 'Washington',
+    'Washington State': 'Washington',
+    'West Virginia': 'West Virginia',
+    'Wisconsin': 'Wisconsin',
+    'Wyoming': 'Wyoming'
+}
+
+# Approximate state centers
+STATE_CENTROIDS = {
+    'Alabama': (32.806671, -86.79113),
+    'Arizona': (33.729759, -111.431221),
+    'Arkansas': (34.969704, -92.373123),
+    'California': (36.116203, -119.681564),
+    'Colorado': (39.059811, -105.311104),
+    'Connecticut': (41.597782, -72.755371),
+    'Delaware': (39.318523, -75.507141),
+    'Florida': (27.766279, -81.686783),
+    'Georgia': (33.040619, -83.643074),
+    'Idaho': (44.240459, -114.478828),
+    'Illinois': (40.349457, -88.986137),
+    'Indiana': (39.849426, -86.258278),
+    'Iowa': (42.011539, -93.210526),
+    'Kansas': (38.526600, -96.726486),
+    'Kentucky': (37.668140, -84.670067),
+    'Louisiana': (31.169546, -91.867805),
+    'Maine': (44.693947, -69.381927),
+    'Maryland': (39.063946, -76.802101),
+    'Massachusetts': (42.230171, -71.530106),
+    'Michigan': (43.326618, -84.536095),
+    'Minnesota': (45.694454, -93.900192),
+    'Mississippi': (32.741646, -89.678696),
+    'Missouri': (38.456085, -92.288368),
+    'Montana': (47.020859, -110.454353),
+    'Nebraska': (41.12537, -98.268082),
+    'Nevada': (38.313515, -117.055374),
+    'New Hampshire': (43.452492, -71.563896),
+    'New Jersey': (40.298904, -74.756138),
+    'New Mexico': (34.840515, -106.248482),
+    'New York': (42.165726, -74.948051),
+    'North Carolina': (35.630066, -79.806419),
+    'North Dakota': (47.528912, -99.784012),
+    'Ohio': (40.388783, -82.764915),
+    'Oklahoma': (35.565342, -96.928917),
+    'Oregon': (44.572021, -122.070938),
+    'Pennsylvania': (40.590752, -77.209755),
+    'Rhode Island': (41.680893, -71.51178),
+    'South Carolina': (33.856892, -80.945007),
+    'South Dakota': (44.299782, -99.438828),
+    'Tennessee': (35.747845, -86.692345),
+    'Texas': (31.054487, -97.563461),
+    'Utah': (40.150032, -111.862434),
+    'Vermont': (44.045876, -72.710686),
+    'Virginia': (37.769337, -78.169968),
+    'Washington': (47.400902, -121.490494),
+    'West Virginia': (38.491226, -80.954453),
+    'Wisconsin': (44.268543, -89.616508),
+    'Wyoming': (42.755966, -107.302490)
+}
+
+
+def state_for_team(team_name: str) -> Optional[str]:
+    """Substring match of a team name against TEAM_STATES"""
+    if not isinstance(team_name, str) or not team_name:
+        return None
+    lowered = team_name.lower()
+    for team_key, state in TEAM_STATES.items():
+        if team_key.lower() in lowered:
+            return state
+    return None
+
+
+def haversine_miles(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in miles; broadcasts over array inputs, NaN in -> NaN out"""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def _standard_offset(zone: str) -> float:
+    try:
+        return ZoneInfo(zone).utcoffset(datetime(2024, 1, 15, 12)).total_seconds() / 3600
+    except Exception:
+        return np.nan
+
+
+def standard_utc_offsets(timezones, longitudes) -> np.ndarray:
+    """Standard-time UTC offset in hours per zone name, estimated from longitude when unknown"""
+    codes, zones = pd.factorize(pd.Series(timezones, dtype=object))
+    zone_offsets = np.array([_standard_offset(zone) for zone in zones] + [np.nan])
+    offsets = zone_offsets[np.where(codes >= 0, codes, len(zones))]
+    estimated = np.round(np.asarray(longitudes, dtype=np.float64) / 15)
+    return np.where(np.isnan(offsets), estimated, offsets)
+
+
+class TravelMatrix:
+    """Dense team x team distance (miles) and time-zone delta (hours) matrices"""
+
+    def __init__(self, teams, latitudes, longitudes, utc_offsets):
+        self.teams = pd.Index(teams)
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.utc_offsets = np.asarray(utc_offsets, dtype=np.float64)
+
+        self.distance = haversine_miles(
+            self.latitudes[:, None], self.longitudes[:, None],
+            self.latitudes[None, :], self.longitudes[None, :]
+        ).astype(np.float32)
+        # tz_delta[home, away]: hours the away team's clock shifts travelling to home
+        self.tz_delta = (self.utc_offsets[:, None] - self.utc_offsets[None, :]).astype(np.float32)
+
+    @classmethod
+    def for_teams(cls, teams, venue_dimension=None) -> 'TravelMatrix':
+        """
+        Resolve each distinct team to its home stadium via the venue dimension,
+        falling back to its state's center
+        """
+        teams = pd.Index(pd.unique(pd.Series(teams).dropna()))
+        latitudes = np.full(len(teams), np.nan)
+        longitudes = np.full(len(teams), np.nan)
+        zones = np.full(len(teams), None, dtype=object)
+
+        if venue_dimension is not None and len(teams):
+            home = venue_dimension.take(venue_dimension.rows_for_teams(pd.Series(teams)))
+            latitudes = home['venue_latitude'].to_numpy(np.float64, copy=True)
+            longitudes = home['venue_longitude'].to_numpy(np.float64, copy=True)
+            zones = home['venue_timezone'].to_numpy(object)
+
+        for i in np.flatnonzero(np.isnan(latitudes) | np.isnan(longitudes)):
+            state = state_for_team(teams[i])
+            if state in STATE_CENTROIDS:
+                latitudes[i], longitudes[i] = STATE_CENTROIDS[state]
+
+        return cls(teams, latitudes, longitudes, standard_utc_offsets(zones, longitudes))
+
+    def codes(self, teams) -> np.ndarray:
+        """Matrix index per team name (-1 for teams outside the matrix)"""
+        return self.teams.get_indexer(pd.Index(teams))
+
+    def game_travel(self, home_teams, away_teams, venue_latitudes=None, venue_longitudes=None,
+                    venue_utc_offsets=None, neutral=None) -> pd.DataFrame:
+        """
+        Travel miles for both teams and the away team's time-zone shift per game.
+        Campus games are one fancy-index into the matrices; neutral-site games
+        measure each team's trip to the venue coordinates instead.
+        """
+        home = self.codes(home_teams)
+        away = self.codes(away_teams)
+        known = (home >= 0) & (away >= 0)
+        safe_home = np.where(home >= 0, home, 0)
+        safe_away = np.where(away >= 0, away, 0)
+
+        away_miles = np.where(known, self.distance[safe_home, safe_away], np.nan).astype(np.float64)
+        home_miles = np.where(known, 0.0, np.nan)
+        tz_delta = np.where(known, self.tz_delta[safe_home, safe_away], np.nan).astype(np.float64)
+
+        if neutral is not None and venue_latitudes is not None and venue_longitudes is not None:
+            neutral = np.asarray(neutral, dtype=bool)
+            venue_lat = np.asarray(venue_latitudes, dtype=np.float64)
+            venue_lon = np.asarray(venue_longitudes, dtype=np.float64)
+            at_venue = neutral & ~np.isnan(venue_lat) & ~np.isnan(venue_lon)
+
+            to_venue_away = haversine_miles(self.latitudes[safe_away], self.longitudes[safe_away], venue_lat, venue_lon)
+            to_venue_home = haversine_miles(self.latitudes[safe_home], self.longitudes[safe_home], venue_lat, venue_lon)
+            away_miles = np.where(at_venue & (away >= 0), to_venue_away, away_miles)
+            home_miles = np.where(at_venue & (home >= 0), to_venue_home, home_miles)
+
+            if venue_utc_offsets is not None:
+                venue_offsets = np.asarray(venue_utc_offsets, dtype=np.float64)
+                shifted = venue_offsets - self.utc_offsets[safe_away]
+                tz_delta = np.where(at_venue & (away >= 0) & ~np.isnan(venue_offsets), shifted, tz_delta)
+
+        return pd.DataFrame({
+            'home_travel_miles': home_miles,
+            'away_travel_miles': away_miles,
+            'travel_tz_delta': tz_delta
+        })
+
+    def attach(self, games: pd.DataFrame, home_column: str = 'home_team',
+               away_column: str = 'away_team') -> pd.DataFrame:
+        """Add home_travel_miles, away_travel_miles and travel_tz_delta columns to a games frame"""
+        venue_offsets = None
+        if 'venue_timezone' in games and 'venue_longitude' in games:
+            venue_offsets = standard_utc_offsets(
+                games['venue_timezone'].to_numpy(object), games['venue_longitude'].to_numpy(np.float64)
+            )
+        travel = self.game_travel(
+            games[home_column].to_numpy(object),
+            games[away_column].to_numpy(object),
+            games['venue_latitude'].to_numpy(np.float64) if 'venue_latitude' in games else None,
+            games['venue_longitude'].to_numpy(np.float64) if 'venue_longitude' in games else None,
+            venue_offsets,
+            games['is_neutral_site'].eq(True).to_numpy() if 'is_neutral_site' in games else None
+        )
+        games = games.copy()
+        for column in travel.columns:
+            games[column] = travel[column].to_numpy()
+        return games
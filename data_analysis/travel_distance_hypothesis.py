@@ -8,7 +8,9 @@ import numpy as np
 import psycopg2
 from scipy import stats
 from database_connection import get_database_connection
-import math
+from conference_index import attach_season_conferences
+from travel import TravelMatrix, state_for_team
+from venue_dimension import load_venue_dimension
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -16,130 +18,11 @@ class TravelDistanceAnalyzer:
     def __init__(self):
         self.conn = get_database_connection()
         self.games_df = None
+        self.venues = None
         
-    def calculate_distance(self, lat1, lon1, lat2, lon2):
-        """Calculate distance between two points using Haversine formula"""
-        if pd.isna(lat1) or pd.isna(lon1) or pd.isna(lat2) or pd.isna(lon2):
-            return None
-            
-        # Convert latitude and longitude from degrees to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Radius of Earth in miles
-        r = 3956
-        return c * r
-    
     def extract_state_from_team(self, team_name: str) -> str:
         """Extract state from team name using common patterns"""
-        if not team_name:
-            return None
-            
-        # State name mapping for major college football teams
-        state_mapping = {
-            'Alabama': 'Alabama',
-            'Auburn': 'Alabama', 
-            'Arizona': 'Arizona',
-            'Arizona State': 'Arizona',
-            'Arkansas': 'Arkansas',
-            'California': 'California',
-            'UCLA': 'California',
-            'USC': 'California',
-            'Stanford': 'California',
-            'Colorado': 'Colorado',
-            'UConn': 'Connecticut',
-            'Connecticut': 'Connecticut',
-            'Delaware': 'Delaware',
-            'Florida': 'Florida',
-            'Miami': 'Florida',
-            'Florida State': 'Florida',
-            'UCF': 'Florida',
-            'Georgia': 'Georgia',
-            'Georgia Tech': 'Georgia',
-            'Hawaii': 'Hawaii',
-            'Idaho': 'Idaho',
-            'Illinois': 'Illinois',
-            'Northwestern': 'Illinois',
-            'Indiana': 'Indiana',
-            'Notre Dame': 'Indiana',
-            'Iowa': 'Iowa',
-            'Iowa State': 'Iowa',
-            'Kansas': 'Kansas',
-            'Kansas State': 'Kansas',
-            'Kentucky': 'Kentucky',
-            'Louisiana': 'Louisiana',
-            'LSU': 'Louisiana',
-            'Tulane': 'Louisiana',
-            'Maine': 'Maine',
-            'Maryland': 'Maryland',
-            'Boston College': 'Massachusetts',
-            'Harvard': 'Massachusetts',
-            'Michigan': 'Michigan',
-            'Michigan State': 'Michigan',
-            'Minnesota': 'Minnesota',
-            'Mississippi': 'Mississippi',
-            'Ole Miss': 'Mississippi',
-            'Mississippi State': 'Mississippi',
-            'Missouri': 'Missouri',
-            'Montana': 'Montana',
-            'Nebraska': 'Nebraska',
-            'Nevada': 'Nevada',
-            'UNLV': 'Nevada',
-            'Rutgers': 'New Jersey',
-            'New Mexico': 'New Mexico',
-            'Syracuse': 'New York',
-            'Army': 'New York',
-            'Duke': 'North Carolina',
-            'North Carolina': 'North Carolina',
-            'NC State': 'North Carolina',
-            'Wake Forest': 'North Carolina',
-            'North Dakota': 'North Dakota',
-            'Ohio State': 'Ohio',
-            'Cincinnati': 'Ohio',
-            'Ohio': 'Ohio',
-            'Oklahoma': 'Oklahoma',
-            'Oklahoma State': 'Oklahoma',
-            'Oregon': 'Oregon',
-            'Oregon State': 'Oregon',
-            'Penn State': 'Pennsylvania',
-            'Pitt': 'Pennsylvania',
-            'Temple': 'Pennsylvania',
-            'South Carolina': 'South Carolina',
-            'Clemson': 'South Carolina',
-            'South Dakota': 'South Dakota',
-            'Tennessee': 'Tennessee',
-            'Vanderbilt': 'Tennessee',
-            'Texas': 'Texas',
-            'Texas A&M': 'Texas',
-            'Texas Tech': 'Texas',
-            'Baylor': 'Texas',
-            'TCU': 'Texas',
-            'Rice': 'Texas',
-            'Houston': 'Texas',
-            'Utah': 'Utah',
-            'Utah State': 'Utah',
-            'BYU': 'Utah',
-            'Vermont': 'Vermont',
-            'Virginia': 'Virginia',
-            'Virginia Tech': 'Virginia',
-            'Washington': 'Washington',
-            'Washington State': 'Washington',
-            'West Virginia': 'West Virginia',
-            'Wisconsin': 'Wisconsin',
-            'Wyoming': 'Wyoming'
-        }
-        
-        # Try exact matches first
-        for team_key, state in state_mapping.items():
-            if team_key.lower() in team_name.lower():
-                return state
-                
-        return None
+        return state_for_team(team_name)
         
     def load_travel_data(self):
         """Load games with location data for travel distance analysis"""
@@ -162,6 +45,7 @@ class TravelDistanceAnalyzer:
             g.id, g.season, g.week, g.start_date,
             g.home_team_score, g.away_team_score,
             g.spread, g.over_under, g.stadium, g.location,
+            g.venue, g.is_neutral_site,
             ht.name as home_team, ht.conference as home_conf,
             at.name as away_team, at.conference as away_conf
         FROM games g
@@ -174,6 +58,13 @@ class TravelDistanceAnalyzer:
         """
         
         self.games_df = pd.read_sql(query, self.conn)
+        # Conference as of each game's season, not the team's current affiliation
+        self.games_df = attach_season_conferences(self.games_df)
+        
+        # Venue coordinates place neutral-site games where they were played
+        self.venues = load_venue_dimension()
+        if self.venues is not None:
+            self.games_df = self.venues.join_games(self.games_df)
         
         # Calculate basic metrics
         self.games_df['home_margin'] = (
@@ -230,97 +121,30 @@ class TravelDistanceAnalyzer:
         }
         
     def hypothesis_2_geographic_distance_proxy(self):
-        """H2: Use state-to-state distance as travel proxy"""
+        """H2: Use home-stadium to game-venue distance as travel proxy"""
         print("\n🗺️ HYPOTHESIS 2: Geographic Distance Impact")
         
-        # Define major state coordinates (approximate centers)
-        state_coords = {
-            'Alabama': (32.806671, -86.79113),
-            'Arizona': (33.729759, -111.431221),
-            'Arkansas': (34.969704, -92.373123),
-            'California': (36.116203, -119.681564),
-            'Colorado': (39.059811, -105.311104),
-            'Connecticut': (41.597782, -72.755371),
-            'Delaware': (39.318523, -75.507141),
-            'Florida': (27.766279, -81.686783),
-            'Georgia': (33.040619, -83.643074),
-            'Idaho': (44.240459, -114.478828),
-            'Illinois': (40.349457, -88.986137),
-            'Indiana': (39.849426, -86.258278),
-            'Iowa': (42.011539, -93.210526),
-            'Kansas': (38.526600, -96.726486),
-            'Kentucky': (37.668140, -84.670067),
-            'Louisiana': (31.169546, -91.867805),
-            'Maine': (44.693947, -69.381927),
-            'Maryland': (39.063946, -76.802101),
-            'Massachusetts': (42.230171, -71.530106),
-            'Michigan': (43.326618, -84.536095),
-            'Minnesota': (45.694454, -93.900192),
-            'Mississippi': (32.741646, -89.678696),
-            'Missouri': (38.456085, -92.288368),
-            'Montana': (47.020859, -110.454353),
-            'Nebraska': (41.12537, -98.268082),
-            'Nevada': (38.313515, -117.055374),
-            'New Hampshire': (43.452492, -71.563896),
-            'New Jersey': (40.298904, -74.756138),
-            'New Mexico': (34.840515, -106.248482),
-            'New York': (42.165726, -74.948051),
-            'North Carolina': (35.630066, -79.806419),
-            'North Dakota': (47.528912, -99.784012),
-            'Ohio': (40.388783, -82.764915),
-            'Oklahoma': (35.565342, -96.928917),
-            'Oregon': (44.572021, -122.070938),
-            'Pennsylvania': (40.590752, -77.209755),
-            'Rhode Island': (41.680893, -71.51178),
-            'South Carolina': (33.856892, -80.945007),
-            'South Dakota': (44.299782, -99.438828),
-            'Tennessee': (35.747845, -86.692345),
-            'Texas': (31.054487, -97.563461),
-            'Utah': (40.150032, -111.862434),
-            'Vermont': (44.045876, -72.710686),
-            'Virginia': (37.769337, -78.169968),
-            'Washington': (47.400902, -121.490494),
-            'West Virginia': (38.491226, -80.954453),
-            'Wisconsin': (44.268543, -89.616508),
-            'Wyoming': (42.755966, -107.302490)
-        }
-        
-        # Calculate travel distances
-        distances = []
-        valid_games = []
+        # Resolve each team's home coordinates once, then every game's travel
+        # is a lookup into the precomputed team x team distance matrix
+        teams = pd.concat([self.games_df['home_team'], self.games_df['away_team']])
+        matrix = TravelMatrix.for_teams(teams, self.venues)
+        travel_df = matrix.attach(self.games_df)
+        travel_df['travel_distance'] = travel_df['away_travel_miles']
+        travel_df = travel_df[travel_df['travel_distance'].notna()].copy()
         
-        for _, game in self.games_df.iterrows():
-            # Extract state from team name or location (simplified approach)
-            home_state = self.extract_state_from_team(game.get('home_team', ''))
-            away_state = self.extract_state_from_team(game.get('away_team', ''))
-            
-            if home_state in state_coords and away_state in state_coords:
-                home_coords = state_coords[home_state]
-                away_coords = state_coords[away_state]
-                
-                distance = self.calculate_distance(
-                    away_coords[0], away_coords[1],  # Away team travels FROM here
-                    home_coords[0], home_coords[1]   # TO here
-                )
-                
-                if distance is not None:
-                    distances.append(distance)
-                    valid_games.append(game)
-        
-        if len(distances) == 0:
-            print("   No valid state data for distance calculation")
+        if len(travel_df) == 0:
+            print("   No valid location data for distance calculation")
             return None
-            
-        travel_df = pd.DataFrame(valid_games)
-        travel_df['travel_distance'] = distances
+        
+        distances = travel_df['travel_distance']
         
         print(f"   Calculated distances for {len(travel_df)} games")
-        print(f"   Distance range: {min(distances):.0f} - {max(distances):.0f} miles")
+        print(f"   Distance range: {distances.min():.0f} - {distances.max():.0f} miles")
         
         # Analyze by distance categories
         travel_df['distance_category'] = pd.cut(
             travel_df['travel_distance'], 
-            bins=[0, 300, 800, 1500, 3000],
+            bins=[0, 300, 800, 1500, np.inf],
             labels=['Local (<300mi)', 'Regional (300-800mi)', 'Cross-country (800-1500mi)', 'Coast-to-coast (>1500mi)']
         )
         
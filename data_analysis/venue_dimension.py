@@ -0,0 +1,169 @@
+"""
+Venue Dimension
+One row per stadium (coordinates, capacity, elevation, roof, time zone) built
+from CFBD venue data, cached locally and joined to games once by venue name
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+from cfbd_cache import cached_cfbd
+
+# CFBD only reports a dome flag; these enclosed venues have roofs that open
+RETRACTABLE_ROOF_VENUES = {
+    'AT&T Stadium',
+    'Lucas Oil Stadium',
+    'Mercedes-Benz Stadium',
+    'NRG Stadium',
+    'State Farm Stadium',
+}
+
+VENUE_COLUMNS = [
+    'venue_id', 'venue_name', 'venue_city', 'venue_state',
+    'venue_latitude', 'venue_longitude', 'venue_capacity', 'venue_elevation',
+    'venue_dome', 'venue_retractable', 'venue_timezone'
+]
+
+
+def normalize_venue_names(names: pd.Series) -> pd.Series:
+    """Lowercase, strip punctuation and collapse whitespace so names join reliably"""
+    return (
+        names.astype('string')
+        .str.lower()
+        .str.replace(r'[^a-z0-9 ]+', ' ', regex=True)
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.strip()
+    )
+
+
+def _coordinates(record: Dict):
+    """CFBD v2 uses latitude/longitude, v1 nests them as location.x/location.y"""
+    if record.get('latitude') is not None:
+        return record.get('latitude'), record.get('longitude')
+    location = record.get('location') or {}
+    return location.get('x'), location.get('y')
+
+
+def _venue_row(record: Dict, venue_id=None) -> Dict:
+    latitude, longitude = _coordinates(record)
+    name = record.get('name')
+    return {
+        'venue_id': venue_id if venue_id is not None else record.get('id'),
+        'venue_name': name,
+        'venue_city': record.get('city'),
+        'venue_state': record.get('state'),
+        'venue_latitude': latitude,
+        'venue_longitude': longitude,
+        'venue_capacity': record.get('capacity'),
+        'venue_elevation': record.get('elevation'),
+        'venue_dome': bool(record.get('dome')),
+        'venue_retractable': name in RETRACTABLE_ROOF_VENUES,
+        'venue_timezone': record.get('timezone'),
+    }
+
+
+class VenueDimension:
+    """Venue attributes plus each team's home venue, keyed for vectorized joins"""
+
+    def __init__(self, venues: pd.DataFrame, team_venues: pd.DataFrame):
+        """
+        venues: one row per venue with VENUE_COLUMNS
+        team_venues: team (school name) -> venue_id for the team's home stadium
+        """
+        venues = venues.dropna(subset=['venue_id']).drop_duplicates('venue_id').reset_index(drop=True)
+        venues['venue_id'] = venues['venue_id'].astype(np.int64)
+        for column in ('venue_latitude', 'venue_longitude', 'venue_capacity', 'venue_elevation'):
+            venues[column] = pd.to_numeric(venues[column], errors='coerce')
+        self.venues = venues
+
+        self._row_by_name = pd.Series(
+            np.arange(len(venues)), index=normalize_venue_names(venues['venue_name'])
+        )
+        self._row_by_name = self._row_by_name[~self._row_by_name.index.duplicated()]
+        self._row_by_id = pd.Series(np.arange(len(venues)), index=venues['venue_id'])
+
+        team_venues = team_venues.dropna(subset=['team', 'venue_id']).drop_duplicates('team')
+        self._home_row_by_team = pd.Series(
+            self._row_by_id.reindex(team_venues['venue_id'].astype(np.int64)).to_numpy(),
+            index=team_venues['team'].to_numpy()
+        ).dropna().astype(np.int64)
+
+    @classmethod
+    def from_cfbd(cls, venue_records: List[Dict], team_records: Optional[List[Dict]] = None) -> 'VenueDimension':
+        """Build from raw CFBD /venues and /teams payloads"""
+        rows = [_venue_row(record) for record in venue_records or []]
+        team_rows = []
+        for team in team_records or []:
+            location = team.get('location') or {}
+            venue_id = location.get('venue_id', location.get('id'))
+            if venue_id is None:
+                continue
+            team_rows.append({'team': team.get('school'), 'venue_id': venue_id})
+            # Teams carry their stadium inline; keep it if /venues lacks it
+            rows.append(_venue_row(location, venue_id))
+
+        venues = pd.DataFrame(rows, columns=VENUE_COLUMNS)
+        team_venues = pd.DataFrame(team_rows, columns=['team', 'venue_id'])
+        return cls(venues, team_venues)
+
+    @classmethod
+    def load(cls, refresh: bool = False) -> 'VenueDimension':
+        """Load from the local cache, fetching from CFBD on first use or refresh"""
+        venue_records = cached_cfbd('venues.json', '/venues', refresh=refresh)
+        team_records = cached_cfbd('teams.json', '/teams', refresh=refresh)
+        dimension = cls.from_cfbd(venue_records, team_records)
+        print(f"🏟️ Venue dimension: {len(dimension.venues)} venues, "
+              f"{len(dimension._home_row_by_team)} team home stadiums")
+        return dimension
+
+    def rows_for_names(self, names: pd.Series) -> np.ndarray:
+        """Venue row index for each name (-1 when unknown); matching runs once per distinct name"""
+        codes, uniques = pd.factorize(normalize_venue_names(names))
+        unique_rows = self._row_by_name.reindex(uniques).fillna(-1).to_numpy(np.int64)
+        return np.where(codes >= 0, unique_rows[codes] if len(unique_rows) else -1, -1)
+
+    def rows_for_teams(self, teams: pd.Series) -> np.ndarray:
+        """Home venue row index for each team name (-1 when unknown)"""
+        codes, uniques = pd.factorize(teams)
+        unique_rows = self._home_row_by_team.reindex(uniques).fillna(-1).to_numpy(np.int64)
+        return np.where(codes >= 0, unique_rows[codes] if len(unique_rows) else -1, -1)
+
+    def take(self, rows: np.ndarray) -> pd.DataFrame:
+        """Venue columns for an array of row indexes, with nulls where the row is -1"""
+        rows = np.asarray(rows, dtype=np.int64)
+        taken = self.venues.reindex(np.where(rows >= 0, rows, -1)).reset_index(drop=True)
+        taken['venue_dome'] = taken['venue_dome'].eq(True)
+        taken['venue_retractable'] = taken['venue_retractable'].eq(True)
+        return taken[VENUE_COLUMNS]
+
+    def join_games(self, games: pd.DataFrame, name_columns=('venue', 'stadium'),
+                   home_team_column: str = 'home_team') -> pd.DataFrame:
+        """
+        Attach VENUE_COLUMNS to a games frame. Venue names are tried in order,
+        then non-neutral games fall back to the home team's own stadium.
+        """
+        rows = np.full(len(games), -1, dtype=np.int64)
+        for column in name_columns:
+            if column in games:
+                missing = rows < 0
+                rows[missing] = self.rows_for_names(games.loc[missing, column])
+
+        if home_team_column in games:
+            missing = rows < 0
+            if 'is_neutral_site' in games:
+                missing &= ~games['is_neutral_site'].eq(True).to_numpy()
+            rows[missing] = self.rows_for_teams(games.loc[missing, home_team_column])
+
+        joined = games.drop(columns=[c for c in VENUE_COLUMNS if c in games]).reset_index(drop=True)
+        joined = pd.concat([joined, self.take(rows)], axis=1)
+        joined.index = games.index
+        return joined
+
+
+def load_venue_dimension(refresh: bool = False) -> Optional[VenueDimension]:
+    """Load the cached venue dimension, returning None when CFBD data is unavailable"""
+    try:
+        return VenueDimension.load(refresh=refresh)
+    except Exception as e:
+        print(f"⚠️ Venue dimension unavailable: {e}")
+        return None
@@ -3,12 +3,14 @@ Weather Impact Analysis for College Football
 Tests hypotheses about weather effects on game outcomes, scoring, and betting performance
 """
 
-import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 from database_connection import get_db
+from weather_kernel import (
+    categorize, ANALYSIS_TEMPERATURE_EDGES, ANALYSIS_TEMPERATURE_LABELS,
+    ANALYSIS_WIND_EDGES, ANALYSIS_WIND_LABELS
+)
 from typing import Dict, List, Tuple
 
 class WeatherAnalyzer:
@@ -32,17 +34,15 @@ class WeatherAnalyzer:
         self.df['point_differential'] = self.df['home_team_score'] - self.df['away_team_score']
         
         # Temperature categories
-        self.df['temp_category'] = pd.cut(
+        self.df['temp_category'] = categorize(
             self.df['temperature'].fillna(72),  # Dome games = 72°F
-            bins=[-np.inf, 32, 50, 70, 85, np.inf],
-            labels=['Freezing', 'Cold', 'Cool', 'Warm', 'Hot']
+            ANALYSIS_TEMPERATURE_EDGES, ANALYSIS_TEMPERATURE_LABELS
         )
         
         # Wind categories
-        self.df['wind_category'] = pd.cut(
+        self.df['wind_category'] = categorize(
             self.df['wind_speed'].fillna(0),  # Dome games = 0 wind
-            bins=[-np.inf, 5, 15, 25, np.inf],
-            labels=['Calm', 'Light', 'Moderate', 'Strong']
+            ANALYSIS_WIND_EDGES, ANALYSIS_WIND_LABELS
         )
         
         # Spread coverage (home team perspective)
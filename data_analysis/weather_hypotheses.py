@@ -10,12 +10,24 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 from database_connection import get_database_connection
+from conference_index import attach_season_conferences
+from venue_dimension import load_venue_dimension
 import warnings
 warnings.filterwarnings('ignore')
 
+# Columns this analyzer takes from a shared games snapshot (same as its query)
+GAME_COLUMNS = [
+    'id', 'season', 'week', 'home_team_score', 'away_team_score', 'spread', 'over_under',
+    'temperature', 'wind_speed', 'wind_direction', 'humidity', 'precipitation',
+    'weather_condition', 'is_dome', 'stadium', 'location', 'venue', 'is_neutral_site',
+    'home_team', 'home_conf', 'away_team', 'away_conf', 'start_date',
+]
+
 class WeatherHypothesesAnalyzer:
-    def __init__(self):
-        self.conn = get_database_connection()
+    def __init__(self, games: pd.DataFrame = None):
+        # A snapshot shared by all analyzers (analyzer_pool) replaces the query below
+        self.snapshot = games
+        self.conn = get_database_connection() if games is None else None
         self.games_df = None
         self.weather_games_df = None
         
@@ -30,7 +42,7 @@ class WeatherHypothesesAnalyzer:
             g.spread, g.over_under,
             g.temperature, g.wind_speed, g.wind_direction,
             g.humidity, g.precipitation, g.weather_condition,
-            g.is_dome, g.stadium, g.location,
+            g.is_dome, g.stadium, g.location, g.venue, g.is_neutral_site,
             ht.name as home_team, ht.conference as home_conf,
             at.name as away_team, at.conference as away_conf,
             g.start_date
@@ -44,7 +56,20 @@ class WeatherHypothesesAnalyzer:
         ORDER BY g.start_date
         """
         
-        self.games_df = pd.read_sql(query, self.conn)
+        if self.snapshot is not None:
+            rows = self.snapshot['season'].between(2015, 2024)
+            self.games_df = self.snapshot.loc[rows, GAME_COLUMNS].reset_index(drop=True)
+        else:
+            self.games_df = pd.read_sql(query, self.conn)
+        # Conference as of each game's season, not the team's current affiliation
+        self.games_df = attach_season_conferences(self.games_df)
+        
+        # Venue attributes come from the venue dimension; a dome venue counts as
+        # a dome game even when the per-game flag was never set
+        venues = load_venue_dimension()
+        if venues is not None:
+            self.games_df = venues.join_games(self.games_df)
+            self.games_df['is_dome'] = self.games_df['is_dome'].eq(True) | self.games_df['venue_dome']
         
         # Filter for games with weather data
         self.weather_games_df = self.games_df[
@@ -0,0 +1,141 @@
+"""
+Shared Weather Kernel
+Maps arrays of temperature, wind, precipitation and dome flags to bucket codes
+and point adjustments with np.digitize and lookup tables, so analyzers and
+both prediction engines use the same thresholds
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Sequence
+
+
+def _above(threshold: float) -> float:
+    """Bin edge that puts values strictly greater than threshold in the next bucket"""
+    return float(np.nextafter(threshold, np.inf))
+
+
+# prediction_algorithm: <32 / <40 / >85 °F, >15 / >20 MPH; a dome replaces the
+# outdoor factors with a flat controlled-climate bonus
+ALGORITHM_PROFILE = {
+    'temperature_edges': [32, 40, _above(85)],
+    'temperature_labels': ['Freezing', 'Cold', 'Mild', 'Hot'],
+    'temperature_points': [-2.5, -1.0, 0.0, -0.5],
+    'wind_edges': [_above(15), _above(20)],
+    'wind_labels': ['Calm', 'Moderate', 'High'],
+    'wind_points': [0.0, -1.0, -2.0],
+    'precipitation_points': -1.5,
+    'rain_from_condition': False,
+    'dome_points': 4.0,
+    'dome_overrides_outdoor': True,
+}
+
+# comprehensive_prediction_system: <40 / >85 °F, >15 MPH, rain in the condition
+# text counts as precipitation; dome points come from the historical insights
+COMPREHENSIVE_PROFILE = {
+    'temperature_edges': [40, _above(85)],
+    'temperature_labels': ['Cold', 'Mild', 'Hot'],
+    'temperature_points': [-3.0, 0.0, -2.0],
+    'wind_edges': [_above(15)],
+    'wind_labels': ['Calm', 'Windy'],
+    'wind_points': [0.0, -2.5],
+    'precipitation_points': -1.5,
+    'rain_from_condition': True,
+    'dome_points': 0.0,
+    'dome_overrides_outdoor': False,
+}
+
+# weather_analysis reporting buckets (pd.cut style, right-closed)
+ANALYSIS_TEMPERATURE_EDGES = [32, 50, 70, 85]
+ANALYSIS_TEMPERATURE_LABELS = ['Freezing', 'Cold', 'Cool', 'Warm', 'Hot']
+ANALYSIS_WIND_EDGES = [5, 15, 25]
+ANALYSIS_WIND_LABELS = ['Calm', 'Light', 'Moderate', 'Strong']
+
+
+def _as_array(values) -> np.ndarray:
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.to_numpy()
+    return np.asarray(values) if np.ndim(values) else np.asarray([values])
+
+
+def _as_float(values) -> np.ndarray:
+    """Float array with None/NA as NaN; accepts scalars, lists, arrays and Series"""
+    array = _as_array(values)
+    if array.dtype.kind in 'fiub':
+        return array.astype(np.float64)
+    return pd.to_numeric(pd.Series(array, dtype=object), errors='coerce').to_numpy(np.float64, na_value=np.nan)
+
+
+def _as_bool(values, size: int) -> np.ndarray:
+    """Boolean array with None/NA as False"""
+    if values is None:
+        return np.zeros(size, dtype=bool)
+    array = _as_array(values)
+    if array.dtype == bool:
+        return array
+    series = pd.Series(array, dtype=object)
+    return series.where(series.notna(), False).astype(bool).to_numpy()
+
+
+def bucketize(values, edges: Sequence[float], right: bool = False) -> np.ndarray:
+    """Bucket code per value (0..len(edges)); missing values get len(edges) + 1"""
+    values = _as_float(values)
+    codes = np.digitize(values, edges, right=right)
+    return np.where(np.isnan(values), len(edges) + 1, codes)
+
+
+def categorize(values, edges: Sequence[float], labels: Sequence[str], right: bool = True) -> pd.Categorical:
+    """pd.cut equivalent over open-ended edges; missing values stay missing"""
+    codes = bucketize(values, edges, right=right)
+    return pd.Categorical.from_codes(np.where(codes > len(edges), -1, codes), categories=list(labels))
+
+
+def weather_codes(temperature, wind_speed, precipitation=None, is_dome=None,
+                  weather_condition=None, profile: Dict = ALGORITHM_PROFILE) -> Dict[str, np.ndarray]:
+    """Bucket every game's conditions under a profile's thresholds"""
+    temperature = _as_float(temperature)
+    size = len(temperature)
+    wind_speed = _as_float(wind_speed) if wind_speed is not None else np.full(size, np.nan)
+
+    wet = np.zeros(size, dtype=bool)
+    if precipitation is not None:
+        wet = np.nan_to_num(_as_float(precipitation), nan=0.0) > 0
+    if profile['rain_from_condition'] and weather_condition is not None:
+        wet |= pd.Series(_as_array(weather_condition), dtype=object).astype('string') \
+            .str.contains('rain', case=False, na=False).to_numpy(bool)
+
+    return {
+        'temperature': bucketize(temperature, profile['temperature_edges']),
+        'wind': bucketize(wind_speed, profile['wind_edges']),
+        'precipitation': wet,
+        'dome': _as_bool(is_dome, size),
+    }
+
+
+def weather_points(codes: Dict[str, np.ndarray], profile: Dict = ALGORITHM_PROFILE,
+                   dome_points: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """Point adjustment per component and in total, via table lookups on bucket codes"""
+    # Codes past the last label (value missing) look up a trailing zero
+    temperature_table = np.append(profile['temperature_points'], [0.0, 0.0])
+    wind_table = np.append(profile['wind_points'], [0.0, 0.0])
+    dome_value = profile['dome_points'] if dome_points is None else dome_points
+
+    dome = codes['dome']
+    outdoor = ~dome if profile['dome_overrides_outdoor'] else np.ones(len(dome), dtype=bool)
+
+    components = {
+        'dome': np.where(dome, dome_value, 0.0),
+        'temperature': np.where(outdoor, temperature_table[codes['temperature']], 0.0),
+        'wind': np.where(outdoor, wind_table[codes['wind']], 0.0),
+        'precipitation': np.where(outdoor & codes['precipitation'], profile['precipitation_points'], 0.0),
+    }
+    components['total'] = (components['dome'] + components['temperature'] +
+                           components['wind'] + components['precipitation'])
+    return components
+
+
+def weather_adjustment(temperature, wind_speed, precipitation=None, is_dome=None, weather_condition=None,
+                       profile: Dict = ALGORITHM_PROFILE, dome_points: Optional[float] = None) -> np.ndarray:
+    """Total weather points for arrays of game conditions"""
+    codes = weather_codes(temperature, wind_speed, precipitation, is_dome, weather_condition, profile)
+    return weather_points(codes, profile, dome_points)['total']
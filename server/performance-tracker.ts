@@ -152,7 +152,7 @@ export class PerformanceTracker {
       const rickPicks = await db
         .select()
         .from(ricksPicks)
-        .where(eq(ricksPicks.gameId, game.id));
+        .where(and(eq(ricksPicks.gameId, game.id), eq(ricksPicks.source, 'rick')));
 
       if (rickPicks.length > 0) {
         const pick = rickPicks[0];
@@ -324,7 +324,20 @@ export class PostgresStorage implements IStorage {
 
   async createPrediction(prediction: InsertPrediction): Promise<Prediction> {
     const cleanPrediction = cleanPredictionData(prediction);
-    const result = await db.insert(predictions).values(cleanPrediction).returning();
+    // One prediction per game: a newer prediction replaces the stored one
+    const result = await db.insert(predictions)
+      .values(cleanPrediction)
+      .onConflictDoUpdate({
+        target: predictions.gameId,
+        set: {
+          predictedWinnerId: cleanPrediction.predictedWinnerId,
+          confidence: cleanPrediction.confidence,
+          predictedSpread: cleanPrediction.predictedSpread,
+          predictedTotal: cleanPrediction.predictedTotal,
+          notes: cleanPrediction.notes,
+        }
+      })
+      .returning();
     return result[0];
   }
 
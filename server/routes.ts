@@ -955,13 +955,13 @@ export async function registerRoutes(app: Express): Promise<Server> {
         confidence: prediction.confidence
       });
 
-      // Get Rick's personal picks if they exist
+      // Get Rick's personal picks if they exist (not the slate job's rows)
       let ricksPick = null;
       try {
         const [pick] = await db
           .select()
           .from(ricksPicks)
-          .where(eq(ricksPicks.gameId, gameId))
+          .where(and(eq(ricksPicks.gameId, gameId), eq(ricksPicks.source, 'rick')))
           .limit(1);
         ricksPick = pick || null;
       } catch (error) {
@@ -3487,6 +3487,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
                 personalNotes,
                 keyFactors,
                 expectedValue,
+                source: 'rick', // Rick's edit takes over a slate job row
                 updatedAt: new Date()
               })
               .where(eq(ricksPicks.gameId, gameId))
@@ -3540,7 +3541,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
             .where(
               and(
                 eq(ricksPicks.week, week),
-                eq(ricksPicks.season, parseInt(season as string))
+                eq(ricksPicks.season, parseInt(season as string)),
+                eq(ricksPicks.source, 'rick')
               )
             )
             .orderBy(ricksPicks.updatedAt);
@@ -316,7 +316,10 @@ export class MemStorage implements IStorage {
   }
 
   async createPrediction(insertPrediction: InsertPrediction): Promise<Prediction> {
-    const id = this.predictionCurrentId++;
+    // One prediction per game, as in the database
+    const existing = Array.from(this.predictions.values())
+      .find(prediction => prediction.gameId === insertPrediction.gameId);
+    const id = existing ? existing.id : this.predictionCurrentId++;
     const prediction: Prediction = { ...insertPrediction, id };
     this.predictions.set(id, prediction);
     return prediction;
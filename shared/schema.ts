@@ -1,4 +1,4 @@
-import { pgTable, text, varchar, serial, integer, boolean, timestamp, real } from "drizzle-orm/pg-core";
+import { pgTable, text, varchar, serial, integer, boolean, timestamp, real, uniqueIndex } from "drizzle-orm/pg-core";
 import { relations } from "drizzle-orm";
 import { createInsertSchema } from "drizzle-zod";
 import { z } from "zod";
@@ -130,7 +130,10 @@ export const predictions = pgTable("predictions", {
   predictedSpread: real("predicted_spread"),
   predictedTotal: real("predicted_total"),
   notes: text("notes"),
-});
+}, (table) => [
+  // One prediction per game; the Python slate job upserts on it
+  uniqueIndex("predictions_game_id_key").on(table.gameId),
+]);
 
 export const sentimentAnalysis = pgTable("sentiment_analysis", {
   id: serial("id").primaryKey(),
@@ -425,12 +428,16 @@ export const ricksPicks = pgTable("ricks_picks", {
   keyFactors: text("key_factors").array().default([]), // ["Weather advantage", "Revenge game", etc.]
 
   // Pick metadata
+  source: varchar("source", { length: 20 }).notNull().default("rick"), // "rick" (admin) or "slate_job" (bulk slate job)
   isLocked: boolean("is_locked").default(false), // Can't edit after game starts
   expectedValue: real("expected_value").default(0), // Rick's expected betting value
 
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
-});
+}, (table) => [
+  // One pick per game; the Python slate job upserts its own rows on it
+  uniqueIndex("ricks_picks_game_id_key").on(table.gameId),
+]);
 
 // Admin users for Rick's access
 export const adminUsers = pgTable("admin_users", {
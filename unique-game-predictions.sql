@@ -0,0 +1,53 @@
+-- One Prediction and One Rick's Pick per Game
+-- Run once against each database before deploying the slate job or the
+-- schema with predictions_game_id_key / ricks_picks_game_id_key:
+--     psql "$DATABASE_URL" -f unique-game-predictions.sql
+-- The unique indexes cannot be created while duplicate game_id rows exist,
+-- so duplicates are removed first. Safe to re-run.
+
+BEGIN;
+
+-- First, check for duplicates
+SELECT 'predictions' AS table_name, game_id, COUNT(*) AS duplicate_count
+FROM predictions
+GROUP BY game_id
+HAVING COUNT(*) > 1
+UNION ALL
+SELECT 'ricks_picks', game_id, COUNT(*)
+FROM ricks_picks
+GROUP BY game_id
+HAVING COUNT(*) > 1
+ORDER BY duplicate_count DESC;
+
+-- Predictions: keep the most recent row for each game
+DELETE FROM predictions p
+USING (
+    SELECT id, ROW_NUMBER() OVER (PARTITION BY game_id ORDER BY id DESC) AS position
+    FROM predictions
+) ranked
+WHERE p.id = ranked.id
+  AND ranked.position > 1;
+
+-- Rick's picks: keep the locked pick, then the most recently edited one
+DELETE FROM ricks_picks rp
+USING (
+    SELECT id, ROW_NUMBER() OVER (
+        PARTITION BY game_id
+        ORDER BY
+            CASE WHEN is_locked THEN 0 ELSE 1 END,  -- Prefer picks locked at kickoff
+            updated_at DESC NULLS LAST,             -- Then the latest edit
+            id DESC                                 -- If tied, prefer newer record
+    ) AS position
+    FROM ricks_picks
+) ranked
+WHERE rp.id = ranked.id
+  AND ranked.position > 1;
+
+-- Who wrote each pick: Rick through the admin page, or the slate job
+ALTER TABLE ricks_picks ADD COLUMN IF NOT EXISTS source varchar(20) NOT NULL DEFAULT 'rick';
+
+-- Merge keys for the Node upsert and the slate job's ON CONFLICT (game_id)
+CREATE UNIQUE INDEX IF NOT EXISTS predictions_game_id_key ON predictions (game_id);
+CREATE UNIQUE INDEX IF NOT EXISTS ricks_picks_game_id_key ON ricks_picks (game_id);
+
+COMMIT;